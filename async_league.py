@@ -0,0 +1,116 @@
+import asyncio
+from league import League, simulate_replicate, aggregate_replicates
+from utils.league_state import capture_state
+
+class AsyncLeague:
+    """asyncio front end for a headless League.
+
+    CPU work runs in an executor (the loop's default thread pool unless one
+    is given), one week at a time, with control yielded to the event loop
+    between weeks. Each league serializes its own simulation with a lock, so
+    many leagues can run concurrently in one loop.
+
+    Progress is published as tuples to every consumer of events():
+
+        ("week", league_id, week_number, week_result)
+        ("season_finished", league_id, weeks_simulated)
+        ("replicate", league_id, completed, total)
+        ("monte_carlo_finished", league_id, results)
+        ("closed", league_id)
+    """
+
+    def __init__(self, league=None, league_id=None, executor=None, **league_kwargs):
+        self.league = league or League(**league_kwargs)
+        self.league_id = league_id if league_id is not None else id(self)
+        self.executor = executor
+        self._lock = asyncio.Lock()
+        self._subscribers = set()
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    async def new_season(self):
+        async with self._lock:
+            await self._run(self.league.new_season)
+
+    async def simulate_week(self):
+        """Simulate the next week in the executor and return its WeekResult"""
+        async with self._lock:
+            week_result = await self._run(self.league.simulate_week)
+        self._publish(("week", self.league_id, self.league.current_week, week_result))
+        return week_result
+
+    async def simulate_season(self, progress_callback=None, max_weeks=50):
+        """Simulate the rest of the season week by week. Returns the number of weeks"""
+        week_count = 0
+        while not self.league.season_complete and week_count < max_weeks:
+            old_week = self.league.current_week
+            week_result = await self.simulate_week()
+            week_count += 1
+            if progress_callback is not None:
+                progress_callback(self.league.current_week, week_result)
+            if self.league.current_week == old_week:
+                break
+            # Let other leagues and tasks run between weeks
+            await asyncio.sleep(0)
+
+        self._publish(("season_finished", self.league_id, week_count))
+        return week_count
+
+    async def run_monte_carlo(self, replicates, seed=None, executor=None, progress_callback=None):
+        """Simulate the rest of the season `replicates` times from the current state.
+
+        Pass a ProcessPoolExecutor as `executor` to spread replicates over CPU
+        cores; otherwise the league's executor is used.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            state = capture_state(self.league)
+
+        base_seed = seed if seed is not None else self.league.rng.randrange(2 ** 32)
+        futures = [
+            loop.run_in_executor(executor or self.executor, simulate_replicate,
+                                 self.league.config, state, base_seed + i)
+            for i in range(replicates)
+        ]
+
+        summaries = []
+        for future in asyncio.as_completed(futures):
+            summaries.append(await future)
+            self._publish(("replicate", self.league_id, len(summaries), replicates))
+            if progress_callback is not None:
+                progress_callback(len(summaries), replicates)
+
+        results = aggregate_replicates(summaries)
+        self._publish(("monte_carlo_finished", self.league_id, results))
+        return results
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    # ------------------------------------------------------------------
+    # Progress events
+    # ------------------------------------------------------------------
+
+    async def events(self):
+        """Async iterator over progress events until close() is called"""
+        queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while True:
+                event = await queue.get()
+                yield event
+                if event[0] == "closed":
+                    return
+        finally:
+            self._subscribers.discard(queue)
+
+    def close(self):
+        """End all events() iterators"""
+        self._publish(("closed", self.league_id))
+
+    def _publish(self, event):
+        for queue in self._subscribers:
+            queue.put_nowait(event)
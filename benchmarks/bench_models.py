@@ -0,0 +1,77 @@
+"""Memory and attribute-access benchmarks for the Player/Team models.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_models [player_count]
+
+Compares the slotted, StatStore-backed Player with a plain __dict__ object
+carrying the same attributes (the layout Player used to have).
+"""
+import sys
+import timeit
+import tracemalloc
+from models.player import Player
+from models.team import Team
+from models.stat_store import StatStore
+from utils.league_state import PLAYER_STAT_FIELDS
+
+POSITIONS = ('Attack', 'Midfield', 'Defense', 'Goalie')
+
+class DictPlayer:
+    """Reference: every rating and counter as an instance attribute"""
+
+    def __init__(self, name, position, shooting, passing, defense, stamina):
+        self.name = name
+        self.position = position
+        self.shooting = shooting
+        self.passing = passing
+        self.defense = defense
+        self.stamina = stamina
+        for field in PLAYER_STAT_FIELDS:
+            setattr(self, field, 0)
+
+def _make(factory, count):
+    return [factory(f"Player {i}", POSITIONS[i % 4], 60 + i % 30, 55 + i % 40, 50 + i % 45, 65 + i % 30)
+            for i in range(count)]
+
+def measure_memory(factory, count):
+    """Bytes allocated per player while building `count` of them"""
+    tracemalloc.start()
+    players = _make(factory, count)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del players
+    return used / count
+
+def measure_access(player, number=1000000):
+    """Nanoseconds per rating read, stat read, stat increment and hasattr check"""
+    results = {}
+    for label, statement in (("rating read", "player.shooting"),
+                             ("stat read", "player.goals"),
+                             ("stat increment", "player.goals += 1"),
+                             ("hasattr", "hasattr(player, 'playoff_goals')")):
+        seconds = min(timeit.repeat(statement, globals={'player': player}, number=number, repeat=3))
+        results[label] = seconds / number * 1e9
+    return results
+
+def main(count=200000):
+    store = StatStore()
+    print(f"{count} players")
+    print(f"{'':<16}{'bytes/player':>14}")
+    for label, factory in (("dict", DictPlayer),
+                           ("slotted", lambda *args: Player(*args, stat_store=store))):
+        print(f"{label:<16}{measure_memory(factory, count):>14.0f}")
+
+    print()
+    dict_access = measure_access(DictPlayer("A", "Attack", 70, 70, 70, 70))
+    slotted_access = measure_access(Player("A", "Attack", 70, 70, 70, 70, stat_store=store))
+    print(f"{'ns/access':<16}{'dict':>10}{'slotted':>10}")
+    for label in dict_access:
+        print(f"{label:<16}{dict_access[label]:>10.1f}{slotted_access[label]:>10.1f}")
+
+    team = Team("Bench", _make(Player, 25))
+    seconds = min(timeit.repeat("team.points", globals={'team': team}, number=1000000, repeat=3))
+    print(f"\nTeam.points: {seconds * 1000:.1f} ns")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
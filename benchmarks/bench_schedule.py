@@ -0,0 +1,62 @@
+"""Success rate and generation time of the season schedulers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_schedule [trials] [weeks]
+
+Each trial reseeds `random` and schedules the standard 96-game season with
+both the greedy scheduler (schedule_games_efficiently) and the exact
+backtracking one (schedule_games_exact). A trial succeeds when every game
+is placed, no team plays twice in a week and no week has more than 8 games.
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+from config.league_config import LeagueConfig
+from models.schedule import build_season_matchups, schedule_games_efficiently, schedule_games_exact
+
+MAX_GAMES_PER_WEEK = 8
+
+def is_valid(result, matchups, weeks_count):
+    if result is None:
+        return False
+    weeks, _, failed_games = result
+    if failed_games or len(weeks) != weeks_count:
+        return False
+    if sorted(game for week in weeks for game in week) != sorted(matchups):
+        return False
+    for week in weeks:
+        teams = [team for game in week for team in game]
+        if len(week) > MAX_GAMES_PER_WEEK or len(teams) != len(set(teams)):
+            return False
+    return True
+
+def run(scheduler, matchups, team_names, weeks_count, trials):
+    """(success rate, per-trial times in ms) over `trials` seeds"""
+    successes = 0
+    times = []
+    for seed in range(trials):
+        random.seed(seed)
+        with contextlib.redirect_stdout(io.StringIO()):  # The greedy scheduler reports failures by printing
+            start = time.perf_counter()
+            result = scheduler(matchups, team_names, weeks_count)
+            times.append((time.perf_counter() - start) * 1000)
+        successes += is_valid(result, matchups, weeks_count)
+    return successes / trials, sorted(times)
+
+def main(trials=500, weeks_count=14):
+    team_names = LeagueConfig().teams_names
+    matchups = build_season_matchups(team_names)
+    print(f"{len(matchups)} games, {len(team_names)} teams, {weeks_count} weeks, {trials} trials")
+    print(f"{'scheduler':<10}{'success':>10}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for label, scheduler in (("greedy", schedule_games_efficiently), ("exact", schedule_games_exact)):
+        rate, times = run(scheduler, matchups, team_names, weeks_count, trials)
+        mean = sum(times) / len(times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        print(f"{label:<10}{rate:>10.1%}{mean:>10.2f}{p95:>10.2f}{times[-1]:>10.2f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 14)
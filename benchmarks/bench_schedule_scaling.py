@@ -0,0 +1,67 @@
+"""Generation time of the config-driven scheduler as leagues grow.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_schedule_scaling [trials] [games_per_team] [weeks]
+
+Each layout is a synthetic LeagueConfig of N conferences x N divisions x N
+teams, scheduled with build_config_schedule. A trial succeeds when every
+team plays games_per_team games and no team plays twice in a week.
+"""
+import random
+import sys
+import time
+from collections import Counter
+from config.league_config import LeagueConfig
+from models.schedule import build_config_schedule
+
+# (conferences, divisions per conference, teams per division)
+LAYOUTS = ((2, 2, 4), (2, 4, 4), (2, 3, 5), (4, 4, 4), (4, 4, 8), (8, 4, 8))
+
+def synthetic_config(conference_count, division_count, division_size):
+    config = LeagueConfig()
+    config.conferences = {
+        f"Conference {c}": {f"Division {d}": [f"Team {c}-{d}-{t}" for t in range(division_size)]
+                            for d in range(division_count)}
+        for c in range(conference_count)
+    }
+    config.teams_names = [team for divisions in config.conferences.values()
+                          for division_teams in divisions.values() for team in division_teams]
+    return config
+
+def is_valid(schedule, team_names, games_per_team):
+    games = Counter()
+    weekly = Counter()
+    for game in schedule:
+        for team in (game['home_team'], game['away_team']):
+            games[team] += 1
+            weekly[(team, game['week'])] += 1
+    return all(games[team] == games_per_team for team in team_names) and max(weekly.values()) == 1
+
+def main(trials=20, games_per_team=12, weeks_count=14):
+    print(f"{games_per_team} games per team, {weeks_count} weeks, {trials} trials")
+    print(f"{'layout':<10}{'teams':>7}{'games':>7}{'success':>10}{'mean ms':>10}{'max ms':>10}")
+    for layout in LAYOUTS:
+        config = synthetic_config(*layout)
+        successes = 0
+        games = 0
+        times = []
+        for seed in range(trials):
+            random.seed(seed)
+            start = time.perf_counter()
+            try:
+                schedule = build_config_schedule(config, games_per_team, weeks_count)
+            except ValueError:
+                schedule = None
+            times.append((time.perf_counter() - start) * 1000)
+            if schedule is not None:
+                games = len(schedule)
+                successes += is_valid(schedule, config.teams_names, games_per_team)
+        label = "x".join(str(size) for size in layout)
+        print(f"{label:<10}{len(config.teams_names):>7}{games:>7}{successes / trials:>10.1%}"
+              f"{sum(times) / len(times):>10.2f}{max(times):>10.2f}")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 12,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 14)
@@ -31,6 +31,7 @@ class LeagueConfig:
         self.playoff_prep_week = 15  # NEW: Transition week
         self.playoff_weeks = 3
         self.total_season_weeks = 18  # 14 regular + 1 prep + 3 playoff
+        self.games_per_team = 12  # Regular season games; the other weeks are byes
 
     def get_team_conference(self, team_name):
         """Get the conference for a team"""
@@ -1,7 +1,20 @@
+import gzip
 import json
 import os
 from datetime import datetime
-from tkinter import messagebox, filedialog
+from itertools import chain
+from tkinter import messagebox, filedialog, simpledialog
+from utils.binary_save import (BinarySaveReader, write_binary_save, EXTENSION as BINARY_EXTENSION,
+                               FORMAT_VERSION as BINARY_FORMAT_VERSION)
+from utils.save_journal import SaveJournal
+from utils.autosaver import BackgroundAutosaver
+from utils.league_state import (capture_state, restore_state, player_dict, player_row, save_data_from_state,
+                                baseline_standings, SCHEMA_VERSION, PLAYER_STAT_FIELDS, TEAM_RECORD_FIELDS,
+                                GOALIE_FIELDS)
+from utils import json_stream
+from utils.save_index import SaveIndex, summarize_league
+from utils import chunk_store
+from utils import stats_exporter
 
 class DataManager:
     """Handles saving and loading league data"""
@@ -9,7 +22,16 @@ class DataManager:
     def __init__(self, main_gui):
         self.main_gui = main_gui
         self.save_directory = "saves"
+        self.journal = None
         self.ensure_save_directory()
+        self.save_index = SaveIndex(self.save_directory)
+        self._chunk_store = None
+        self.autosaver = BackgroundAutosaver(
+            os.path.join(self.save_directory, "auto_save.json.gz"),
+            self._capture_autosave, self._serialize_autosave
+        )
+        self._autosave_poll_scheduled = False
+        self.last_autosave = None
 
     def ensure_save_directory(self):
         """Create saves directory if it doesn't exist"""
@@ -17,30 +39,11 @@ class DataManager:
             os.makedirs(self.save_directory)
 
     def player_to_dict(self, player):
-        """Convert player object to dictionary for saving"""
-        data = {
-            'name': player.name,
-            'position': player.position,
-            'shooting': player.shooting,
-            'passing': player.passing,
-            'defense': player.defense,
-            'stamina': player.stamina,
-            'goals': player.goals,
-            'assists': player.assists,
-            'saves': player.saves,
-            'player_of_match': player.player_of_match,
-            'games_played': player.games_played,
-        }
-
-        # Add goalie-specific stats
-        if player.position == "Goalie":
-            data['goals_against'] = getattr(player, 'goals_against', 0)
-            data['minutes_played'] = getattr(player, 'minutes_played', 0)
+        """Convert player object to dictionary for saving (every regular, playoff and match stat)"""
+        return player_dict(player)
 
-        return data
-
-    def dict_to_player(self, data):
-        """Create player object from dictionary data"""
+    def dict_to_player(self, data, stat_store=None):
+        """Create player object from dictionary data; stats missing from older saves start at zero"""
         from models.player import Player
 
         player = Player(
@@ -49,20 +52,15 @@ class DataManager:
             data['shooting'],
             data['passing'],
             data['defense'],
-            data['stamina']
+            data['stamina'],
+            stat_store
         )
 
-        # Load stats
-        player.goals = data.get('goals', 0)
-        player.assists = data.get('assists', 0)
-        player.saves = data.get('saves', 0)
-        player.player_of_match = data.get('player_of_match', 0)
-        player.games_played = data.get('games_played', 0)
-
-        # Load goalie-specific stats
-        if player.position == "Goalie":
-            player.goals_against = data.get('goals_against', 0)
-            player.minutes_played = data.get('minutes_played', 0)
+        for field in PLAYER_STAT_FIELDS:
+            if field in data:
+                setattr(player, field, data[field])
+            elif field in GOALIE_FIELDS and player.position == "Goalie":
+                setattr(player, field, 0)
 
         return player
 
@@ -81,17 +79,19 @@ class DataManager:
     def dict_to_team(self, data):
         """Create team object from dictionary data"""
         from models.team import Team
+        from models.stat_store import StatStore
 
-        # Create players first
-        players = [self.dict_to_player(player_data) for player_data in data['players']]
+        # Create players first, in a store of their own rather than the shared default one
+        stat_store = StatStore()
+        players = [self.dict_to_player(player_data, stat_store) for player_data in data['players']]
 
         # Create team
         team = Team(data['name'], players)
-        team.wins = data.get('wins', 0)
-        team.losses = data.get('losses', 0)
-        team.overtime_losses = data.get('overtime_losses', 0)
-        team.goals_for = data.get('goals_for', 0)
-        team.goals_against = data.get('goals_against', 0)
+        team.record.update(wins=data.get('wins', 0),
+                           losses=data.get('losses', 0),
+                           overtime_losses=data.get('overtime_losses', 0),
+                           goals_for=data.get('goals_for', 0),
+                           goals_against=data.get('goals_against', 0))
 
         return team
 
@@ -105,25 +105,11 @@ class DataManager:
 
             filepath = os.path.join(self.save_directory, filename)
 
-            save_data = {
-                'metadata': {
-                    'save_date': datetime.now().isoformat(),
-                    'version': '1.0'
-                },
-                'league_info': {
-                    'teams_names': self.main_gui.teams_names,
-                    'divisions': self.main_gui.divisions,
-                    'current_week': getattr(self.main_gui, 'current_week', 0),
-                    'season_complete': getattr(self.main_gui, 'season_complete', False)
-                },
-                'teams': [self.team_to_dict(team) for team in self.main_gui.teams],
-                'standings': getattr(self.main_gui, 'standings', {}),
-                'schedule': getattr(self.main_gui, 'schedule', []),
-                'playoff_schedule': getattr(self.main_gui, 'playoff_schedule', [])
-            }
+            save_data = save_data_from_state(capture_state(self.main_gui), getattr(self.main_gui, 'standings', {}))
 
             with open(filepath, 'w') as f:
                 json.dump(save_data, f, indent=2)
+            self._index_save(filepath, save_data['metadata']['version'])
 
             messagebox.showinfo("Save Successful", f"League data saved to {filename}")
             return filepath
@@ -140,30 +126,26 @@ class DataManager:
                 filepath = filedialog.askopenfilename(
                     title="Load League Data",
                     initialdir=self.save_directory,
-                    filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+                    filetypes=[("JSON files", "*.json"), ("Compressed JSON files", "*.json.gz"),
+                               ("Compact league saves", f"*{BINARY_EXTENSION}"),
+                               ("Save slots", f"*{chunk_store.MANIFEST_EXTENSION}"), ("All files", "*.*")]
                 )
 
                 if not filepath:
                     return False  # User cancelled
 
-            with open(filepath, 'r') as f:
-                save_data = json.load(f)
-
-            # Load league info
-            league_info = save_data.get('league_info', {})
-            self.main_gui.teams_names = league_info.get('teams_names', [])
-            self.main_gui.divisions = league_info.get('divisions', {})
-            self.main_gui.current_week = league_info.get('current_week', 0)
-            self.main_gui.season_complete = league_info.get('season_complete', False)
+            if filepath.endswith(BINARY_EXTENSION):
+                return self.load_league_binary(filepath)
+            if filepath.endswith(chunk_store.MANIFEST_EXTENSION):
+                return self.load_league_chunked(filepath)
 
-            # Load teams
-            teams_data = save_data.get('teams', [])
-            self.main_gui.teams = [self.dict_to_team(team_data) for team_data in teams_data]
+            opener = gzip.open if filepath.endswith('.gz') else open
+            with opener(filepath, 'rt') as f:
+                save_data = json.load(f)
 
-            # Load other data
-            self.main_gui.standings = save_data.get('standings', {})
-            self.main_gui.schedule = save_data.get('schedule', [])
-            self.main_gui.playoff_schedule = save_data.get('playoff_schedule', [])
+            # Older save versions are migrated on the way in
+            restore_state(self.main_gui, save_data)
+            self.main_gui.game_simulator.resume_store_season(os.path.basename(filepath))
 
             # Update GUI displays
             self.refresh_gui_displays()
@@ -175,6 +157,413 @@ class DataManager:
             messagebox.showerror("Load Error", f"Failed to load league data: {str(e)}")
             return False
 
+    def export_league_stream(self, filepath=None, season=1, append=False):
+        """Write the league as NDJSON records (.json.gz/.zst compress it).
+
+        Records are written one at a time - season info, then each team
+        followed by its players, then the games - so nothing larger than one
+        record is built in memory. With append=True the season is added to an
+        existing archive.
+        """
+        try:
+            if filepath is None:
+                filepath = filedialog.asksaveasfilename(
+                    title="Export League Stream",
+                    initialdir=self.save_directory,
+                    defaultextension=".ndjson.gz",
+                    filetypes=[("Compressed NDJSON", "*.ndjson.gz"), ("Zstandard NDJSON", "*.ndjson.zst"),
+                               ("NDJSON", "*.ndjson"), ("All files", "*.*")]
+                )
+                if not filepath:
+                    return None  # User cancelled
+
+            write_header = not (append and os.path.exists(filepath))
+            with json_stream.open_stream(filepath, 'at' if append else 'wt') as stream:
+                if write_header:
+                    json_stream.write_record(stream, json_stream.header_record())
+                self._write_season_records(stream, season)
+
+            if hasattr(self.main_gui, 'root'):
+                messagebox.showinfo("Export Successful", f"League exported to {os.path.basename(filepath)}")
+            return filepath
+
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export league: {str(e)}")
+            return None
+
+    def _write_season_records(self, stream, season):
+        write = json_stream.write_record
+        engine = self.main_gui.game_simulator.standings_engine
+        write(stream, {
+            'type': 'season',
+            'season': season,
+            'save_date': datetime.now().isoformat(),
+            'league_info': {
+                'teams_names': self.main_gui.teams_names,
+                'divisions': self.main_gui.divisions,
+                'league_id': getattr(self.main_gui, 'league_id', None),
+                'season_key': getattr(self.main_gui, 'season_key', None),
+                'current_week': getattr(self.main_gui, 'current_week', 0),
+                'season_complete': getattr(self.main_gui, 'season_complete', False)
+            },
+            'standings': getattr(self.main_gui, 'standings', {}),
+            'standings_state': {
+                'baseline': engine.baseline,
+                'events': [dict(event) for event in engine.events]
+            }
+        })
+
+        for team in self.main_gui.teams:
+            write(stream, {
+                'type': 'team',
+                'season': season,
+                'name': team.name,
+                **{field: getattr(team, field, 0) for field in TEAM_RECORD_FIELDS}
+            })
+            for player in team.players:
+                record = {'type': 'player', 'season': season, 'team': team.name}
+                record.update(self.player_to_dict(player))
+                write(stream, record)
+
+        for phase, games in (('regular', getattr(self.main_gui, 'schedule', [])),
+                             ('playoff', getattr(self.main_gui, 'playoff_schedule', []))):
+            for game in games:
+                write(stream, {'type': 'game', 'season': season, 'phase': phase, **game})
+
+        write(stream, {'type': 'end_season', 'season': season})
+
+    def iter_stream_seasons(self, filepath, wanted=None):
+        """Yield (season, state) for each season in an NDJSON export or archive.
+
+        Each state is a capture_state() dict built as the records arrive, so
+        only one season is held at a time, as plain rows rather than Team and
+        Player objects. Seasons not in `wanted` (a set of season numbers, or
+        None for all) are skipped without building anything.
+        """
+        current = None
+        with json_stream.open_stream(filepath, 'rt') as stream:
+            for record in json_stream.read_records(stream):
+                kind = record.get('type')
+
+                if kind == 'header':
+                    if record.get('format') != json_stream.FORMAT_NAME:
+                        raise ValueError(f"{os.path.basename(filepath)} is not a league stream export")
+                    if record.get('version', 0) > json_stream.FORMAT_VERSION:
+                        raise ValueError(f"Stream version {record['version']} is newer than supported")
+                    continue
+
+                if kind == 'season':
+                    if wanted is not None and record['season'] not in wanted:
+                        current = None
+                        continue
+                    league_info = record.get('league_info', {})
+                    season = record['season']
+                    current = {
+                        'schema_version': SCHEMA_VERSION,
+                        'league_info': {
+                            'teams_names': league_info.get('teams_names', []),
+                            'divisions': league_info.get('divisions', {}),
+                            'league_id': league_info.get('league_id'),
+                            'season_key': league_info.get('season_key')
+                        },
+                        'current_week': league_info.get('current_week', 0),
+                        'season_complete': league_info.get('season_complete', False),
+                        'teams': [],
+                        'schedule': [],
+                        'playoff_schedule': [],
+                        'standings': record.get('standings_state'),
+                        'rng_state': None
+                    }
+                    teams_by_name = {}
+                    continue
+
+                if current is None:
+                    continue
+
+                if kind == 'team':
+                    team = {
+                        'name': record['name'],
+                        'record': [record.get(field, 0) for field in TEAM_RECORD_FIELDS],
+                        'players': []
+                    }
+                    teams_by_name[team['name']] = team
+                    current['teams'].append(team)
+                elif kind == 'player':
+                    teams_by_name[record['team']]['players'].append(player_row(record))
+                elif kind == 'game':
+                    game = {key: value for key, value in record.items() if key not in ('type', 'season', 'phase')}
+                    key = 'playoff_schedule' if record.get('phase') == 'playoff' else 'schedule'
+                    current[key].append(game)
+                elif kind == 'end_season':
+                    if current['standings'] is None:
+                        # Streams written before standings_state: the team records become the baseline
+                        current['standings'] = baseline_standings(current['teams'])
+                    yield season, current
+                    current = None
+
+    def import_league_stream(self, filepath=None, season=None):
+        """Load one season (the last one if None) from an NDJSON export or archive"""
+        try:
+            if filepath is None:
+                filepath = filedialog.askopenfilename(
+                    title="Import League Stream",
+                    initialdir=self.save_directory,
+                    filetypes=[("League streams", "*.ndjson *.ndjson.gz *.ndjson.zst"), ("All files", "*.*")]
+                )
+                if not filepath:
+                    return False  # User cancelled
+
+            loaded = None
+            wanted = None if season is None else {season}
+            for _, state in self.iter_stream_seasons(filepath, wanted):
+                loaded = state  # Earlier seasons are dropped as later ones arrive
+
+            if loaded is None:
+                messagebox.showerror("Import Error", f"No season {season} in {os.path.basename(filepath)}")
+                return False
+
+            # Through restore_state like every other load, so week results and standings events reset too
+            restore_state(self.main_gui, loaded)
+            self.main_gui.game_simulator.resume_store_season(os.path.basename(filepath))
+
+            self.refresh_gui_displays()
+            return True
+
+        except Exception as e:
+            messagebox.showerror("Import Error", f"Failed to import league stream: {str(e)}")
+            return False
+
+    def export_player_stats(self, filepath=None, all_seasons=False):
+        """Export season stat lines (.csv, or .lxc columnar) plus a per-game file beside it.
+
+        With a league store attached the rows come straight from its tables,
+        every recorded season if all_seasons is set; otherwise the current
+        season is read from the rosters and the games from the box scores of
+        the weeks simulated since it was loaded (captured when the season
+        simulator's capture_box_scores is set, as in the GUI).
+        """
+        try:
+            if filepath is None:
+                filepath = filedialog.asksaveasfilename(
+                    title="Export Player Stats",
+                    initialdir=self.save_directory,
+                    defaultextension=".csv",
+                    filetypes=[("CSV", "*.csv"), ("Columnar stats", f"*{stats_exporter.COLUMNAR_EXTENSION}"),
+                               ("All files", "*.*")]
+                )
+                if not filepath:
+                    return None  # User cancelled
+
+            store = getattr(self.main_gui, 'league_store', None)
+            if store is not None and store.season_id is not None:
+                # Every season of this league, not every league the store has recorded
+                season_ids = store.league_season_ids() if all_seasons else [store.season_id]
+                rows = stats_exporter.export_rows(filepath, stats_exporter.SEASON_COLUMNS, chain.from_iterable(
+                    store.iter_season_rows(season_id) for season_id in season_ids))
+                base, extension = os.path.splitext(filepath)
+                stats_exporter.export_rows(f"{base}_games{extension}", stats_exporter.GAME_COLUMNS, chain.from_iterable(
+                    store.iter_game_rows(season_id) for season_id in season_ids))
+            else:
+                rows = stats_exporter.export_rows(filepath, stats_exporter.SEASON_COLUMNS,
+                                                  stats_exporter.season_rows(self.main_gui.teams))
+                week_results = self.main_gui.game_simulator.season_simulator.week_results
+                base, extension = os.path.splitext(filepath)
+                stats_exporter.export_rows(f"{base}_games{extension}", stats_exporter.GAME_COLUMNS,
+                                           stats_exporter.game_rows(game for week, result in sorted(week_results.items())
+                                                                    if result for game in result.completed_games))
+
+            if hasattr(self.main_gui, 'root'):
+                messagebox.showinfo("Export Successful", f"Exported {rows} stat lines to {os.path.basename(filepath)}")
+            return filepath
+
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export player stats: {str(e)}")
+            return None
+
+    @property
+    def chunk_store(self):
+        if self._chunk_store is None:
+            self._chunk_store = chunk_store.ChunkStore(os.path.join(self.save_directory, "chunks"))
+        return self._chunk_store
+
+    def save_league_chunked(self, slot_name=None):
+        """Save a slot as a manifest of shared chunks; only chunks not already stored are written"""
+        try:
+            if slot_name is None:
+                slot_name = f"slot_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+            filepath = os.path.join(self.save_directory, f"{slot_name}{chunk_store.MANIFEST_EXTENSION}")
+            summary = summarize_league(self.main_gui, f"chunked {chunk_store.MANIFEST_VERSION}")
+            state = capture_state(self.main_gui)
+
+            written_before = self.chunk_store.written
+            manifest = chunk_store.build_manifest(self.chunk_store, state, state['league_info'], summary)
+            chunk_store.write_manifest(filepath, manifest)
+            self.save_index.record_save(filepath, summary)
+
+            new_chunks = self.chunk_store.written - written_before
+            if hasattr(self.main_gui, 'status_var'):
+                self.main_gui.status_var.set(f"Saved slot {slot_name} ({new_chunks} new chunks)")
+            return filepath
+
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Failed to save league slot: {str(e)}")
+            return None
+
+    def load_league_chunked(self, filepath):
+        """Load a slot saved by save_league_chunked"""
+        try:
+            manifest = chunk_store.read_manifest(filepath)
+            state = chunk_store.state_from_manifest(self.chunk_store, manifest)
+
+            restore_state(self.main_gui, state)
+
+            if hasattr(self.main_gui, 'game_simulator'):
+                self.main_gui.game_simulator.resume_store_season(os.path.basename(filepath))
+            self.refresh_gui_displays()
+            return True
+
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load league slot: {str(e)}")
+            return False
+
+    def collect_chunk_garbage(self):
+        """Delete chunks that no save slot references any more"""
+        try:
+            removed, freed = chunk_store.collect_garbage(self.save_directory, self.chunk_store.directory)
+            if hasattr(self.main_gui, 'root'):
+                messagebox.showinfo("Clean Up", f"Removed {removed} unused chunks ({freed / 1024:.1f} KB)")
+            return removed, freed
+
+        except Exception as e:
+            messagebox.showerror("Clean Up Error", f"Failed to clean up save storage: {str(e)}")
+            return None
+
+    def save_league_binary(self, filename=None):
+        """Save all league data to a compact binary file"""
+        try:
+            if filename is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = f"league_save_{timestamp}{BINARY_EXTENSION}"
+
+            filepath = os.path.join(self.save_directory, filename)
+            write_binary_save(filepath, self.main_gui)
+            self._index_save(filepath, f"binary {BINARY_FORMAT_VERSION}")
+
+            messagebox.showinfo("Save Successful", f"League data saved to {filename}")
+            return filepath
+
+        except Exception as e:
+            messagebox.showerror("Save Error", f"Failed to save league data: {str(e)}")
+            return None
+
+    def read_save_summary(self, filepath):
+        """Read only the metadata and standings of a binary save"""
+        reader = BinarySaveReader(filepath)
+        return reader.read_metadata(), reader.read_standings()
+
+    def load_league_binary(self, filepath):
+        """Open a binary save: the header and metadata now, the league once every section has parsed"""
+        try:
+            reader = BinarySaveReader(filepath)
+            metadata = reader.read_metadata()
+
+            self._pending_reader = reader
+            self._set_status(f"Loading {os.path.basename(filepath)} - Week {metadata.get('current_week', 0)}...")
+
+            # Rosters and schedules are parsed once the status is on screen
+            if hasattr(self.main_gui, 'root'):
+                self.main_gui.root.after_idle(self.load_pending_sections)
+                return True
+            return self.load_pending_sections()
+
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load league data: {str(e)}")
+            return False
+
+    def load_pending_sections(self):
+        """Parse a binary save opened by load_league_binary, then swap the whole league in.
+
+        Every section is read into a captured state before anything live is
+        touched, so a damaged file leaves the current league as it was.
+        """
+        reader = getattr(self, '_pending_reader', None)
+        if reader is None:
+            return False
+        self._pending_reader = None
+
+        try:
+            state = reader.read_state()
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load league data: {str(e)}")
+            self._set_status("Load failed - league unchanged")
+            return False
+
+        restore_state(self.main_gui, state)
+        self.main_gui.game_simulator.resume_store_season(os.path.basename(reader.filepath))
+        self.refresh_gui_displays()
+        return True
+
+    def enable_journal(self, name="journal", snapshot_interval=6):
+        """Journal every simulated week to saves/<name>.journal instead of rewriting a full save"""
+        try:
+            directory = os.path.join(self.save_directory, f"{name}.journal")
+            self.journal = SaveJournal(self.main_gui, directory, snapshot_interval)
+            self.journal.start()
+            self.main_gui.save_journal = self.journal
+            return self.journal
+
+        except Exception as e:
+            messagebox.showerror("Journal Error", f"Failed to start journal: {str(e)}")
+            return None
+
+    def disable_journal(self):
+        """Stop journaling weeks; the files already written stay loadable"""
+        self.journal = None
+        self.main_gui.save_journal = None
+
+    def load_journal(self, directory=None, week=None):
+        """Restore a journaled league at `week` (the latest journaled week if None)"""
+        try:
+            if directory is None:
+                directory = filedialog.askdirectory(
+                    title="Load League Journal",
+                    initialdir=self.save_directory
+                )
+                if not directory:
+                    return False  # User cancelled
+
+            journal = SaveJournal(self.main_gui, directory)
+
+            if week is None and hasattr(self.main_gui, 'root'):
+                weeks = journal.available_weeks()
+                if not weeks:
+                    messagebox.showerror("Load Error", "The journal has no saved weeks")
+                    return False
+                week = simpledialog.askinteger(
+                    "Load Journal", f"Week to load ({weeks[0]}-{weeks[-1]}):",
+                    initialvalue=weeks[-1], minvalue=weeks[0], maxvalue=weeks[-1],
+                    parent=self.main_gui.root
+                )
+                if week is None:
+                    return False  # User cancelled
+            restored_week = journal.replay(week)
+            if restored_week is None:
+                messagebox.showerror("Load Error", f"No journaled state for week {week}")
+                return False
+
+            # Keep journaling onto the restored timeline
+            self.journal = journal
+            self.main_gui.save_journal = journal
+            if hasattr(self.main_gui, 'game_simulator'):
+                self.main_gui.game_simulator.resume_store_season(os.path.basename(directory))
+            self.refresh_gui_displays()
+            return True
+
+        except Exception as e:
+            messagebox.showerror("Load Error", f"Failed to load league journal: {str(e)}")
+            return False
+
     def refresh_gui_displays(self):
         """Refresh all GUI displays after loading data"""
         # Update status
@@ -206,26 +595,73 @@ class DataManager:
             self.main_gui.schedule_tab.update_display()
 
     def auto_save(self):
-        """Automatically save league data"""
-        filename = "auto_save.json"
-        return self.save_league_data(filename)
+        """Autosave in the background; progress and failures go to the status bar"""
+        try:
+            self.autosaver.request_save()
+        except Exception as e:
+            self._set_status(f"Autosave failed: {e}")
+            return None
+        self._schedule_autosave_poll()
+        return self.autosaver.path
+
+    def _capture_autosave(self):
+        """Quick plain-data copy of the league, taken on the main thread"""
+        return {
+            'state': capture_state(self.main_gui),
+            'standings': {name: dict(record) for name, record in getattr(self.main_gui, 'standings', {}).items()}
+        }
+
+    def _serialize_autosave(self, snapshot):
+        """Build the regular JSON save from a snapshot (runs on the autosave thread)"""
+        return json.dumps(self.state_to_save_data(snapshot), separators=(',', ':')).encode('utf-8')
+
+    def state_to_save_data(self, snapshot):
+        """Same structure as save_league_data, built from captured data instead of live objects"""
+        return save_data_from_state(snapshot['state'], snapshot['standings'])
+
+    def _schedule_autosave_poll(self):
+        if self._autosave_poll_scheduled or not hasattr(self.main_gui, 'root'):
+            return
+        self._autosave_poll_scheduled = True
+        self.main_gui.root.after(100, self._poll_autosave_status)
+
+    def _poll_autosave_status(self):
+        """Record autosave outcomes and report failures in the status bar; polls while a save is in flight"""
+        self._autosave_poll_scheduled = False
+        # Check before draining: once the worker is idle its last event is already queued
+        busy = self.autosaver.is_busy()
+        for event in self.autosaver.poll_status():
+            if event[0] == "saved":
+                self.last_autosave = datetime.now()
+                self.save_index.refresh_file(event[1])
+            elif event[0] == "error":
+                self._set_status(f"Autosave failed: {event[1]}")
+
+        if busy:
+            self._schedule_autosave_poll()
+
+    def _set_status(self, text):
+        if hasattr(self.main_gui, 'status_var'):
+            self.main_gui.status_var.set(text)
+
+    def _index_save(self, filepath, format_version):
+        """Record a save the app just wrote in the save-slot index"""
+        try:
+            self.save_index.record_save(filepath, summarize_league(self.main_gui, format_version))
+        except Exception as e:
+            print(f"Error updating save index: {e}")
 
     def get_save_files(self):
-        """Get list of available save files"""
+        """Get list of available save files with their index metadata (newest first)"""
         try:
             files = []
-            for filename in os.listdir(self.save_directory):
-                if filename.endswith('.json'):
-                    filepath = os.path.join(self.save_directory, filename)
-                    modified_time = os.path.getmtime(filepath)
-                    files.append({
-                        'filename': filename,
-                        'filepath': filepath,
-                        'modified': datetime.fromtimestamp(modified_time)
-                    })
-
-            # Sort by modification time (newest first)
-            files.sort(key=lambda x: x['modified'], reverse=True)
+            for entry in self.save_index.entries():
+                files.append({
+                    **entry,
+                    'filename': entry['name'],
+                    'filepath': os.path.join(self.save_directory, entry['name']),
+                    'modified': datetime.fromtimestamp(entry['mtime'])
+                })
             return files
 
         except Exception as e:
@@ -1,40 +1,110 @@
-from typing import List, Dict, Tuple
+import random
+from typing import List, Dict, Tuple, Optional
 
-def generate_schedule(teams: List[str], divisions: Dict[str, List[str]]) -> List[List[Tuple[str, str]]]:
-    matches = []
+def round_robin_rounds(teams: List[str]) -> List[List[Tuple[str, str]]]:
+    """
+    Single round robin by the circle method: len(teams) - 1 rounds for an even
+    number of teams (len(teams) for an odd number, each team sitting out once),
+    every team playing at most once per round. One team stays fixed while the
+    others rotate one place per round, hosting while in the front half of the
+    circle, so every team hosts half its games (rounded either way).
+    """
+    circle: List[Optional[str]] = list(teams)
+    if len(circle) % 2:
+        circle.append(None)  # Bye
+    size = len(circle)
+    rounds = []
+    for round_num in range(size - 1):
+        week = []
+        for i in range(size // 2):
+            first, second = circle[i], circle[size - 1 - i]
+            if first is None or second is None:
+                continue
+            # The fixed team alternates; the others host while in the front half
+            if i != 0 or round_num % 2 == 0:
+                week.append((first, second))
+            else:
+                week.append((second, first))
+        rounds.append(week)
+        circle.insert(1, circle.pop())
+    return rounds
 
-    # Divisional matches twice (home and away)
+def _balanced_hosts(games: List[Tuple[str, str]]) -> List[str]:
+    """
+    A host for each game such that every team hosts half its games (rounded
+    either way). Teams with an odd number of games are joined to a dummy team
+    so every team has an even number; walking along unused games then always
+    returns to the start, leaving each team as often as it arrives. The team
+    a walk leaves from hosts.
+    """
+    edges: List[Tuple[str, Optional[str]]] = list(games)
+    degree: Dict[str, int] = {}
+    for home, away in games:
+        degree[home] = degree.get(home, 0) + 1
+        degree[away] = degree.get(away, 0) + 1
+    edges += [(team, None) for team, count in degree.items() if count % 2]
+
+    incident: Dict[Optional[str], List[int]] = {}
+    for edge, (first, second) in enumerate(edges):
+        incident.setdefault(first, []).append(edge)
+        incident.setdefault(second, []).append(edge)
+    hosts: List[Optional[str]] = [None] * len(edges)
+    used = [False] * len(edges)
+    for start in list(incident):
+        team = start
+        while incident[team]:
+            edge = incident[team].pop()
+            if used[edge]:
+                continue
+            used[edge] = True
+            hosts[edge] = team
+            first, second = edges[edge]
+            team = second if team == first else first
+    return hosts[:len(games)]
+
+def generate_schedule(teams: List[str], divisions: Dict[str, List[str]], rng=random) -> List[List[Tuple[str, str]]]:
+    """
+    Every team plays every other team once, and division rivals a second time
+    with home and away swapped. The first meetings are a circle-method round
+    robin of the whole league, the return legs a round robin inside each
+    division, with all divisions playing in the same weeks. That takes
+    (teams - 1) + (largest division - 1) weeks when both are even, which is
+    the minimum: each team has that many games and plays at most once a week.
+    Runs in time linear in the number of matches; `rng` shuffles the pairings.
+    """
+    order = list(teams)
+    rng.shuffle(order)  # Different pairings and week order every season
+    weeks = round_robin_rounds(order)
+
+    division_of = {}
+    for division, division_teams in divisions.items():
+        for team in division_teams:
+            division_of[team] = division
+
+    # Division rivals meet again with hosts swapped, so only the single
+    # meetings decide a team's home/away balance
+    single = [(week, position) for week in weeks for position, (home, away) in enumerate(week)
+              if home not in division_of or division_of[home] != division_of.get(away)]
+    hosts = _balanced_hosts([week[position] for week, position in single])
+    for (week, position), home in zip(single, hosts):
+        if week[position][0] != home:
+            week[position] = week[position][::-1]
+
+    host = {}
+    for week in weeks:
+        for home, away in week:
+            host[(home, away)] = host[(away, home)] = home
+
+    division_weeks = []
     for division_teams in divisions.values():
-        for i, home in enumerate(division_teams):
-            for away in division_teams[i+1:]:
-                matches.append((home, away))
-                matches.append((away, home))
-
-    # Inter-division matches once
-    for i, home in enumerate(teams):
-        for away in teams[i+1:]:
-            same_division = any(home in div and away in div for div in divisions.values())
-            if not same_division:
-                matches.append((home, away))
-
-    import random
-    random.shuffle(matches)
-
-    weeks = []
-    remaining_matches = matches.copy()
-
-    while remaining_matches:
-        week_matches = []
-        teams_playing = set()
-
-        for match in remaining_matches[:]:
-            home, away = match
-            if home not in teams_playing and away not in teams_playing:
-                week_matches.append(match)
-                teams_playing.add(home)
-                teams_playing.add(away)
-                remaining_matches.remove(match)
-
-        weeks.append(week_matches)
+        for round_num, week in enumerate(round_robin_rounds(division_teams)):
+            if round_num == len(division_weeks):
+                division_weeks.append([])
+            for home, away in week:
+                first_home = host.get((home, away), away)
+                # Return leg: whoever hosted the first meeting travels
+                division_weeks[round_num].append((away, home) if first_home == home else (home, away))
 
+    weeks += division_weeks
+    rng.shuffle(weeks)
     return weeks
@@ -1,9 +1,19 @@
 import tkinter as tk
 from tkinter import messagebox, filedialog
+from gui.save_browser import SaveBrowser
 
 class MenuManager:
+    # File menu entries that read or replace the league, disabled while a
+    # background simulation owns it
+    LEAGUE_ACTIONS = (
+        "New Season", "Save League", "Save League (Compact)", "Save Slot", "Load League",
+        "Export League Stream...", "Import League Stream...", "Export Player Stats...",
+        "Start Weekly Journal", "Load Journal...", "Clean Up Save Storage", "Quick Save", "Quick Load",
+    )
+
     def __init__(self, main_gui):
         self.main_gui = main_gui
+        self.file_menu = None
 
     def setup_menu(self):
         """Create the main menu bar"""
@@ -12,17 +22,34 @@ class MenuManager:
 
         file_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="File", menu=file_menu)
+        self.file_menu = file_menu
 
         file_menu.add_command(label="New Season", command=self.new_season)
         file_menu.add_separator()
         file_menu.add_command(label="Save League", command=self.save_league)
+        file_menu.add_command(label="Save League (Compact)", command=self.save_league_binary)
+        file_menu.add_command(label="Save Slot", command=self.save_league_slot)
         file_menu.add_command(label="Load League", command=self.load_league)
+        file_menu.add_command(label="Export League Stream...", command=self.export_league_stream)
+        file_menu.add_command(label="Import League Stream...", command=self.import_league_stream)
+        file_menu.add_command(label="Export Player Stats...", command=self.export_player_stats)
+        file_menu.add_separator()
+        file_menu.add_command(label="Start Weekly Journal", command=self.start_journal)
+        file_menu.add_command(label="Load Journal...", command=self.load_journal)
+        file_menu.add_command(label="Clean Up Save Storage", command=self.collect_chunk_garbage)
         file_menu.add_separator()
         file_menu.add_command(label="Quick Save", command=self.save_game)
         file_menu.add_command(label="Quick Load", command=self.load_game)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.main_gui.root.quit)
 
+    def set_league_actions_enabled(self, enabled):
+        """Enable or disable the File menu entries that touch the league"""
+        if self.file_menu is None:
+            return
+        for label in self.LEAGUE_ACTIONS:
+            self.file_menu.entryconfig(label, state="normal" if enabled else "disabled")
+
     def new_season(self):
         """Start a new season"""
         self.main_gui.game_simulator.reset_season()
@@ -35,10 +62,68 @@ class MenuManager:
         else:
             messagebox.showerror("Error", "Data manager not initialized")
 
+    def save_league_binary(self):
+        """Save using DataManager's compact binary format"""
+        if hasattr(self.main_gui, 'data_manager'):
+            return self.main_gui.data_manager.save_league_binary()
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def save_league_slot(self):
+        """Save a deduplicated save slot"""
+        if hasattr(self.main_gui, 'data_manager'):
+            if self.main_gui.data_manager.save_league_chunked():
+                messagebox.showinfo("Save Successful", "League slot saved")
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def collect_chunk_garbage(self):
+        """Remove stored chunks no save slot uses"""
+        if hasattr(self.main_gui, 'data_manager'):
+            return self.main_gui.data_manager.collect_chunk_garbage()
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def export_league_stream(self):
+        """Export as streaming (optionally compressed) NDJSON"""
+        if hasattr(self.main_gui, 'data_manager'):
+            return self.main_gui.data_manager.export_league_stream()
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def export_player_stats(self):
+        """Export regular season, playoff and per-game stat lines"""
+        if hasattr(self.main_gui, 'data_manager'):
+            return self.main_gui.data_manager.export_player_stats()
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def import_league_stream(self):
+        """Import the last season of an NDJSON export or archive"""
+        if hasattr(self.main_gui, 'data_manager'):
+            return self.main_gui.data_manager.import_league_stream()
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def start_journal(self):
+        """Journal each simulated week instead of rewriting whole saves"""
+        if hasattr(self.main_gui, 'data_manager'):
+            if self.main_gui.data_manager.enable_journal():
+                self.main_gui.status_var.set("Weekly journal started - each week is appended to saves/journal.journal")
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
+    def load_journal(self):
+        """Load the latest week of a league journal"""
+        if hasattr(self.main_gui, 'data_manager'):
+            return self.main_gui.data_manager.load_journal()
+        else:
+            messagebox.showerror("Error", "Data manager not initialized")
+
     def load_league(self):
-        """Load using DataManager"""
+        """Pick a save from the save-slot browser"""
         if hasattr(self.main_gui, 'data_manager'):
-            return self.main_gui.data_manager.load_league_data()
+            return SaveBrowser(self.main_gui)
         else:
             messagebox.showerror("Error", "Data manager not initialized")
 
@@ -0,0 +1,95 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+class SaveBrowser:
+    """Dialog listing save slots from the save index, newest first"""
+
+    COLUMNS = ("Save", "Modified", "Size", "Week", "Status", "Leader", "Format")
+
+    def __init__(self, main_gui):
+        self.main_gui = main_gui
+        self.data_manager = main_gui.data_manager
+        self.window = tk.Toplevel(main_gui.root)
+        self.window.title("Load League")
+        self.window.geometry("900x450")
+        self.window.transient(main_gui.root)
+        self._files = {}
+        self._setup_widgets()
+        self.refresh()
+
+    def _setup_widgets(self):
+        tree_frame = ttk.Frame(self.window)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        column_widths = {"Save": 220, "Modified": 140, "Size": 70, "Week": 50,
+                         "Status": 110, "Leader": 150, "Format": 70}
+        self.tree = ttk.Treeview(tree_frame, columns=self.COLUMNS, show="headings", height=15)
+        for col in self.COLUMNS:
+            self.tree.heading(col, text=col)
+            anchor = tk.W if col in ("Save", "Leader") else tk.CENTER
+            self.tree.column(col, width=column_widths[col], anchor=anchor)
+        self.tree.bind("<Double-1>", self.load_selected)
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        button_frame = ttk.Frame(self.window)
+        button_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(button_frame, text="Load", command=self.load_selected).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.window.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Browse Files...", command=self.browse_files).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Refresh", command=self.refresh).pack(side=tk.LEFT, padx=5)
+
+    def refresh(self):
+        """Fill the list from the save index"""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self._files = {}
+
+        for save in self.data_manager.get_save_files():
+            if save.get('season_complete'):
+                status = f"Champion: {save['champion']}" if save.get('champion') else "Season complete"
+            elif save.get('week') is None:
+                status = "Unreadable"
+            else:
+                status = "In progress"
+
+            item = self.tree.insert("", tk.END, values=(
+                save['filename'],
+                save['modified'].strftime("%Y-%m-%d %H:%M"),
+                f"{save['size'] / 1024:.0f} KB",
+                save.get('week') if save.get('week') is not None else "-",
+                status,
+                save.get('leader') or "-",
+                save.get('format_version') or "-"
+            ))
+            self._files[item] = save['filepath']
+
+    def load_selected(self, event=None):
+        selection = self.tree.selection()
+        if not selection:
+            return
+        if self._simulation_running():
+            return
+        filepath = self._files.get(selection[0])
+        self.window.destroy()
+        if filepath:
+            self.data_manager.load_league_data(filepath)
+
+    def _simulation_running(self):
+        """Refuse to load while a background simulation owns the league"""
+        simulation_tab = getattr(self.main_gui, 'simulation_tab', None)
+        if simulation_tab is not None and simulation_tab.is_simulating():
+            messagebox.showinfo("Simulation Running", "Cancel or wait for the simulation before loading a league.",
+                                parent=self.window)
+            return True
+        return False
+
+    def browse_files(self):
+        """Fall back to the regular file dialog"""
+        if self._simulation_running():
+            return
+        self.window.destroy()
+        self.data_manager.load_league_data()
@@ -0,0 +1,182 @@
+import random
+from config.league_config import LeagueConfig
+from utils.game_simulation import GameSimulator
+from utils.checkpoint_manager import CheckpointManager
+from utils.sqlite_store import LeagueStore
+from utils.stats_archive import StatsArchive
+from utils.league_state import capture_state, restore_state, new_key
+
+class StatusLine:
+    """Stand-in for the Tk status variable when running without a GUI"""
+
+    def __init__(self):
+        self.value = ""
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+class League:
+    """Headless league for batch simulations.
+
+    Holds the same state and helpers the simulators expect from
+    LacrosseSimGUI, so GameSimulator and its managers run unchanged.
+    Every random draw (player ratings, schedule, matches) comes from the
+    league's own random.Random, so leagues and replicates running in threads
+    don't disturb each other. Player names still come from the shared
+    roster manager.
+    """
+
+    def __init__(self, config=None, seed=None, checkpoint_dir=None, keep_checkpoints=3, store_path=None,
+                 archive_dir=None, capture_box_scores=False):
+        self.rng = random.Random(seed)
+
+        self.config = config or LeagueConfig()
+        self.status_var = StatusLine()
+
+        self.current_week = 0
+        self.season_complete = False
+        self.league_id = new_key()
+        self.season_key = None
+        self.teams = []
+        self.schedule = []
+        self.standings = {}
+        self.playoff_teams = []
+        self.playoff_schedule = []
+        self.conference_standings = {}
+
+        # Copy config data for easy access
+        self.teams_names = self.config.teams_names
+        self.conferences = self.config.conferences
+        self.divisions = self.config.divisions
+        self.regular_season_weeks = self.config.regular_season_weeks
+        self.playoff_weeks = self.config.playoff_weeks
+        self.total_season_weeks = self.config.total_season_weeks
+
+        self.game_simulator = GameSimulator(self)
+        self.game_simulator.season_simulator.capture_box_scores = capture_box_scores
+        self.checkpoint_manager = None
+        if checkpoint_dir:
+            self.checkpoint_manager = CheckpointManager(self, checkpoint_dir, keep=keep_checkpoints)
+        self.league_store = LeagueStore(store_path) if store_path else None
+        self.stats_archive = StatsArchive(archive_dir) if archive_dir else None
+
+    def new_season(self):
+        """Create teams, schedule and standings for a fresh season"""
+        from lacrosse_names import initialize_rosters_for_teams
+        initialize_rosters_for_teams(self.teams_names)
+        self.current_week = 0
+        self.season_complete = False
+        self.playoff_schedule = []
+        self.teams = self.game_simulator.create_teams(self.teams_names)
+        self.schedule = self.game_simulator.generate_schedule()
+        self.game_simulator.initialize_standings()
+        self.game_simulator.begin_store_season()
+        if self.checkpoint_manager is not None:
+            self.checkpoint_manager.clear()
+
+    def resume_or_start(self):
+        """Resume from the newest valid checkpoint, or start a new season.
+
+        Returns the week resumed from (0 for a new season).
+        """
+        if self.checkpoint_manager is not None:
+            week = self.checkpoint_manager.resume()
+            if week is not None:
+                self.game_simulator.resume_store_season(f"Resumed at week {week}")
+                return week
+        self.new_season()
+        return 0
+
+    def simulate_week(self):
+        """Simulate the next week, returning a WeekResult"""
+        return self.game_simulator.simulate_next_week()
+
+    def render_week(self, week_result):
+        return self.game_simulator.render_week(week_result)
+
+    def simulate_season(self):
+        """Simulate the rest of the season, checkpointing each week if enabled"""
+        return self.game_simulator.simulate_entire_season()
+
+    def season_summary(self):
+        """Summarize a finished season: champion, finalists, playoff field and points"""
+        playoff_teams = []
+        finalists = []
+        champion = None
+        for game in self.playoff_schedule:
+            if game.get('week') == 16:
+                playoff_teams.extend([game['home_team'], game['away_team']])
+            elif game.get('week') == 18 and game.get('completed'):
+                finalists = [game['home_team'], game['away_team']]
+                champion = game['home_team'] if game['home_score'] > game['away_score'] else game['away_team']
+
+        engine = self.game_simulator.standings_engine
+        return {
+            'champion': champion,
+            'finalists': finalists,
+            'playoff_teams': playoff_teams,
+            'points': {name: record.points for name, record in engine.records.items()}
+        }
+
+    def run_monte_carlo(self, replicates, seed=None):
+        """Simulate the rest of the season many times from the current state"""
+        state = capture_state(self)
+        base_seed = seed if seed is not None else self.rng.randrange(2 ** 32)
+        summaries = [simulate_replicate(self.config, state, base_seed + i) for i in range(replicates)]
+        return aggregate_replicates(summaries)
+
+    # Conference/Division helper methods
+    def get_team_conference(self, team_name):
+        return self.config.get_team_conference(team_name)
+
+    def get_team_division(self, team_name):
+        return self.config.get_team_division(team_name)
+
+    def get_team_full_division(self, team_name):
+        return self.config.get_team_full_division(team_name)
+
+    def get_conference_teams(self, conference):
+        return self.config.get_conference_teams(conference)
+
+    def get_division_teams(self, conference, division):
+        return self.config.get_division_teams(conference, division)
+
+def simulate_replicate(config, state, seed):
+    """Finish one season from a captured state and return its summary.
+
+    Module-level so it can be sent to a process pool. The replicate's
+    League has its own Random seeded with `seed`, so results are the same in
+    a thread, a process or inline.
+    """
+    league = League(config, seed=seed)
+    restore_state(league, state, restore_rng=False)
+    league.simulate_season()
+    return league.season_summary()
+
+def aggregate_replicates(summaries):
+    """Turn replicate summaries into championship/playoff odds and average points"""
+    count = len(summaries)
+    championships = {}
+    playoff_appearances = {}
+    total_points = {}
+
+    for summary in summaries:
+        if summary['champion']:
+            championships[summary['champion']] = championships.get(summary['champion'], 0) + 1
+        for team_name in summary['playoff_teams']:
+            playoff_appearances[team_name] = playoff_appearances.get(team_name, 0) + 1
+        for team_name, points in summary['points'].items():
+            total_points[team_name] = total_points.get(team_name, 0) + points
+
+    if count == 0:
+        return {'replicates': 0, 'championship_odds': {}, 'playoff_odds': {}, 'average_points': {}}
+
+    return {
+        'replicates': count,
+        'championship_odds': {name: wins / count for name, wins in championships.items()},
+        'playoff_odds': {name: made / count for name, made in playoff_appearances.items()},
+        'average_points': {name: points / count for name, points in total_points.items()}
+    }
@@ -6,6 +6,9 @@ from gui.tab_manager import TabManager
 from config.league_config import LeagueConfig
 from utils.game_simulation import GameSimulator
 from data_manager import DataManager
+from utils.sqlite_store import LeagueStore
+from utils.stats_archive import StatsArchive
+from utils.league_state import new_key
 
 class LacrosseSimGUI:
     def __init__(self, root):
@@ -16,11 +19,15 @@ class LacrosseSimGUI:
         # Initialize configuration
         self.config = LeagueConfig()
         self._initialize_game_state()
+        self.league_store = self._open_league_store()
+        self.stats_archive = self._open_stats_archive()
 
         # Initialize managers
         self.menu_manager = MenuManager(self)
         self.tab_manager = TabManager(self)
         self.game_simulator = GameSimulator(self)
+        # Per-game stats exports read box scores from the week results
+        self.game_simulator.season_simulator.capture_box_scores = True
         self.data_manager = DataManager(self)
 
         # Setup UI
@@ -31,6 +38,8 @@ class LacrosseSimGUI:
         """Initialize game state variables"""
         self.current_week = 0
         self.season_complete = False
+        self.league_id = new_key()  # Loading a save replaces both with the save's own
+        self.season_key = None
         self.teams = []
         self.schedule = []
         self.standings = {}
@@ -46,6 +55,22 @@ class LacrosseSimGUI:
         self.playoff_weeks = self.config.playoff_weeks
         self.total_season_weeks = self.config.total_season_weeks
 
+    def _open_league_store(self):
+        """Open the season history database; the GUI still works without it"""
+        try:
+            return LeagueStore("league_history.db")
+        except Exception as e:
+            print(f"Error opening league history database: {e}")
+            return None
+
+    def _open_stats_archive(self):
+        """Open the archive of finished seasons; the GUI still works without it"""
+        try:
+            return StatsArchive("league_archive")
+        except Exception as e:
+            print(f"Error opening stats archive: {e}")
+            return None
+
     def _setup_ui(self):
         """Setup the main UI"""
         self.menu_manager.setup_menu()
@@ -66,6 +91,7 @@ class LacrosseSimGUI:
         self.teams = self.game_simulator.create_teams(self.teams_names)
         self.schedule = self.game_simulator.generate_schedule()
         self.game_simulator.initialize_standings()
+        self.game_simulator.begin_store_season()
         self.update_all_displays()
         self.status_var.set("Season initialized - Ready to simulate!")
 
@@ -73,6 +99,15 @@ class LacrosseSimGUI:
         """Update all tab displays"""
         self.tab_manager.update_all_displays()
 
+    def is_simulating(self):
+        """True while a background season simulation owns teams, standings and the league store.
+
+        Tabs skip their refreshes meanwhile; the simulation tab redraws them
+        all once the worker has finished.
+        """
+        simulation_tab = getattr(self, 'simulation_tab', None)
+        return simulation_tab is not None and simulation_tab.is_simulating()
+
     # Conference/Division helper methods
     def get_team_conference(self, team_name):
         return self.config.get_team_conference(team_name)
@@ -1,7 +1,10 @@
 import random
 from typing import List
 from models.player import Player
-from models.team import Team
+from models.team import Team, Roster
+from models.stat_line import GameStats
+from models.team_record import game_result
+from models.stat_store import REGULAR, PLAYOFF, GOALS, ASSISTS, SAVES, GOALS_AGAINST, MINUTES_PLAYED
 
 class MatchResult:
     def __init__(self, home_team: Team, away_team: Team, home_score: int, away_score: int,
@@ -17,22 +20,28 @@ class MatchResult:
         self.away_saves = away_saves
         self.overtime = overtime
 
-def weighted_random_player(players: List[Player], roles: List[str]) -> Player:
-    candidates = [p for p in players if p.position in roles]
-    if not candidates:
-        candidates = players[:]
-    weights = []
-    for p in candidates:
-        base_weight = p.shooting * (p.stamina / 100)
-        # Apply big penalty if goalie, e.g. multiply by 0.05 (5% chance relative to others)
-        if p.position == "Goalie":
-            base_weight *= 0.05
-        weights.append(base_weight)
+def weighted_random_player(players: List[Player], roles: List[str], rng=random) -> Player:
+    if isinstance(players, Roster):
+        # Same weights as below, cached on the roster until a rating changes
+        candidates, weights = players.pick_weights('shooting', roles)
+        if not candidates:
+            candidates, weights = players.pick_weights('shooting')
+    else:
+        candidates = [p for p in players if p.position in roles]
+        if not candidates:
+            candidates = players[:]
+        weights = []
+        for p in candidates:
+            base_weight = p.shooting * (p.stamina / 100)
+            # Apply big penalty if goalie, e.g. multiply by 0.05 (5% chance relative to others)
+            if p.position == "Goalie":
+                base_weight *= 0.05
+            weights.append(base_weight)
 
     total_weight = sum(weights)
     if total_weight == 0:
-        return random.choice(candidates)
-    rnd = random.uniform(0, total_weight)
+        return rng.choice(candidates)
+    rnd = rng.uniform(0, total_weight)
     upto = 0
     for p, w in zip(candidates, weights):
         if upto + w >= rnd:
@@ -40,20 +49,29 @@ def weighted_random_player(players: List[Player], roles: List[str]) -> Player:
         upto += w
     return candidates[-1]
 
-def weighted_random_assister(players: List[Player], exclude_player: Player) -> Player:
+def weighted_random_assister(players: List[Player], exclude_player: Player, rng=random) -> Player:
     # Allow all but exclude the shooter
-    candidates = [p for p in players if p != exclude_player]
-    weights = []
-    for p in candidates:
-        base_weight = p.passing * (p.stamina / 100)
-        if p.position == "Goalie":
-            base_weight *= 0.05  # 5% chance to assist relative to others
-        weights.append(base_weight)
+    if isinstance(players, Roster):
+        everyone, all_weights = players.pick_weights('passing')
+        candidates = []
+        weights = []
+        for p, w in zip(everyone, all_weights):
+            if p != exclude_player:
+                candidates.append(p)
+                weights.append(w)
+    else:
+        candidates = [p for p in players if p != exclude_player]
+        weights = []
+        for p in candidates:
+            base_weight = p.passing * (p.stamina / 100)
+            if p.position == "Goalie":
+                base_weight *= 0.05  # 5% chance to assist relative to others
+            weights.append(base_weight)
 
     total_weight = sum(weights)
     if total_weight == 0:
-        return random.choice(candidates)
-    rnd = random.uniform(0, total_weight)
+        return rng.choice(candidates)
+    rnd = rng.uniform(0, total_weight)
     upto = 0
     for p, w in zip(candidates, weights):
         if upto + w >= rnd:
@@ -62,24 +80,26 @@ def weighted_random_assister(players: List[Player], exclude_player: Player) -> P
     return candidates[-1]
 
 def team_shooting_accuracy(team: Team) -> float:
-    shooters = [p for p in team.players if p.position in ("Attack", "Midfield")]
-    avg_shooting = sum(p.shooting for p in shooters) / max(len(shooters), 1)
-    defenders = [p for p in team.players if p.position == "Defense"]
-    avg_defense = sum(p.defense for p in defenders) / max(len(defenders), 1)
+    avg_shooting = team.players.average('shooting', ("Attack", "Midfield"))
+    avg_defense = team.players.average('defense', ("Defense",))
     base_accuracy = 0.28
     accuracy = base_accuracy * (avg_shooting / 100) * (1.0 - avg_defense / 150)
     return max(0.15, min(accuracy, 0.40))
 
-def simulate_match(home_team: Team, away_team: Team, game_duration_minutes: int = 60, is_playoff: bool = False) -> MatchResult:
-    # Track games played and minutes for all players
-    for player in home_team.players + away_team.players:
-        player.increment_games_played(is_playoff)
-        if player.position == "Goalie":
-            player.add_minutes_played(game_duration_minutes, is_playoff)
+def simulate_match(home_team: Team, away_team: Team, game_duration_minutes: int = 60, is_playoff: bool = False,
+                   phase: int = None, rng=random) -> MatchResult:
+    # Player stats are accumulated locally and recorded into `phase` (and
+    # as everyone's match stats) in one step at the final whistle. Team
+    # records only count regular season games. `rng` is the random.Random
+    # (or the random module) every draw comes from
+    if phase is None:
+        phase = PLAYOFF if is_playoff else REGULAR
+    is_playoff = phase != REGULAR
+    game = GameStats()
 
     avg_shots = 43
-    home_shots = max(30, int(random.gauss(avg_shots, 5)))
-    away_shots = max(30, int(random.gauss(avg_shots, 5)))
+    home_shots = max(30, int(rng.gauss(avg_shots, 5)))
+    away_shots = max(30, int(rng.gauss(avg_shots, 5)))
 
     home_accuracy = team_shooting_accuracy(home_team)
     away_accuracy = team_shooting_accuracy(away_team)
@@ -87,47 +107,43 @@ def simulate_match(home_team: Team, away_team: Team, game_duration_minutes: int
     home_goals = 0
     away_goals = 0
 
-    # Reset match stats for players before the match starts
-    for player in home_team.players + away_team.players:
-        player.reset_match_stats()
-
     # Get goalies for goals against tracking
-    home_goalies = [p for p in home_team.players if p.position == "Goalie"]
-    away_goalies = [p for p in away_team.players if p.position == "Goalie"]
+    home_goalies = home_team.goalies
+    away_goalies = away_team.goalies
 
     for _ in range(home_shots):
-        if random.random() < home_accuracy:
+        if rng.random() < home_accuracy:
             home_goals += 1
-            scorer = weighted_random_player(home_team.players, ["Attack", "Midfield"])
-            scorer.add_goal(is_playoff)  # FIXED: Pass is_playoff flag
+            scorer = weighted_random_player(home_team.players, ["Attack", "Midfield"], rng)
+            game[scorer][GOALS] += 1
 
             # Add goal against to opposing goalies
             for goalie in away_goalies:
-                goalie.add_goal_against(is_playoff)  # FIXED: Pass is_playoff flag
+                game[goalie][GOALS_AGAINST] += 1
 
-            assister = weighted_random_assister(home_team.players, scorer)
+            assister = weighted_random_assister(home_team.players, scorer, rng)
             if assister:
-                assister.add_assist(is_playoff)  # FIXED: Pass is_playoff flag
+                game[assister][ASSISTS] += 1
 
     for _ in range(away_shots):
-        if random.random() < away_accuracy:
+        if rng.random() < away_accuracy:
             away_goals += 1
-            scorer = weighted_random_player(away_team.players, ["Attack", "Midfield"])
-            scorer.add_goal(is_playoff)  # FIXED: Pass is_playoff flag
+            scorer = weighted_random_player(away_team.players, ["Attack", "Midfield"], rng)
+            game[scorer][GOALS] += 1
 
             # Add goal against to opposing goalies
             for goalie in home_goalies:
-                goalie.add_goal_against(is_playoff)  # FIXED: Pass is_playoff flag
+                game[goalie][GOALS_AGAINST] += 1
 
-            assister = weighted_random_assister(away_team.players, scorer)
+            assister = weighted_random_assister(away_team.players, scorer, rng)
             if assister:
-                assister.add_assist(is_playoff)  # FIXED: Pass is_playoff flag
+                game[assister][ASSISTS] += 1
 
     home_saves = away_shots - away_goals
     away_saves = home_shots - home_goals
 
     def assign_saves(team: Team, saves: int):
-        goalies = [p for p in team.players if p.position == "Goalie"]
+        goalies = team.goalies
         if not goalies:
             return
         weights = [p.defense * (p.stamina / 100) for p in goalies]
@@ -135,22 +151,23 @@ def simulate_match(home_team: Team, away_team: Team, game_duration_minutes: int
         if total == 0:
             equal_save = saves // len(goalies)
             for p in goalies:
-                p.add_save(is_playoff)  # FIXED: Pass is_playoff flag
+                game[p][SAVES] += 1
             return
         for p, w in zip(goalies, weights):
             assigned = int(saves * (w / total))
-            for _ in range(assigned):
-                p.add_save(is_playoff)  # FIXED: Pass is_playoff flag
+            game[p][SAVES] += assigned
 
     assign_saves(home_team, home_saves)
     assign_saves(away_team, away_saves)
 
-    # Only update team record for regular season games
-    if not is_playoff:
-        home_team.goals_for += home_goals
-        home_team.goals_against += away_goals
-        away_team.goals_for += away_goals
-        away_team.goals_against += home_goals
+    def final_whistle():
+        # Only update team records for regular season games
+        if not is_playoff:
+            home_team.record.apply(home_goals, away_goals, game_result(home_goals, away_goals, overtime))
+            away_team.record.apply(away_goals, home_goals, game_result(away_goals, home_goals, overtime))
+        game.record(home_team.players + away_team.players, phase, game_duration_minutes)
+        return MatchResult(home_team, away_team, home_goals, away_goals,
+                           home_shots, away_shots, home_saves, away_saves, overtime)
 
     overtime = False
 
@@ -161,53 +178,28 @@ def simulate_match(home_team: Team, away_team: Team, game_duration_minutes: int
         while True:
             ot_minutes += 1
             for offense_team, defense_team in [(home_team, away_team), (away_team, home_team)]:
-                if random.random() < 0.5:
-                    scorer = weighted_random_player(offense_team.players, ["Attack", "Midfield"])
+                if rng.random() < 0.5:
+                    scorer = weighted_random_player(offense_team.players, ["Attack", "Midfield"], rng)
                     ot_accuracy = team_shooting_accuracy(offense_team) * 0.8
-                    if random.random() < ot_accuracy:
+                    if rng.random() < ot_accuracy:
                         if offense_team == home_team:
                             home_goals += 1
                             for goalie in away_goalies:
-                                goalie.add_goal_against(is_playoff)
+                                game[goalie][GOALS_AGAINST] += 1
                         else:
                             away_goals += 1
                             for goalie in home_goalies:
-                                goalie.add_goal_against(is_playoff)
+                                game[goalie][GOALS_AGAINST] += 1
 
-                        scorer.add_goal(is_playoff)
+                        game[scorer][GOALS] += 1
 
                         # Add OT minutes to all goalies
                         for goalie in home_goalies + away_goalies:
-                            goalie.add_minutes_played(ot_minutes, is_playoff)
-
-                        # Only update team wins/losses for regular season
-                        if not is_playoff:
-                            if offense_team == home_team:
-                                home_team.wins += 1
-                                away_team.overtime_losses += 1
-                            else:
-                                away_team.wins += 1
-                                home_team.overtime_losses += 1
-
-                            home_team.points = (home_team.wins * 2) + (home_team.overtime_losses * 1)
-                            away_team.points = (away_team.wins * 2) + (away_team.overtime_losses * 1)
-
-                        return MatchResult(home_team, away_team, home_goals, away_goals,
-                                         home_shots, away_shots, home_saves, away_saves, overtime)
+                            game[goalie][MINUTES_PLAYED] += ot_minutes
 
-    # No OT, determine win/loss normally (only for regular season)
-    if not overtime and not is_playoff:
-        if home_goals > away_goals:
-            home_team.wins += 1
-            away_team.losses += 1
-        elif away_goals > home_goals:
-            away_team.wins += 1
-            home_team.losses += 1
+                        return final_whistle()
 
-        home_team.points = (home_team.wins * 2) + (home_team.overtime_losses * 1)
-        away_team.points = (away_team.wins * 2) + (away_team.overtime_losses * 1)
-
-    return MatchResult(home_team, away_team, home_goals, away_goals, home_shots, away_shots, home_saves, away_saves, overtime)
+    return final_whistle()
     # NEW: Track games played and minutes for all players
     for player in home_team.players + away_team.players:
         player.increment_games_played(is_playoff)
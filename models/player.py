@@ -1,97 +1,136 @@
+from models.stat_store import (StatStore, default_store, PLAYER_ATTRIBUTES, REGULAR, PLAYOFF, MATCH,
+                               GOALS, ASSISTS, SAVES, GAMES_PLAYED, GOALS_AGAINST, MINUTES_PLAYED, NULL)
+from models.stat_line import PlayerStats
+from models.snapshot import PlayerSnapshot
+from operator import attrgetter
+
+def _stat_property(index):
+    """Attribute view over one counter of the player's slot in its StatStore"""
+    def fget(self):
+        value = self.stat_store.attribute_columns[index][self.stat_slot]
+        return None if value == NULL else value
+
+    def fset(self, value):
+        self.stat_store.attribute_columns[index][self.stat_slot] = NULL if value is None else value
+
+    return property(fget, fset)
+
+def _rating_property(field):
+    """Rating attribute over a private slot; setting it drops the cached
+    snapshot and bumps the player's rating_version"""
+    private = '_' + field
+
+    def fset(self, value):
+        setattr(self, private, value)
+        self._snapshot = None
+        self.rating_version += 1
+        Player.rating_edits += 1
+
+    return property(attrgetter(private), fset)
+
+def _rebuild_player(name, position, shooting, passing, defense, stamina, stats):
+    player = Player(name, position, shooting, passing, defense, stamina)
+    for attribute, value in zip(PLAYER_ATTRIBUTES, stats):
+        setattr(player, attribute, value)
+    return player
+
+RATING_FIELDS = ('name', 'position', 'shooting', 'passing', 'defense', 'stamina')
+
 class Player:
+    # No per-instance __dict__: ratings and the stat slot are the only
+    # instance state, stat counters are properties over the StatStore.
+    # Ratings are properties over the underscored slots so that an edit
+    # can drop caches; stat writes don't go through any hook.
+    __slots__ = ('_name', '_position', '_shooting', '_passing', '_defense', '_stamina',
+                 'stat_store', 'stat_slot', 'rating_version', '_snapshot')
+
+    # Count of rating edits on any player (construction doesn't count). A
+    # Roster only re-sums its players' rating_version when this has moved,
+    # so checking for edits costs nothing while nobody edits ratings
+    rating_edits = 0
+
     def __init__(self, name: str, position: str,
-                 shooting: int, passing: int, defense: int, stamina: int):
-        self.name = name
-        self.position = position  # e.g., "Attack", "Midfield", "Defense", "Goalie"
-        self.shooting = shooting
-        self.passing = passing
-        self.defense = defense
-        self.stamina = stamina
-
-        # Regular season cumulative stats
-        self.goals = 0
-        self.assists = 0
-        self.saves = 0
-        self.player_of_match = 0
-        self.games_played = 0
-        self.goals_against = 0 if position == "Goalie" else None
-        self.minutes_played = 0 if position == "Goalie" else None
-
-        # Playoff-specific stats (separate from regular season)
-        self.playoff_goals = 0
-        self.playoff_assists = 0
-        self.playoff_saves = 0
-        self.playoff_games_played = 0
-        self.playoff_goals_against = 0 if position == "Goalie" else None
-        self.playoff_minutes_played = 0 if position == "Goalie" else None
-
-        # Per-match stats (reset before each match)
-        self.goals_match = 0
-        self.assists_match = 0
-        self.saves_match = 0
-        self.goals_against_match = 0 if position == "Goalie" else None
+                 shooting: int, passing: int, defense: int, stamina: int, stat_store: StatStore = None):
+        self._name = name
+        self._position = position  # e.g., "Attack", "Midfield", "Defense", "Goalie"
+        self._shooting = shooting
+        self._passing = passing
+        self._defense = defense
+        self._stamina = stamina
+        self.rating_version = 0  # Bumped by every edit of this player's ratings or position
+
+        # Regular season, playoff and per-match counters live in the league's
+        # StatStore; goals_against/minutes_played variants are None for skaters
+        self.stat_store = stat_store if stat_store is not None else default_store
+        self.stat_slot = self.stat_store.allocate(position == "Goalie")
+        self._snapshot = None
+
+    def __del__(self):
+        try:
+            self.stat_store.release(self.stat_slot)
+        except AttributeError:
+            pass  # __init__ didn't get as far as allocating
+
+    def __reduce__(self):
+        # Pickles carry the counters themselves, not the store they lived in
+        return (_rebuild_player, (self.name, self.position, self.shooting, self.passing,
+                                  self.defense, self.stamina,
+                                  tuple(getattr(self, attribute) for attribute in PLAYER_ATTRIBUTES)))
+
+    def snapshot(self):
+        """Frozen PlayerSnapshot of the ratings, cached until a rating or the position changes"""
+        if self._snapshot is None:
+            self._snapshot = PlayerSnapshot.of(self)
+        return self._snapshot
+
+    @property
+    def stats(self):
+        """Phase-keyed StatLines: player.stats[REGULAR].goals, player.stats['playoff'].saves"""
+        return PlayerStats(self)
 
     def reset_match_stats(self):
         """Reset per-match stats before each game"""
-        self.goals_match = 0
-        self.assists_match = 0
-        self.saves_match = 0
-        if self.position == "Goalie" and hasattr(self, 'goals_against_match'):
-            self.goals_against_match = 0
+        self.stat_store.reset((MATCH,), (self.stat_slot,))
 
     def increment_games_played(self, is_playoff=False):
         """Increment games played counter"""
-        if is_playoff:
-            self.playoff_games_played += 1
-        else:
-            self.games_played += 1
+        self.stat_store.add(PLAYOFF if is_playoff else REGULAR, GAMES_PLAYED, self.stat_slot)
 
     def add_goal_against(self, is_playoff=False):
         """Add a goal against (goalies only)"""
-        if self.position == "Goalie":
-            if is_playoff:
-                if self.playoff_goals_against is not None:
-                    self.playoff_goals_against += 1
-            else:
-                if self.goals_against is not None:
-                    self.goals_against += 1
-            if hasattr(self, 'goals_against_match') and self.goals_against_match is not None:
-                self.goals_against_match += 1
+        columns = self.stat_store.columns
+        slot = self.stat_slot
+        season = columns[PLAYOFF if is_playoff else REGULAR][GOALS_AGAINST]
+        if season[slot] != NULL:
+            season[slot] += 1
+            columns[MATCH][GOALS_AGAINST][slot] += 1
 
     def add_minutes_played(self, minutes, is_playoff=False):
         """Add minutes played (goalies only)"""
-        if self.position == "Goalie":
-            if is_playoff:
-                if self.playoff_minutes_played is not None:
-                    self.playoff_minutes_played += minutes
-            else:
-                if self.minutes_played is not None:
-                    self.minutes_played += minutes
+        self.stat_store.add(PLAYOFF if is_playoff else REGULAR, MINUTES_PLAYED, self.stat_slot, minutes)
 
     def add_goal(self, is_playoff=False):
         """Add a goal to season and match stats"""
-        if is_playoff:
-            self.playoff_goals += 1
-        else:
-            self.goals += 1
-        self.goals_match += 1
+        columns = self.stat_store.columns
+        columns[PLAYOFF if is_playoff else REGULAR][GOALS][self.stat_slot] += 1
+        columns[MATCH][GOALS][self.stat_slot] += 1
 
     def add_assist(self, is_playoff=False):
         """Add an assist to season and match stats"""
-        if is_playoff:
-            self.playoff_assists += 1
-        else:
-            self.assists += 1
-        self.assists_match += 1
+        columns = self.stat_store.columns
+        columns[PLAYOFF if is_playoff else REGULAR][ASSISTS][self.stat_slot] += 1
+        columns[MATCH][ASSISTS][self.stat_slot] += 1
 
     def add_save(self, is_playoff=False):
         """Add a save to season and match stats"""
+        self.add_saves(1, is_playoff)
+
+    def add_saves(self, count, is_playoff=False):
+        """Add several saves at once (goalies only)"""
         if self.position == "Goalie":
-            if is_playoff:
-                self.playoff_saves += 1
-            else:
-                self.saves += 1
-            self.saves_match += 1
+            columns = self.stat_store.columns
+            columns[PLAYOFF if is_playoff else REGULAR][SAVES][self.stat_slot] += count
+            columns[MATCH][SAVES][self.stat_slot] += count
 
     def finalize_match_stats(self):
         """Called at end of match to finalize any calculations"""
@@ -100,41 +139,19 @@ class Player:
 
     def get_save_percentage(self):
         """Calculate and return regular season save percentage"""
-        if self.position != "Goalie" or self.saves == 0:
-            return None
-
-        total_shots = self.saves + (self.goals_against or 0)
-        if total_shots == 0:
-            return 0.0
-
-        return (self.saves / total_shots) * 100
+        return self.stats[REGULAR].save_percentage()
 
     def get_playoff_save_percentage(self):
         """Calculate and return playoff save percentage"""
-        if self.position != "Goalie" or self.playoff_saves == 0:
-            return None
-
-        total_shots = self.playoff_saves + (self.playoff_goals_against or 0)
-        if total_shots == 0:
-            return 0.0
-
-        return (self.playoff_saves / total_shots) * 100
+        return self.stats[PLAYOFF].save_percentage()
 
     def get_gaa(self):
         """Calculate and return regular season Goals Against Average"""
-        if self.position != "Goalie" or not self.minutes_played or self.minutes_played == 0:
-            return None
-
-        # Standard game is 60 minutes
-        return ((self.goals_against or 0) * 60) / self.minutes_played
+        return self.stats[REGULAR].goals_against_average()
 
     def get_playoff_gaa(self):
         """Calculate and return playoff Goals Against Average"""
-        if self.position != "Goalie" or not self.playoff_minutes_played or self.playoff_minutes_played == 0:
-            return None
-
-        # Standard game is 60 minutes
-        return ((self.playoff_goals_against or 0) * 60) / self.playoff_minutes_played
+        return self.stats[PLAYOFF].goals_against_average()
 
     def get_overall_rating(self):
         """Calculate overall rating based on position and attributes"""
@@ -156,24 +173,7 @@ class Player:
 
     def reset_season_stats(self):
         """Reset all season stats to zero (both regular season and playoff)"""
-        # Regular season stats
-        self.goals = 0
-        self.assists = 0
-        self.saves = 0
-        self.player_of_match = 0
-        self.games_played = 0
-
-        # Playoff stats
-        self.playoff_goals = 0
-        self.playoff_assists = 0
-        self.playoff_saves = 0
-        self.playoff_games_played = 0
-
-        if self.position == "Goalie":
-            self.goals_against = 0
-            self.minutes_played = 0
-            self.playoff_goals_against = 0
-            self.playoff_minutes_played = 0
+        self.stat_store.reset((REGULAR, PLAYOFF), (self.stat_slot,))
 
     def get_total_points(self, include_playoffs=False):
         """Get total points (goals + assists)"""
@@ -191,3 +191,9 @@ class Player:
 
     def __repr__(self):
         return f"Player('{self.name}', '{self.position}', {self.shooting}, {self.passing}, {self.defense}, {self.stamina})"
+
+for _index, _attribute in enumerate(PLAYER_ATTRIBUTES):
+    setattr(Player, _attribute, _stat_property(_index))
+for _field in RATING_FIELDS:
+    setattr(Player, _field, _rating_property(_field))
+del _index, _attribute, _field
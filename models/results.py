@@ -0,0 +1,55 @@
+class GameResult:
+    """Outcome of one scheduled game, kept as data until someone renders it"""
+
+    def __init__(self, week: int, home_team: str, away_team: str,
+                 home_score: int = None, away_score: int = None,
+                 home_shots: int = None, away_shots: int = None,
+                 overtime: bool = False, round_name: str = None,
+                 is_playoff: bool = False, pending: bool = False, box_score=None):
+        self.week = week
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_score = home_score
+        self.away_score = away_score
+        self.home_shots = home_shots
+        self.away_shots = away_shots
+        self.overtime = overtime
+        self.round_name = round_name
+        self.is_playoff = is_playoff
+        self.pending = pending  # Matchup still waiting on a previous round
+        # (team, player, goals, assists, saves, goals_against) rows, only
+        # captured when a league store is attached or the season simulator's
+        # capture_box_scores is set
+        self.box_score = box_score
+
+    @property
+    def winner(self):
+        if self.pending:
+            return None
+        return self.home_team if self.home_score > self.away_score else self.away_team
+
+    @property
+    def loser(self):
+        if self.pending:
+            return None
+        return self.away_team if self.home_score > self.away_score else self.home_team
+
+class WeekResult:
+    """Everything that happened in one simulated week.
+
+    Game weeks carry GameResult objects; transition weeks (byes, playoff
+    preparation, offseason) carry a message instead.
+    """
+
+    def __init__(self, week: int, phase_name: str = None, games=None, message: str = None):
+        self.week = week
+        self.phase_name = phase_name
+        self.games = games if games is not None else []
+        self.message = message
+
+    @property
+    def completed_games(self):
+        return [game for game in self.games if not game.pending]
+
+    def __bool__(self):
+        return bool(self.games) or bool(self.message)
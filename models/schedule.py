@@ -1,8 +1,9 @@
 import random
 from datetime import datetime, timedelta
 from models.team import Team
+from models.schedule_optimizer import schedule_metrics
 
-def schedule_games_efficiently(all_matchups, team_names, weeks_count=14):
+def schedule_games_efficiently(all_matchups, team_names, weeks_count=14, rng=random):
     """
     Enhanced scheduling algorithm with better week utilization
     """
@@ -149,10 +150,9 @@ def schedule_games_efficiently(all_matchups, team_names, weeks_count=14):
     # Schedule all games in mixed order to better distribute load
     all_games_mixed = []
 
-    import random
-    random.shuffle(inter_conference_games)
-    random.shuffle(inter_division_games)
-    random.shuffle(intra_division_games)
+    rng.shuffle(inter_conference_games)
+    rng.shuffle(inter_division_games)
+    rng.shuffle(intra_division_games)
 
     # Interleave game types for better distribution
     max_len = max(len(inter_conference_games), len(inter_division_games), len(intra_division_games))
@@ -196,15 +196,151 @@ def schedule_games_efficiently(all_matchups, team_names, weeks_count=14):
 
     return weeks, team_week_schedule, failed_games
 
-def build_season_schedule(teams, start_date="2025-06-01"):
+class _SearchBudgetExceeded(Exception):
+    pass
+
+class _WeekAssignmentSearch:
+    """Backtracking search assigning every game a week.
+
+    Team-week availability is one integer bitmask per team (bit w set = free
+    in week w), and weeks that still have room are another mask, so a game's
+    possible weeks are `free[home] & free[away] & open_weeks`. The game with
+    the fewest possible weeks is placed next, and a placement is undone as
+    soon as some team has fewer free weeks left than games left to play.
     """
-    Build a 12-game conference schedule over 14 weeks.
-    Each team plays:
-    - 6 games vs division opponents (play each of 3 other teams twice - home and away)
-    - 4 games vs other division in same conference (play each team once)
-    - 2 games vs inter-conference opponents
-    - 2 bye weeks
-    Total: 12 games per team, 96 total games
+
+    def __init__(self, games, team_count, weeks_count, max_games_per_week, week_order, node_limit):
+        self.games = games
+        self.max_games_per_week = max_games_per_week
+        self.week_order = week_order
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.team_free = [(1 << weeks_count) - 1] * team_count
+        self.open_weeks = (1 << weeks_count) - 1
+        self.week_games = [0] * weeks_count
+        self.remaining = [0] * team_count
+        for home, away in games:
+            self.remaining[home] += 1
+            self.remaining[away] += 1
+        self.assignment = [None] * len(games)
+        self.unassigned = list(range(len(games)))
+
+    def solve(self):
+        if not self.unassigned:
+            return True
+
+        # Most constrained game first
+        best_position = None
+        best_domain = 0
+        best_count = None
+        team_free = self.team_free
+        open_weeks = self.open_weeks
+        for position, game in enumerate(self.unassigned):
+            home, away = self.games[game]
+            domain = team_free[home] & team_free[away] & open_weeks
+            count = domain.bit_count()
+            if best_count is None or count < best_count:
+                best_position, best_domain, best_count = position, domain, count
+                if count <= 1:
+                    break
+        if best_count == 0:
+            return False
+
+        game = self.unassigned[best_position]
+        self.unassigned[best_position] = self.unassigned[-1]
+        self.unassigned.pop()
+        home, away = self.games[game]
+
+        for week in self.week_order:
+            bit = 1 << week
+            if not best_domain & bit:
+                continue
+            self.nodes += 1
+            if self.nodes > self.node_limit:
+                raise _SearchBudgetExceeded()
+
+            self._place(game, home, away, week, bit)
+            if self._consistent(home, away, week) and self.solve():
+                return True
+            self._remove(game, home, away, week, bit)
+
+        self.unassigned.append(game)
+        self.unassigned[best_position], self.unassigned[-1] = game, self.unassigned[best_position]
+        return False
+
+    def _place(self, game, home, away, week, bit):
+        self.assignment[game] = week
+        self.team_free[home] &= ~bit
+        self.team_free[away] &= ~bit
+        self.remaining[home] -= 1
+        self.remaining[away] -= 1
+        self.week_games[week] += 1
+        if self.week_games[week] == self.max_games_per_week:
+            self.open_weeks &= ~bit
+
+    def _remove(self, game, home, away, week, bit):
+        self.assignment[game] = None
+        self.team_free[home] |= bit
+        self.team_free[away] |= bit
+        self.remaining[home] += 1
+        self.remaining[away] += 1
+        self.week_games[week] -= 1
+        self.open_weeks |= bit
+
+    def _consistent(self, home, away, week):
+        """Every affected team still has at least as many usable weeks as games left"""
+        if self.week_games[week] == self.max_games_per_week:
+            teams = range(len(self.team_free))  # A week closed: every team lost it
+        else:
+            teams = (home, away)
+        for team in teams:
+            if (self.team_free[team] & self.open_weeks).bit_count() < self.remaining[team]:
+                return False
+        return True
+
+def schedule_games_exact(all_matchups, team_names, weeks_count=14, max_games_per_week=8,
+                         max_attempts=20, node_limit=50000, rng=random):
+    """
+    Exact scheduling: every game gets a week, no team plays twice in a week
+    and no week has more than max_games_per_week games. Returns the same
+    (weeks, team_week_schedule, failed_games) as schedule_games_efficiently,
+    or None if no schedule was found (none exists, or the search budget of
+    max_attempts randomized restarts of node_limit placements ran out).
+    """
+    team_index = {team: i for i, team in enumerate(team_names)}
+    games = [(team_index[home], team_index[away]) for home, away in all_matchups]
+
+    for _ in range(max_attempts):
+        # Each attempt explores games and weeks in a different random order
+        order = list(range(len(games)))
+        rng.shuffle(order)
+        week_order = list(range(weeks_count))
+        rng.shuffle(week_order)
+
+        search = _WeekAssignmentSearch([games[i] for i in order], len(team_names), weeks_count,
+                                       max_games_per_week, week_order, node_limit)
+        try:
+            found = search.solve()
+        except _SearchBudgetExceeded:
+            continue
+        if not found:
+            return None  # Search space exhausted: no valid schedule exists
+
+        weeks = [[] for _ in range(weeks_count)]
+        team_week_schedule = {team: [False] * weeks_count for team in team_names}
+        for position, week in sorted(zip(order, search.assignment)):
+            home, away = all_matchups[position]
+            weeks[week].append((home, away))
+            team_week_schedule[home][week] = True
+            team_week_schedule[away][week] = True
+        return weeks, team_week_schedule, []
+
+    return None
+
+def build_season_matchups(team_names):
+    """
+    The 96 games of the 12-game conference schedule as (home, away) pairs,
+    or [] if team_names is not the standard 16-team league
     """
 
     # Map team names to their conference/division
@@ -231,14 +367,6 @@ def build_season_schedule(teams, start_date="2025-06-01"):
         "Denver Rapids": ("Western", "South")
     }
 
-    # Extract team names
-    team_names = []
-    for team in teams:
-        if hasattr(team, 'name'):
-            team_names.append(team.name)
-        else:
-            team_names.append(team)
-
     # Organize teams by divisions
     divisions = {
         "Eastern_North": [],
@@ -331,8 +459,38 @@ def build_season_schedule(teams, start_date="2025-06-01"):
         print("ERROR: Matchup generation failed!")
         return []
 
-    # EFFICIENT SCHEDULING using greedy approach (NOW WITH 14 WEEKS)
-    weeks, team_week_schedule, failed_games = schedule_games_efficiently(all_matchups, team_names, 14)
+    return all_matchups
+
+def build_season_schedule(teams, start_date="2025-06-01", rng=random):
+    """
+    Build a 12-game conference schedule over 14 weeks.
+    Each team plays:
+    - 6 games vs division opponents (play each of 3 other teams twice - home and away)
+    - 4 games vs other division in same conference (play each team once)
+    - 2 games vs inter-conference opponents
+    - 2 bye weeks
+    Total: 12 games per team, 96 total games
+    """
+
+    # Extract team names
+    team_names = []
+    for team in teams:
+        if hasattr(team, 'name'):
+            team_names.append(team.name)
+        else:
+            team_names.append(team)
+
+    all_matchups = build_season_matchups(team_names)
+    if not all_matchups:
+        return []
+
+    # Exact week assignment; the greedy scheduler is only a fallback if the
+    # search budget runs out
+    result = schedule_games_exact(all_matchups, team_names, 14, rng=rng)
+    if result is None:
+        print("ERROR: Exact scheduling failed, falling back to greedy scheduling")
+        result = schedule_games_efficiently(all_matchups, team_names, 14, rng)
+    weeks, team_week_schedule, failed_games = result
 
     # Generate final schedule with dates
     schedule = []
@@ -369,8 +527,267 @@ def build_season_schedule(teams, start_date="2025-06-01"):
 
     return schedule
 
-def verify_schedule_balance(schedule):
-    """Verify that the schedule is properly balanced"""
+def _fill_tier(teams, need, candidates, meetings, max_meetings, games):
+    """Add games between candidate pairs until no team in `teams` can take more.
+
+    Havel-Hakimi style: the team needing the most games is paired with the
+    candidates needing the most (fewest meetings so far breaking ties), so
+    needs stay level and the tier comes out as regular as its sizes allow.
+    Whatever a team can't get here is left in `need` for the next tier.
+    """
+    active = set(team for team in teams if need[team] > 0)
+    while active:
+        team = max(active, key=lambda t: (need[t], -t))
+        available = [other for other in candidates[team]
+                     if other in active and meetings.get((min(team, other), max(team, other)), 0) < max_meetings]
+        available.sort(key=lambda other: (-need[other], meetings.get((min(team, other), max(team, other)), 0), other))
+        chosen = available[:need[team]]
+        if not chosen:
+            active.discard(team)
+            continue
+        for other in chosen:
+            pair = (min(team, other), max(team, other))
+            meetings[pair] = meetings.get(pair, 0) + 1
+            games.append(pair)
+            for member in (team, other):
+                need[member] -= 1
+                if need[member] == 0:
+                    active.discard(member)
+
+def build_config_matchups(conferences, games_per_team=12, division_meetings=2, conference_meetings=1,
+                          league_meetings=1):
+    """
+    Matchups for any LeagueConfig.conferences layout ({conference: {division: [teams]}}).
+    Games are filled in tiers: division opponents (up to division_meetings each),
+    then the rest of the conference (up to conference_meetings each), then other
+    conferences (up to league_meetings each), until every team has games_per_team.
+    Repeat meetings alternate home and away, and every team hosts half its games
+    (rounded either way). Raises ValueError if the games can't be balanced.
+    """
+    team_names = []
+    conference_of = []
+    division_of = []
+    for conference, divisions in conferences.items():
+        for division, division_teams in divisions.items():
+            for team_name in division_teams:
+                team_names.append(team_name)
+                conference_of.append(conference)
+                division_of.append((conference, division))
+    if len(set(team_names)) != len(team_names):
+        raise ValueError("A team appears in more than one division")
+
+    teams = range(len(team_names))
+    tiers = (
+        (division_meetings, lambda a, b: division_of[a] == division_of[b]),
+        (conference_meetings, lambda a, b: conference_of[a] == conference_of[b] and division_of[a] != division_of[b]),
+        (league_meetings, lambda a, b: conference_of[a] != conference_of[b]),
+    )
+
+    need = [games_per_team] * len(team_names)
+    meetings = {}
+    pairs = []
+    for max_meetings, same_tier in tiers:
+        if max_meetings <= 0:
+            continue
+        candidates = [[other for other in teams if other != team and same_tier(team, other)] for team in teams]
+        _fill_tier(teams, need, candidates, meetings, max_meetings, pairs)
+
+    short = [team_names[team] for team in teams if need[team] > 0]
+    if short:
+        raise ValueError(f"Cannot balance a {games_per_team}-game schedule for this league layout: "
+                         f"{len(short)} team(s) short of games, e.g. {short[0]}")
+
+    # Repeat meetings alternate hosts, so only a pair's odd meeting can
+    # unbalance home and away; those are oriented along Euler walks
+    counts = {}
+    for pair in pairs:
+        counts[pair] = counts.get(pair, 0) + 1
+    next_host = {pair: pair[0] for pair in counts}
+    next_host.update(_orient_single_meetings(len(team_names), [pair for pair, count in counts.items() if count % 2]))
+
+    all_matchups = []
+    for pair in pairs:
+        home = next_host[pair]
+        away = pair[1] if home == pair[0] else pair[0]
+        next_host[pair] = away
+        all_matchups.append((team_names[home], team_names[away]))
+    return all_matchups
+
+def _orient_single_meetings(team_count, pairs):
+    """{pair: host} such that every team hosts within one of half its games in `pairs`.
+
+    Odd-degree teams are joined to a dummy team so every degree is even; each
+    walk along unused edges then returns to its start, entering and leaving
+    every team it passes equally often. Hosting = leaving.
+    """
+    dummy = team_count
+    edges = list(pairs)
+    degree = [0] * (team_count + 1)
+    for first, second in pairs:
+        degree[first] += 1
+        degree[second] += 1
+    edges += [(team, dummy) for team in range(team_count) if degree[team] % 2]
+
+    adjacent = [[] for _ in range(team_count + 1)]
+    for edge, (first, second) in enumerate(edges):
+        adjacent[first].append(edge)
+        adjacent[second].append(edge)
+    used = [False] * len(edges)
+    hosts = {}
+    for start in range(team_count + 1):
+        team = start
+        while adjacent[team]:
+            edge = adjacent[team].pop()
+            if used[edge]:
+                continue
+            used[edge] = True
+            first, second = edges[edge]
+            other = second if team == first else first
+            if edge < len(pairs):
+                hosts[edges[edge]] = team
+            team = other
+    return hosts
+
+def _assign_weeks_by_recoloring(games, team_count, weeks_count, max_evictions=None, rng=random):
+    """Week per game (a list) such that no team plays twice in a week, or None.
+
+    Edge colouring by Kempe chains: a game whose teams have no free week in
+    common takes a week `a` free for home and `b` free for away, after the
+    alternating a/b path starting at the away team has its weeks swapped to
+    free `a` there too. If every such path runs into the home team, the game
+    evicts the away team's game in a random week `a` and that game is placed
+    again later, up to max_evictions times (default 20 per game).
+    Week capacity is not checked; with one game per team per week it can't
+    exceed team_count // 2 anyway.
+    """
+    if max_evictions is None:
+        max_evictions = 20 * len(games)
+    # playing[team][week] = game the team plays that week, or None
+    playing = [[None] * weeks_count for _ in range(team_count)]
+    assignment = [None] * len(games)
+    pending = list(range(len(games) - 1, -1, -1))
+
+    def opponent(game, team):
+        home, away = games[game]
+        return away if team == home else home
+
+    def kempe_week(home, away, home_free, away_free):
+        """Free a week of home_free at away by swapping an a/b path; None if every path reaches home"""
+        for a in home_free:
+            for b in away_free:
+                path = []
+                team, current = away, a
+                while playing[team][current] is not None:
+                    step = playing[team][current]
+                    path.append(step)
+                    team = opponent(step, team)
+                    current = b if current == a else a
+                if team == home:
+                    continue  # Swapping would take `a` from home as well
+                for step in path:
+                    for member in games[step]:
+                        playing[member][assignment[step]] = None
+                for step in path:
+                    assignment[step] = b if assignment[step] == a else a
+                    for member in games[step]:
+                        playing[member][assignment[step]] = step
+                return a
+        return None
+
+    while pending:
+        game = pending.pop()
+        home, away = games[game]
+        home_weeks = playing[home]
+        away_weeks = playing[away]
+        home_free = [week for week in range(weeks_count) if home_weeks[week] is None]
+        away_free = [week for week in range(weeks_count) if away_weeks[week] is None]
+        shared = [week for week in home_free if away_weeks[week] is None]
+        if shared:
+            week = shared[0]
+        elif not home_free or not away_free:
+            return None  # More games than weeks for one of the teams
+        else:
+            week = kempe_week(home, away, home_free, away_free)
+            if week is None:
+                if max_evictions == 0:
+                    return None
+                max_evictions -= 1
+                # Either team's free week, taken from the other team's game
+                if rng.random() < 0.5:
+                    week = rng.choice(home_free)
+                    evicted = away_weeks[week]
+                else:
+                    week = rng.choice(away_free)
+                    evicted = home_weeks[week]
+                for member in games[evicted]:
+                    playing[member][week] = None
+                assignment[evicted] = None
+                pending.append(evicted)
+        assignment[game] = week
+        home_weeks[week] = game
+        away_weeks[week] = game
+    return assignment
+
+def _recolored_weeks(all_matchups, team_names, weeks_count, max_attempts=5, rng=random):
+    """Weeks of (home, away) games from _assign_weeks_by_recoloring, trying a few game orders"""
+    team_index = {team: i for i, team in enumerate(team_names)}
+    games = [(team_index[home], team_index[away]) for home, away in all_matchups]
+    order = list(range(len(games)))
+    for _ in range(max_attempts):
+        assignment = _assign_weeks_by_recoloring([games[i] for i in order], len(team_names), weeks_count, rng=rng)
+        if assignment is not None:
+            weeks = [[] for _ in range(weeks_count)]
+            for position, week in sorted(zip(order, assignment)):
+                weeks[week].append(all_matchups[position])
+            return weeks
+        rng.shuffle(order)
+    return None
+
+def build_config_schedule(config, games_per_team=None, weeks_count=None, start_date="2025-06-01", rng=random):
+    """
+    Season schedule for any conference/division layout in `config`
+    (a LeagueConfig), as game dicts like build_season_schedule's.
+    Raises ValueError if the games can't be balanced or fit in the weeks.
+    """
+    if games_per_team is None:
+        games_per_team = getattr(config, 'games_per_team', 12)
+    if weeks_count is None:
+        weeks_count = config.regular_season_weeks
+
+    all_matchups = build_config_matchups(config.conferences, games_per_team)
+    team_names = [team for divisions in config.conferences.values()
+                  for division_teams in divisions.values() for team in division_teams]
+    if games_per_team > weeks_count:
+        raise ValueError(f"{games_per_team} games per team don't fit in {weeks_count} weeks")
+
+    weeks = _recolored_weeks(all_matchups, team_names, weeks_count, rng=rng)
+    if weeks is None:
+        # Kempe chains can get stuck on odd cycles; the exact search settles it
+        result = schedule_games_exact(all_matchups, team_names, weeks_count, max(1, len(team_names) // 2), rng=rng)
+        if result is None:
+            raise ValueError(f"No valid {weeks_count}-week schedule found for {len(all_matchups)} games")
+        weeks = result[0]
+
+    schedule = []
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    for week_num, week_matches in enumerate(weeks):
+        match_date = start + timedelta(weeks=week_num)
+        for home, away in week_matches:
+            schedule.append({
+                "week": week_num + 1,
+                "date": match_date.strftime("%Y-%m-%d"),
+                "home_team": home,
+                "away_team": away,
+            })
+    return schedule
+
+def verify_schedule_balance(schedule, conferences=None):
+    """
+    Verify that the schedule is properly balanced. Returns per-team games,
+    home games and away games plus the schedule_metrics report: long home or
+    away streaks, bye clumping, back-to-back repeat matchups, cross-conference
+    travel imbalance (needs `conferences`) and the total optimizer cost.
+    """
     team_games = {}
     team_home_games = {}
     team_away_games = {}
@@ -384,4 +801,10 @@ def verify_schedule_balance(schedule):
         team_home_games[home] = team_home_games.get(home, 0) + 1
         team_away_games[away] = team_away_games.get(away, 0) + 1
 
-    return team_games
+    report = {
+        'games': team_games,
+        'home_games': team_home_games,
+        'away_games': team_away_games,
+    }
+    report.update(schedule_metrics(schedule, conferences))
+    return report
@@ -0,0 +1,249 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+# Simulated annealing over a feasible season schedule (build_season_schedule
+# output): games move between weeks and swap hosts while every team still
+# plays at most once a week. The cost is a sum of per-team terms computed
+# from the team's week-by-week row (venue and opponent), so a move only
+# rescores the teams whose rows it changed: two for a game move or host
+# flip, the teams of two weeks for a week swap. The one league-wide term,
+# empty weeks, only looks at the weeks a move touched.
+
+HOME = 1
+AWAY = -1
+STREAK_LIMIT = 2  # Longest run of home (or away) games that costs nothing
+
+COST_TERMS = ('long_streaks', 'bye_clumping', 'consecutive_repeats', 'travel_imbalance', 'home_imbalance')
+DEFAULT_WEIGHTS = {
+    'long_streaks': 3.0,          # Games beyond STREAK_LIMIT in a home or away run
+    'bye_clumping': 2.0,          # Weeks short of an even spacing between byes
+    'consecutive_repeats': 5.0,   # Same opponent in back-to-back weeks
+    'travel_imbalance': 1.0,      # Away vs home difference in cross-conference games
+    'home_imbalance': 1.0,        # Away vs home difference overall
+    'empty_weeks': 20.0,          # Weeks of the season with no games at all
+}
+
+class _ScheduleState:
+    """Team-by-week venue and opponent rows of a schedule, with cached per-team costs"""
+
+    def __init__(self, schedule, conferences, weights, max_games_per_week=None, rng=random, weeks_count=None):
+        self.team_names = sorted({game[side] for game in schedule for side in ('home_team', 'away_team')})
+        index = {team: i for i, team in enumerate(self.team_names)}
+        # Trailing weeks the input left empty still belong to the season
+        self.weeks_count = max(max((game['week'] for game in schedule), default=0), weeks_count or 0)
+        self.weight_vector = [weights[term] for term in COST_TERMS]
+        self.empty_weight = weights.get('empty_weeks', DEFAULT_WEIGHTS['empty_weeks'])
+        self.rng = rng
+        team_count = len(self.team_names)
+        self.max_games_per_week = max_games_per_week or max(1, team_count // 2)
+
+        conference_of = {}
+        for conference, divisions in (conferences or {}).items():
+            for division_teams in divisions.values():
+                for team in division_teams:
+                    conference_of[team] = conference
+        self.conference = [conference_of.get(team) for team in self.team_names]
+
+        self.venue = [[0] * self.weeks_count for _ in range(team_count)]
+        self.opponent = [[-1] * self.weeks_count for _ in range(team_count)]
+        self.week_load = [0] * self.weeks_count
+        # Home minus away games, overall and against other conferences
+        self.home_margin = [0] * team_count
+        self.cross_margin = [0] * team_count
+        self.cross_games = [0] * team_count
+        self.games = []  # [home, away, week index]
+        legs = {}
+        for game in schedule:
+            home, away = index[game['home_team']], index[game['away_team']]
+            number = len(self.games)
+            self.games.append([home, away, game['week'] - 1])
+            legs.setdefault((min(home, away), max(home, away)), []).append(number)
+        for number in range(len(self.games)):
+            self._place(number)
+        # A pair's home-and-away legs swap hosts together, so the pair stays one of each
+        self.return_leg = {}
+        for numbers in legs.values():
+            if len(numbers) == 2 and self.games[numbers[0]][0] != self.games[numbers[1]][0]:
+                self.return_leg[numbers[0]] = numbers[1]
+                self.return_leg[numbers[1]] = numbers[0]
+
+        self.team_cost = [self.cost_of(team) for team in range(team_count)]
+        self.empty_weeks = self.week_load.count(0)
+        self.cost = sum(self.team_cost) + self.empty_weight * self.empty_weeks
+
+    def _place(self, number, sign=1):
+        home, away, week = self.games[number]
+        if sign > 0:
+            self.venue[home][week] = HOME
+            self.venue[away][week] = AWAY
+            self.opponent[home][week] = away
+            self.opponent[away][week] = home
+        else:
+            self.venue[home][week] = self.venue[away][week] = 0
+            self.opponent[home][week] = self.opponent[away][week] = -1
+        self.week_load[week] += sign
+        self.home_margin[home] += sign
+        self.home_margin[away] -= sign
+        if self.conference[home] != self.conference[away]:
+            self.cross_margin[home] += sign
+            self.cross_margin[away] -= sign
+            self.cross_games[home] += sign
+            self.cross_games[away] += sign
+
+    def _clear(self, number):
+        self._place(number, -1)
+
+    def terms(self, team):
+        """Raw values of the COST_TERMS for one team, in order"""
+        venue = self.venue[team]
+        opponent = self.opponent[team]
+        long_streaks = 0
+        run = 0
+        last = 0
+        byes = []
+        repeats = 0
+        previous = -1
+        for week, side in enumerate(venue):
+            if not side:
+                byes.append(week)
+                previous = -1
+                continue  # A bye doesn't break a home or away run
+            if side == last:
+                run += 1
+                if run > STREAK_LIMIT:
+                    long_streaks += 1
+            else:
+                run = 1
+                last = side
+            if opponent[week] == previous:
+                repeats += 1
+            previous = opponent[week]
+
+        clumping = 0
+        if len(byes) > 1:
+            spacing = self.weeks_count // len(byes)
+            for first, second in zip(byes, byes[1:]):
+                clumping += max(0, spacing - (second - first))
+
+        games = len(venue) - len(byes)
+        return (long_streaks, clumping, repeats,
+                abs(self.cross_margin[team]) - self.cross_games[team] % 2,
+                abs(self.home_margin[team]) - games % 2)
+
+    def cost_of(self, team):
+        return sum(weight * value for weight, value in zip(self.weight_vector, self.terms(team)))
+
+    def apply(self, changes):
+        """Set (game, home, away, week) for each change and return the cost delta and the undo changes"""
+        undo = [(number,) + tuple(self.games[number]) for number, _, _, _ in changes]
+        weeks = {change[3] for change in changes + undo}
+        empty_before = sum(1 for week in weeks if not self.week_load[week])
+        teams = set()
+        for number, home, away, week in changes:
+            teams.update(self.games[number][:2])
+            self._clear(number)
+        for number, home, away, week in changes:
+            self.games[number] = [home, away, week]
+            self._place(number)
+        delta = 0
+        for team in teams:
+            cost = self.cost_of(team)
+            delta += cost - self.team_cost[team]
+            self.team_cost[team] = cost
+        empty_change = sum(1 for week in weeks if not self.week_load[week]) - empty_before
+        self.empty_weeks += empty_change
+        delta += self.empty_weight * empty_change
+        self.cost += delta
+        return delta, undo
+
+    def week_swap(self, first, second):
+        return [(number, home, away, second if week == first else first)
+                for number, (home, away, week) in enumerate(self.games) if week in (first, second)]
+
+    def random_move(self):
+        """Changes for a random feasible move, or None if the drawn one isn't"""
+        roll = self.rng.random()
+        if roll < 0.1:
+            first, second = self.rng.sample(range(self.weeks_count), 2)
+            return self.week_swap(first, second)
+
+        number = self.rng.randrange(len(self.games))
+        home, away, week = self.games[number]
+        if roll < 0.4:
+            # Swap hosts, of both legs for home-and-away pairs
+            changes = [(number, away, home, week)]
+            if number in self.return_leg:
+                leg = self.return_leg[number]
+                leg_home, leg_away, leg_week = self.games[leg]
+                changes.append((leg, leg_away, leg_home, leg_week))
+            return changes
+
+        # Move the game to a week both teams have off
+        target = self.rng.randrange(self.weeks_count)
+        if (self.venue[home][target] or self.venue[away][target]
+                or self.week_load[target] >= self.max_games_per_week):
+            return None
+        return [(number, home, away, target)]
+
+def schedule_metrics(schedule, conferences=None, weights=None, weeks_count=None):
+    """Per-team values of each COST_TERMS entry, the number of empty weeks and the weighted total cost"""
+    state = _ScheduleState(schedule, conferences, weights or DEFAULT_WEIGHTS, weeks_count=weeks_count)
+    report = {term: {} for term in COST_TERMS}
+    for team, name in enumerate(state.team_names):
+        for term, value in zip(COST_TERMS, state.terms(team)):
+            report[term][name] = value
+    report['empty_weeks'] = state.empty_weeks
+    report['cost'] = state.cost
+    return report
+
+def optimize_schedule(schedule, conferences=None, iterations=10000, start_temperature=3.0,
+                      end_temperature=0.05, weights=None, max_games_per_week=None, rng=random,
+                      weeks_count=None):
+    """
+    Simulated annealing over a schedule of game dicts (week, date, home_team,
+    away_team, ...). Returns new game dicts for the lowest-cost schedule
+    found; every team still plays the same opponents the same number of
+    times, home-and-away pairs keep one game each way, and no team plays
+    twice in a week. `conferences` is a LeagueConfig.conferences layout,
+    needed for the cross-conference travel term. `weeks_count` is the
+    length of the season, when it can end in weeks the input left empty.
+    """
+    if not schedule:
+        return []
+    state = _ScheduleState(schedule, conferences, weights or DEFAULT_WEIGHTS, max_games_per_week, rng,
+                           weeks_count)
+    if state.weeks_count < 2:
+        return [dict(game) for game in schedule]
+
+    best_cost = state.cost
+    best_games = [list(game) for game in state.games]
+    cooling = (end_temperature / start_temperature) ** (1 / iterations)
+    temperature = start_temperature
+    for _ in range(iterations):
+        temperature *= cooling
+        changes = state.random_move()
+        if changes is None:
+            continue
+        delta, undo = state.apply(changes)
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            if state.cost < best_cost:
+                best_cost = state.cost
+                best_games = [list(game) for game in state.games]
+        else:
+            state.apply(undo)
+
+    first = min(schedule, key=lambda game: game['week'])
+    start = datetime.strptime(first['date'], "%Y-%m-%d") - timedelta(weeks=first['week'] - 1)
+    optimized = []
+    for game, (home, away, week) in zip(schedule, best_games):
+        game = dict(game)
+        game.update({
+            "week": week + 1,
+            "date": (start + timedelta(weeks=week)).strftime("%Y-%m-%d"),
+            "home_team": state.team_names[home],
+            "away_team": state.team_names[away],
+        })
+        optimized.append(game)
+    optimized.sort(key=lambda game: game['week'])
+    return optimized
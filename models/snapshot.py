@@ -0,0 +1,123 @@
+import struct
+from hashlib import blake2b
+
+# Frozen copies of player ratings and team rosters, used as cache keys
+# ("this roster with these ratings") and as cheap payloads for worker
+# processes. Each snapshot carries a 64-bit digest computed once from its
+# contents with blake2b, not hash(): str hashes are salted per process, and
+# the digest has to match between the GUI and its workers. __hash__ returns
+# the digest, so snapshots are O(1) dict keys.
+
+PLAYER_FIELDS = ('name', 'position', 'shooting', 'passing', 'defense', 'stamina')
+_RATINGS = struct.Struct("<4i")
+_DIGEST_SIZE = 8
+
+def _digest(*parts):
+    return int.from_bytes(blake2b(b"".join(parts), digest_size=_DIGEST_SIZE).digest(), 'little', signed=True)
+
+def _text(value):
+    encoded = value.encode('utf-8')
+    return struct.pack("<I", len(encoded)) + encoded
+
+class _Frozen:
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__
+
+    def __hash__(self):
+        return self.digest
+
+class PlayerSnapshot(_Frozen):
+    """A player's name, position and ratings at one point in time"""
+    __slots__ = PLAYER_FIELDS + ('digest',)
+
+    def __init__(self, name, position, shooting, passing, defense, stamina):
+        for field, value in zip(PLAYER_FIELDS, (name, position, shooting, passing, defense, stamina)):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, 'digest', _digest(_text(name), _text(position),
+                                                   _RATINGS.pack(shooting, passing, defense, stamina)))
+
+    @classmethod
+    def of(cls, player):
+        return cls(player.name, player.position, player.shooting, player.passing, player.defense, player.stamina)
+
+    def fields(self):
+        return (self.name, self.position, self.shooting, self.passing, self.defense, self.stamina)
+
+    def replace(self, **changes):
+        """A copy with some fields changed, e.g. for what-if comparisons"""
+        fields = dict(zip(PLAYER_FIELDS, self.fields()))
+        fields.update(changes)
+        return PlayerSnapshot(**fields)
+
+    def __eq__(self, other):
+        if not isinstance(other, PlayerSnapshot):
+            return NotImplemented
+        return self.digest == other.digest and self.fields() == other.fields()
+
+    __hash__ = _Frozen.__hash__  # Defining __eq__ would otherwise drop it
+
+    def __reduce__(self):
+        return (PlayerSnapshot, self.fields())
+
+    def __repr__(self):
+        return "PlayerSnapshot(%r, %r, %r, %r, %r, %r)" % self.fields()
+
+class TeamSnapshot(_Frozen):
+    """A team's name and roster (PlayerSnapshots, in roster order) at one point in time"""
+    __slots__ = ('name', 'players', 'digest')
+
+    def __init__(self, name, players):
+        players = tuple(players)
+        object.__setattr__(self, 'name', name)
+        object.__setattr__(self, 'players', players)
+        member_digests = (player.digest.to_bytes(_DIGEST_SIZE, 'little', signed=True) for player in players)
+        object.__setattr__(self, 'digest', _digest(_text(name), *member_digests))
+
+    @classmethod
+    def of(cls, team):
+        return cls(team.name, (player.snapshot() for player in team.players))
+
+    def by_position(self, position):
+        return tuple(player for player in self.players if player.position == position)
+
+    def replace_player(self, index, player):
+        """A copy with the player at `index` swapped for another PlayerSnapshot"""
+        players = list(self.players)
+        players[index] = player
+        return TeamSnapshot(self.name, players)
+
+    def to_team(self, stat_store=None):
+        """A fresh Team (zeroed stats) with this roster, e.g. to simulate a what-if.
+
+        Without a stat_store the team gets a store of its own, so teams built
+        on different threads never share one.
+        """
+        from models.player import Player
+        from models.stat_store import StatStore
+        from models.team import Team
+        if stat_store is None:
+            stat_store = StatStore()
+        return Team(self.name, [Player(*player.fields(), stat_store=stat_store) for player in self.players])
+
+    def __eq__(self, other):
+        if not isinstance(other, TeamSnapshot):
+            return NotImplemented
+        return self.digest == other.digest and self.name == other.name and self.players == other.players
+
+    __hash__ = _Frozen.__hash__
+
+    def __len__(self):
+        return len(self.players)
+
+    def __iter__(self):
+        return iter(self.players)
+
+    def __reduce__(self):
+        return (TeamSnapshot, (self.name, self.players))
+
+    def __repr__(self):
+        return f"TeamSnapshot({self.name!r}, {len(self.players)} players, digest={self.digest:#x})"
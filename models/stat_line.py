@@ -0,0 +1,101 @@
+from models.stat_store import COLUMNS, GOALS, ASSISTS, NULL, PHASE_NAMES, phase_index
+
+def _column_property(column):
+    """Attribute view over one counter of the line's slot and phase"""
+    def fget(self):
+        value = self.columns[column][self.slot]
+        return None if value == NULL else value
+
+    def fset(self, value):
+        self.columns[column][self.slot] = NULL if value is None else value
+
+    return property(fget, fset)
+
+class StatLine:
+    """One player's counters for one phase, read and written in place in the StatStore.
+
+    Has an attribute per stat column (goals, assists, saves, games_played,
+    goals_against, minutes_played, player_of_match); goalie-only counters
+    are None for skaters. Holds the player itself, so the slot can't be
+    released and reused by another player while the line is in use.
+    """
+    __slots__ = ('player', 'columns', 'slot', 'phase')
+
+    def __init__(self, player, phase):
+        self.player = player
+        self.columns = player.stat_store.phase_columns(phase)
+        self.slot = player.stat_slot
+        self.phase = phase
+
+    def add(self, column, amount=1):
+        """Increment a counter by column index; goalie-only counters of skaters stay None"""
+        values = self.columns[column]
+        if values[self.slot] != NULL:
+            values[self.slot] += amount
+
+    @property
+    def points(self):
+        return self.columns[GOALS][self.slot] + self.columns[ASSISTS][self.slot]
+
+    def save_percentage(self):
+        """Saves / shots faced * 100, None for skaters or goalies without a save"""
+        if self.goals_against is None or self.saves == 0:
+            return None
+        return (self.saves / (self.saves + self.goals_against)) * 100
+
+    def goals_against_average(self):
+        """Goals against per 60 minutes, None for skaters or goalies who haven't played"""
+        if not self.minutes_played:
+            return None
+        # Standard game is 60 minutes
+        return ((self.goals_against or 0) * 60) / self.minutes_played
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    def __repr__(self):
+        return f"StatLine({PHASE_NAMES[self.phase]!r}, {self.to_dict()})"
+
+for _column, _name in enumerate(COLUMNS):
+    setattr(StatLine, _name, _column_property(_column))
+del _column, _name
+
+class PlayerStats:
+    """A player's stat lines keyed by phase: stats[REGULAR], stats['playoff'], ..."""
+    __slots__ = ('player',)
+
+    def __init__(self, player):
+        self.player = player
+
+    def __getitem__(self, phase):
+        return StatLine(self.player, phase_index(phase))
+
+    def __iter__(self):
+        return iter(PHASE_NAMES)
+
+    def items(self):
+        return [(name, self[index]) for index, name in enumerate(PHASE_NAMES)]
+
+class GameStats(dict):
+    """One game's player stats, accumulated locally and recorded into the
+    StatStore in one step. game[player] is a list of counters in COLUMNS
+    order, created on first use: game[scorer][GOALS] += 1
+    """
+    __slots__ = ()
+
+    def __missing__(self, player):
+        line = self[player] = [0] * len(COLUMNS)
+        return line
+
+    def record(self, players, phase, minutes):
+        """Credit the game to `phase` for everyone who played (one game, and
+        `minutes` for goalies) and make it their MATCH line"""
+        groups = {}
+        for player in players:
+            group = groups.get(player.stat_store)
+            if group is None:
+                group = groups[player.stat_store] = ([], [])
+            group[0].append(player.stat_slot)
+            group[1].append(self.get(player))
+        for store, (slots, lines) in groups.items():
+            store.record_game(phase, slots, lines, minutes)
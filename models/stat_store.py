@@ -0,0 +1,219 @@
+import threading
+from array import array
+
+# Player stat counters for a whole league, stored column-wise: one array('i')
+# per (phase, stat) indexed by the player's slot, instead of ~20 attributes
+# on every Player. Player exposes the old attribute names as properties over
+# these columns, so a league's stats cost 4 bytes per counter and resetting
+# or totalling a phase is one slice assignment or sum() per column.
+#
+# Phases are plain indexes into the store. The match engine accumulates a
+# game locally (GameStats) and records it into MATCH and the game's phase in
+# one step, so a new phase (preseason, all-star) is one register_phase() call.
+
+REGULAR = 0
+PLAYOFF = 1
+MATCH = 2
+PHASES = (REGULAR, PLAYOFF, MATCH)
+PHASE_NAMES = ['regular', 'playoff', 'match']
+
+COLUMNS = ('goals', 'assists', 'saves', 'games_played', 'goals_against', 'minutes_played', 'player_of_match')
+GOALS, ASSISTS, SAVES, GAMES_PLAYED, GOALS_AGAINST, MINUTES_PLAYED, PLAYER_OF_MATCH = range(len(COLUMNS))
+GOALIE_COLUMNS = (GOALS_AGAINST, MINUTES_PLAYED)  # Held as None for skaters
+_COLUMN_INDEXES = tuple(range(len(COLUMNS)))
+NULL = -2 ** 31
+
+# Player attribute -> (phase, column)
+PLAYER_ATTRIBUTES = {
+    'goals': (REGULAR, GOALS),
+    'assists': (REGULAR, ASSISTS),
+    'saves': (REGULAR, SAVES),
+    'player_of_match': (REGULAR, PLAYER_OF_MATCH),
+    'games_played': (REGULAR, GAMES_PLAYED),
+    'goals_against': (REGULAR, GOALS_AGAINST),
+    'minutes_played': (REGULAR, MINUTES_PLAYED),
+    'playoff_goals': (PLAYOFF, GOALS),
+    'playoff_assists': (PLAYOFF, ASSISTS),
+    'playoff_saves': (PLAYOFF, SAVES),
+    'playoff_games_played': (PLAYOFF, GAMES_PLAYED),
+    'playoff_goals_against': (PLAYOFF, GOALS_AGAINST),
+    'playoff_minutes_played': (PLAYOFF, MINUTES_PLAYED),
+    'goals_match': (MATCH, GOALS),
+    'assists_match': (MATCH, ASSISTS),
+    'saves_match': (MATCH, SAVES),
+    'goals_against_match': (MATCH, GOALS_AGAINST),
+}
+_ATTRIBUTE_COLUMNS = tuple(PLAYER_ATTRIBUTES.values())
+
+def register_phase(name):
+    """Add a stat phase (e.g. 'preseason') and return its index; existing stores grow on first use"""
+    if name not in PHASE_NAMES:
+        PHASE_NAMES.append(name)
+    return PHASE_NAMES.index(name)
+
+def phase_index(phase):
+    """Index of a phase given by index or name"""
+    if isinstance(phase, str):
+        try:
+            return PHASE_NAMES.index(phase)
+        except ValueError:
+            raise KeyError(f"Unknown stat phase '{phase}'") from None
+    if not 0 <= phase < len(PHASE_NAMES):
+        raise KeyError(f"Unknown stat phase {phase}")
+    return phase
+
+class StatStore:
+    """Struct-of-arrays stat counters for the players of one league"""
+
+    def __init__(self):
+        self.columns = []
+        self._skater_columns = []
+        self._goalie_columns = []
+        self._initial = array('i')  # Per slot: 0 for goalies, NULL for skaters
+        self._free = []
+        self.size = 0
+        # Slots are allocated and released from any thread (Player.__del__
+        # runs wherever the last reference goes); reentrant because a
+        # collection during allocate() can release a slot on the same thread
+        self._slot_lock = threading.RLock()
+        self._add_phases()
+        # Columns in PLAYER_ATTRIBUTES order. Columns are only ever modified
+        # in place, so these references stay valid
+        self.attribute_columns = [self.columns[phase][column] for phase, column in _ATTRIBUTE_COLUMNS]
+
+    def phase_columns(self, phase):
+        """The column arrays of one phase, adding any phases registered since the store was built"""
+        if phase >= len(self.columns):
+            self._add_phases()
+        return self.columns[phase]
+
+    def allocate(self, goalie):
+        """Reserve a slot for a new player and return it"""
+        initial = 0 if goalie else NULL
+        with self._slot_lock:
+            if self._free:
+                slot = self._free.pop()
+                self._initial[slot] = initial
+                self._reset_slots(range(len(self.columns)), (slot,))
+                return slot
+
+            slot = self.size
+            self.size += 1
+            self._initial.append(initial)
+            for column in self._skater_columns:
+                column.append(0)
+            for column in self._goalie_columns:
+                column.append(initial)
+            return slot
+
+    def release(self, slot):
+        """Hand a discarded player's slot back for reuse"""
+        with self._slot_lock:
+            self._free.append(slot)
+
+    def get(self, phase, column, slot):
+        value = self.phase_columns(phase)[column][slot]
+        return None if value == NULL else value
+
+    def set(self, phase, column, slot, value):
+        self.phase_columns(phase)[column][slot] = NULL if value is None else value
+
+    def row(self, slot):
+        """All of a slot's counters, in PLAYER_ATTRIBUTES order"""
+        values = [column[slot] for column in self.attribute_columns]
+        if NULL in values:
+            values = [None if value == NULL else value for value in values]
+        return values
+
+    def set_row(self, slot, values):
+        """Inverse of row()"""
+        for column, value in zip(self.attribute_columns, values):
+            column[slot] = NULL if value is None else value
+
+    def add(self, phase, column, slot, amount=1):
+        """Increment a counter; goalie-only counters of skaters stay None"""
+        values = self.phase_columns(phase)[column]
+        if values[slot] != NULL:
+            values[slot] += amount
+
+    def record_game(self, phase, slots, lines, minutes):
+        """Make `lines` (COLUMNS-ordered counters per slot, None if the player
+        recorded nothing) plus one game played, and `minutes` for goalies,
+        the MATCH line of each slot and add it to `phase`"""
+        initial = self._initial
+        rows = []
+        goalie_rows = []
+        for slot, line in zip(slots, lines):
+            if line is None:
+                line = [0] * len(COLUMNS)
+            line[GAMES_PLAYED] += 1
+            rows.append((slot, line))
+            if initial[slot] != NULL:
+                line[MINUTES_PLAYED] += minutes
+                goalie_rows.append((slot, line))
+
+        match = self.columns[MATCH]
+        totals = self.phase_columns(phase)
+        for column in _COLUMN_INDEXES:
+            values = match[column]
+            season = totals[column]
+            for slot, line in goalie_rows if column in GOALIE_COLUMNS else rows:
+                value = line[column]
+                values[slot] = value
+                if value:
+                    season[slot] += value
+
+    def reset(self, phases=PHASES, slots=None):
+        """Zero the counters of `phases` for `slots` (every slot if None)"""
+        if slots is not None:
+            self._reset_slots(phases, slots)
+            return
+        zeros = array('i', bytes(self.size * 4))
+        for phase in phases:
+            for index, column in enumerate(self.phase_columns(phase)):
+                column[:] = self._initial if index in GOALIE_COLUMNS else zeros
+
+    def total(self, phase, column, slots=None):
+        """Sum of one counter over `slots` (every slot if None), skipping None"""
+        values = self.phase_columns(phase)[column]
+        if slots is not None:
+            values = [values[slot] for slot in slots]
+        if column in GOALIE_COLUMNS:
+            return sum(value for value in values if value != NULL)
+        return sum(values)
+
+    def _reset_slots(self, phases, slots):
+        initial = self._initial
+        for phase in phases:
+            for index, column in enumerate(self.phase_columns(phase)):
+                if index in GOALIE_COLUMNS:
+                    for slot in slots:
+                        column[slot] = initial[slot]
+                else:
+                    for slot in slots:
+                        column[slot] = 0
+
+    def _add_phases(self):
+        zeros = array('i', bytes(self.size * 4))
+        while len(self.columns) < len(PHASE_NAMES):
+            phase_columns = [array('i', self._initial if index in GOALIE_COLUMNS else zeros)
+                             for index in range(len(COLUMNS))]
+            self.columns.append(phase_columns)
+            for index, column in enumerate(phase_columns):
+                (self._goalie_columns if index in GOALIE_COLUMNS else self._skater_columns).append(column)
+
+# Store for players created outside a league (scripts, unpickling). Slot
+# allocation is locked, but code building players on worker threads should
+# still give them a StatStore of their own so their counters aren't shared
+default_store = StatStore()
+
+def slots_by_store(players):
+    """{store: [slots]} for a group of players, for bulk store operations"""
+    groups = {}
+    for player in players:
+        groups.setdefault(player.stat_store, []).append(player.stat_slot)
+    return groups
+
+def reset_players(players, phases=PHASES):
+    for store, slots in slots_by_store(players).items():
+        store.reset(phases, slots)
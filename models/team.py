@@ -1,51 +1,164 @@
 from typing import List
 from models.player import Player
+from models.stat_store import reset_players, REGULAR, MATCH
+from models.team_record import TeamRecord, RECORD_FIELDS
+from models.snapshot import TeamSnapshot
+from operator import attrgetter
+
+_rating_version = attrgetter('rating_version')
+
+def _invalidating(method):
+    def wrapper(self, *args):
+        self._index = self._averages = self._weights = None
+        self._edits = -1  # Membership changed: re-sum the rating versions on the next check
+        return method(self, *args)
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+class Roster(list):
+    """Team.players: a list of players that keeps a position index, average
+    ratings and pick weights, rebuilt on first use after the roster changes.
+
+    List mutations invalidate the cache, and so does a rating or position
+    change of one of its players (their rating_version). Lookups return
+    shared tuples.
+    """
+    __slots__ = ('_index', '_averages', '_weights', '_edits', '_version')
+
+    def __init__(self, players=()):
+        super().__init__(players)
+        self._index = self._averages = self._weights = None
+        self._edits = Player.rating_edits
+        self._version = sum(map(_rating_version, self))
+
+    def _check_ratings(self):
+        # Versions only grow, so their sum changes iff one of ours was edited;
+        # the sum is only taken after some player somewhere was edited
+        if self._edits != Player.rating_edits:
+            self._edits = Player.rating_edits
+            version = sum(map(_rating_version, self))
+            if version != self._version:
+                self._index = self._averages = self._weights = None
+                self._version = version
+
+    append = _invalidating(list.append)
+    extend = _invalidating(list.extend)
+    insert = _invalidating(list.insert)
+    remove = _invalidating(list.remove)
+    pop = _invalidating(list.pop)
+    clear = _invalidating(list.clear)
+    sort = _invalidating(list.sort)
+    reverse = _invalidating(list.reverse)
+    __setitem__ = _invalidating(list.__setitem__)
+    __delitem__ = _invalidating(list.__delitem__)
+    __iadd__ = _invalidating(list.__iadd__)
+    __imul__ = _invalidating(list.__imul__)
+
+    def __reduce__(self):
+        return (Roster, (list(self),))
+
+    def by_position(self, position):
+        """Players of one position, in roster order"""
+        return self.with_positions((position,))
+
+    def with_positions(self, positions):
+        """Players whose position is in `positions`, in roster order"""
+        self._check_ratings()
+        if self._index is None:
+            self._index = {}
+        key = tuple(positions)
+        players = self._index.get(key)
+        if players is None:
+            players = self._index[key] = tuple(player for player in self if player.position in key)
+        return players
+
+    def average(self, rating, positions):
+        """Mean `rating` of the players in `positions` (0 if there are none)"""
+        self._check_ratings()
+        if self._averages is None:
+            self._averages = {}
+        key = (rating, tuple(positions))
+        value = self._averages.get(key)
+        if value is None:
+            players = self.with_positions(key[1])
+            value = self._averages[key] = sum(getattr(player, rating) for player in players) / max(len(players), 1)
+        return value
+
+    def pick_weights(self, rating, positions=None):
+        """(players, weights) for a weighted random pick among `positions`
+        (everyone if None): `rating` scaled by stamina, goalies at 5%"""
+        self._check_ratings()
+        if self._weights is None:
+            self._weights = {}
+        key = (rating, None if positions is None else tuple(positions))
+        entry = self._weights.get(key)
+        if entry is None:
+            players = tuple(self) if positions is None else self.with_positions(key[1])
+            weights = []
+            for player in players:
+                weight = getattr(player, rating) * (player.stamina / 100)
+                if player.position == "Goalie":
+                    weight *= 0.05
+                weights.append(weight)
+            entry = self._weights[key] = (players, tuple(weights))
+        return entry
+
+def _record_property(field):
+    """Team attribute view over one count of the team's TeamRecord"""
+    def fget(self):
+        return getattr(self.record, field)
+
+    def fset(self, value):
+        self.record.update(**{field: value})
+
+    return property(fget, fset)
 
 class Team:
+    __slots__ = ('name', '_players', 'record')
+
     def __init__(self, name: str, players: List[Player]):
         self.name = name
         self.players = players
-        # Team record stats
-        self.wins = 0
-        self.losses = 0
-        self.overtime_losses = 0  # New stat
-        self.goals_for = 0
-        self.goals_against = 0
+        # Team record stats (wins, losses, overtime_losses, goals_for,
+        # goals_against are properties over it)
+        self.record = TeamRecord()
+
+    @property
+    def players(self) -> Roster:
+        return self._players
 
+    @players.setter
+    def players(self, players):
+        self._players = players if isinstance(players, Roster) else Roster(players)
+
+    @property
     def points(self) -> int:
-        return self.wins * 2 + self.overtime_losses
+        return self.record.points
+
+    @property
+    def goalies(self):
+        return self._players.by_position("Goalie")
 
     def get_goalie(self):
         """Get the team's goalie"""
-        for player in self.players:
-            if player.position == "Goalie":
-                return player
-        return None
+        goalies = self._players.by_position("Goalie")
+        return goalies[0] if goalies else None
 
     def get_players_by_position(self, position: str):
         """Get all players of a specific position"""
-        return [player for player in self.players if player.position == position]
+        return list(self._players.by_position(position))
+
+    def snapshot(self) -> TeamSnapshot:
+        """Frozen roster and ratings, hashable as a cache key and cheap to pickle"""
+        return TeamSnapshot.of(self)
 
     def reset_stats(self):
         """Reset all team and player stats"""
-        self.wins = 0
-        self.losses = 0
-        self.overtime_losses = 0
-        self.goals_for = 0
-        self.goals_against = 0
-
-        for player in self.players:
-            # Reset existing stats
-            player.goals = 0
-            player.assists = 0
-            player.saves = 0
-            player.player_of_match = 0
-
-            # Reset NEW stats
-            player.games_played = 0
-            if player.position == "Goalie":
-                player.goals_against = 0
-                player.minutes_played = 0
-
-            # Reset match stats
-            player.reset_match_stats()
+        self.record.reset()
+
+        # Regular season and match counters of the whole roster, in bulk
+        reset_players(self.players, (REGULAR, MATCH))
+
+for _field in RECORD_FIELDS:
+    setattr(Team, _field, _record_property(_field))
+del _field
@@ -0,0 +1,72 @@
+RECORD_FIELDS = ('wins', 'losses', 'overtime_losses', 'goals_for', 'goals_against')
+DERIVED_FIELDS = ('games_played', 'points', 'goal_diff', 'win_pct')
+
+WIN = 'win'
+LOSS = 'loss'
+OVERTIME_LOSS = 'overtime_loss'
+
+def game_result(scored, allowed, overtime=False):
+    """WIN, LOSS or OVERTIME_LOSS from one team's side of a game (None for a tie)"""
+    if scored > allowed:
+        return WIN
+    if scored < allowed:
+        return OVERTIME_LOSS if overtime else LOSS
+    return None
+
+class TeamRecord:
+    """A team's win/loss record. The derived columns (games played, points,
+    goal diff, win %) are updated along with the counts, so reading or
+    sorting by them is O(1) per team.
+    """
+    __slots__ = RECORD_FIELDS + DERIVED_FIELDS
+
+    def __init__(self, wins=0, losses=0, overtime_losses=0, goals_for=0, goals_against=0):
+        self.wins = wins
+        self.losses = losses
+        self.overtime_losses = overtime_losses
+        self.goals_for = goals_for
+        self.goals_against = goals_against
+        self._update_derived()
+
+    def apply(self, scored, allowed, result, sign=1):
+        """Add (sign=1) or remove (sign=-1) one game"""
+        self.goals_for += sign * scored
+        self.goals_against += sign * allowed
+        if result == WIN:
+            self.wins += sign
+        elif result == LOSS:
+            self.losses += sign
+        elif result == OVERTIME_LOSS:
+            self.overtime_losses += sign
+        self._update_derived()
+
+    def update(self, **fields):
+        """Overwrite some of the counts (e.g. when loading a save)"""
+        for field, value in fields.items():
+            if field not in RECORD_FIELDS:
+                raise AttributeError(f"'{field}' is not a team record field")
+            setattr(self, field, value)
+        self._update_derived()
+
+    def reset(self):
+        self.update(**dict.fromkeys(RECORD_FIELDS, 0))
+
+    def sort_key(self):
+        """Ascending sort key, best first: points, goal differential, wins"""
+        return (-self.points, -self.goal_diff, -self.wins)
+
+    def counts(self):
+        return {field: getattr(self, field) for field in RECORD_FIELDS}
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in RECORD_FIELDS + DERIVED_FIELDS}
+
+    def _update_derived(self):
+        self.games_played = self.wins + self.losses + self.overtime_losses
+        self.points = self.wins * 2 + self.overtime_losses
+        self.goal_diff = self.goals_for - self.goals_against
+        self.win_pct = self.wins / self.games_played * 100 if self.games_played > 0 else 0
+
+    def __repr__(self):
+        return (f"TeamRecord({self.wins}-{self.losses}-{self.overtime_losses}, "
+                f"{self.points} pts, GF {self.goals_for}, GA {self.goals_against})")
@@ -1,11 +1,12 @@
 from typing import List
 from models import team, player
 from models.match import simulate_match
-import csv
+from utils.stats_exporter import player_team_index, season_rows, export_rows, SEASON_COLUMNS
 from collections import defaultdict
 
 def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
     team_map = {team.name: team for team in teams}
+    team_of = player_team_index(teams)
 
     for week_num, week in enumerate(schedule, 1):
         print(f"=== Week {week_num} ===")
@@ -55,7 +56,7 @@ def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
         for player, score in non_goalies:
             if player.name in shown_names:
                 continue
-            team_name = next((team.name for team in teams if player in team.players), "Unknown")
+            team_name = team_of.get(id(player), "Unknown")
             print(f" * {player.name} ({team_name}) | Score: {score:.1f} [G:{player.goals_match}, A:{player.assists_match}]")
             shown_names.add(player.name)
             count += 1
@@ -69,7 +70,7 @@ def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
         for player, score in goalies:
             if player.name in shown_names:
                 continue
-            team_name = next((team.name for team in teams if player in team.players), "Unknown")
+            team_name = team_of.get(id(player), "Unknown")
             print(f" * {player.name} ({team_name}) | Score: {score:.1f} [Sv:{player.saves_match}] (Goalie)")
             shown_names.add(player.name)
             count += 1
@@ -79,10 +80,11 @@ def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
         print("\n")  # blank line before next week
 
     print("=== Final Standings ===")
-    standings = sorted(teams, key=lambda t: (t.points, t.goals_for - t.goals_against), reverse=True)
+    standings = sorted(teams, key=lambda t: t.record.sort_key())
     print(f"{'Pos':<3} {'Team':<20} {'W':<3} {'OTL':<4} {'L':<3} {'GF':<4} {'GA':<4} {'Pts':<4}")
     for i, team in enumerate(standings, 1):
-        print(f"{i:<3} {team.name:<20} {team.wins:<3} {team.overtime_losses:<4} {team.losses:<3} {team.goals_for:<4} {team.goals_against:<4} {team.points:<4}")
+        record = team.record
+        print(f"{i:<3} {team.name:<20} {record.wins:<3} {record.overtime_losses:<4} {record.losses:<3} {record.goals_for:<4} {record.goals_against:<4} {record.points:<4}")
 
     # === Post-Season Stats ===
     print("\n=== Player Stats ===")
@@ -95,7 +97,7 @@ def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
     print(f"{'Player':<25} {'Team':<20} {'Goals':<6} {'Assists':<8} {'Saves':<6} {'POM'}")
     for player in all_players:
         if player.goals > 0 or player.assists > 0 or player.saves > 0 or player.player_of_match > 0:
-            team_name = next((team.name for team in teams if player in team.players), "Unknown")
+            team_name = team_of.get(id(player), "Unknown")
             print(f"{player.name:<25} {team_name:<20} {player.goals:<6} {player.assists:<8} {player.saves:<6} {player.player_of_match}")
 
     # === Export to CSV ===
@@ -107,7 +109,7 @@ def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
 
     print("\n=== Top 10 Players (MVP Candidates - Non-Goalies) ===")
     for i, player in enumerate(non_goalie_players[:10], 1):
-        team_name = next((team.name for team in teams if player in team.players), "Unknown")
+        team_name = team_of.get(id(player), "Unknown")
         score = player.goals * 4 + player.assists * 3 + player.saves * 0.5 + player.player_of_match * 5
         print(f"{i}. {player.name} ({team_name}) - {score:.1f} pts [G:{player.goals}, A:{player.assists}, Sv:{player.saves}, POM:{player.player_of_match}]")
 
@@ -117,24 +119,10 @@ def simulate_season(schedule: List[List[tuple]], teams: List[team]) -> None:
 
     print("\n=== Top 5 Goalies (MVP Candidates) ===")
     for i, player in enumerate(goalies[:5], 1):
-        team_name = next((team.name for team in teams if player in team.players), "Unknown")
+        team_name = team_of.get(id(player), "Unknown")
         score = player.goals * 4 + player.assists * 3 + player.saves * 0.5 + player.player_of_match * 5
         print(f"{i}. {player.name} ({team_name}) - {score:.1f} pts [G:{player.goals}, A:{player.assists}, Sv:{player.saves}, POM:{player.player_of_match}]")
 
 def export_player_stats_csv(players: List[player], teams: List[team], filename="player_stats.csv"):
-    with open(filename, "w", newline="") as csvfile:
-        fieldnames = ["Player", "Team", "Position", "Goals", "Assists", "Saves", "Player of Match"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for player in players:
-            team_name = next((team.name for team in teams if player in team.players), "Unknown")
-            writer.writerow({
-                "Player": player.name,
-                "Team": team_name,
-                "Position": player.position,
-                "Goals": player.goals,
-                "Assists": player.assists,
-                "Saves": player.saves,
-                "Player of Match": player.player_of_match,
-            })
+    # Same columns as the GUI export: a regular season and a playoff line per player
+    export_rows(filename, SEASON_COLUMNS, season_rows(teams, players=players))
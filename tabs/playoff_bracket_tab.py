@@ -30,6 +30,8 @@ class PlayoffBracketTab:
 
     def update_display(self):
         """Update the playoff bracket display"""
+        if self.main_gui.is_simulating():
+            return
         self.bracket_text.delete(1.0, tk.END)
 
         if not hasattr(self.main_gui, 'playoff_schedule') or not self.main_gui.playoff_schedule:
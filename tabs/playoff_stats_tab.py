@@ -93,6 +93,8 @@ class PlayoffStatsTab:
 
     def update_display(self):
         """Update all playoff statistics"""
+        if self.main_gui.is_simulating():
+            return
         self._update_player_stats()
         self._update_team_stats()
         self._update_game_results()
@@ -106,6 +108,17 @@ class PlayoffStatsTab:
         if not hasattr(self.main_gui, 'teams') or not self.main_gui.teams:
             return
 
+        # Let the league store filter and sort when it is available
+        league_store = getattr(self.main_gui, 'league_store', None)
+        if league_store is not None and league_store.season_id is not None:
+            rows = league_store.query_player_stats(phase="playoff", sort_by="Points", min_games=1)
+            for row in rows:
+                self.player_tree.insert('', 'end', values=(
+                    row['name'], row['team'], row['position'], row['games'], row['goals'],
+                    row['assists'], row['points'], row['saves'] or 0
+                ))
+            return
+
         # Get playoff teams and their players with playoff stats
         playoff_players = []
         for team in self.main_gui.teams:
@@ -84,6 +84,8 @@ class RosterTab:
         self.display_team_roster()
 
     def display_team_roster(self, event=None):
+        if self.main_gui.is_simulating():
+            return
         selected_team = self.team_combobox.get()
         if not selected_team:
             return
@@ -171,6 +171,8 @@ class ScheduleTab:
 
     def update_display(self, event=None):
         """Update the schedule display with filtering"""
+        if self.main_gui.is_simulating():
+            return
         # Clear existing items
         for item in self.schedule_tree.get_children():
             self.schedule_tree.delete(item)
@@ -1,9 +1,15 @@
+import queue
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
+from utils.simulation_worker import SimulationWorker
 
 class SimulationTab:
+    POLL_INTERVAL_MS = 50
+
     def __init__(self, notebook, main_gui):
         self.main_gui = main_gui
+        self.worker = None
+        self.running = False
         self.setup_tab(notebook)
 
     def setup_tab(self, notebook):
@@ -35,6 +41,10 @@ class SimulationTab:
                                        command=self.simulate_entire_season)
         self.sim_season_btn.pack(side=tk.LEFT, padx=5)
 
+        self.cancel_btn = ttk.Button(button_frame, text="Cancel Simulation",
+                                     command=self.cancel_simulation, state="disabled")
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+
         # Recent games display
         recent_frame = ttk.LabelFrame(sim_frame, text="Recent Games", padding=10)
         recent_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -51,7 +61,8 @@ class SimulationTab:
                 return
 
             # Simulate the week
-            results_text = self.main_gui.game_simulator.simulate_next_week()
+            week_result = self.main_gui.game_simulator.simulate_next_week()
+            results_text = self.main_gui.game_simulator.render_week(week_result)
 
             if results_text:
                 self.recent_games_text.delete(1.0, tk.END)
@@ -70,32 +81,115 @@ class SimulationTab:
             self.update_display()
             if hasattr(self.main_gui, 'update_all_displays'):
                 self.main_gui.update_all_displays()
+            self._request_autosave()
 
         except Exception as e:
             print(f"Error in simulate_next_week: {e}")
             messagebox.showerror("Simulation Error", f"Error simulating week: {str(e)}")
 
     def simulate_entire_season(self):
-        """Simulate the entire remaining season with error handling"""
+        """Simulate the entire remaining season on a background worker"""
         try:
             if hasattr(self.main_gui, 'season_complete') and self.main_gui.season_complete:
                 messagebox.showinfo("Season Complete", "The season has already been completed!")
                 return
 
+            if self.worker is not None and self.worker.is_running():
+                return
+
             result = messagebox.askyesno("Confirm", "Are you sure you want to simulate the entire remaining season?")
             if result:
-                week_count = self.main_gui.game_simulator.simulate_entire_season()
-                messagebox.showinfo("Season Complete", f"Season simulation completed in {week_count} weeks!")
-
-                # Update displays
-                self.update_display()
-                if hasattr(self.main_gui, 'update_all_displays'):
-                    self.main_gui.update_all_displays()
+                self.worker = SimulationWorker(self.main_gui)
+                self._set_running(True)
+                self.worker.start_season()
+                self.main_gui.root.after(self.POLL_INTERVAL_MS, self._poll_worker)
 
         except Exception as e:
             print(f"Error in simulate_entire_season: {e}")
+            self._set_running(False)
             messagebox.showerror("Simulation Error", f"Error during season simulation: {str(e)}")
 
+    def cancel_simulation(self):
+        """Stop the background simulation after the current week"""
+        if self.worker is not None and self.worker.is_running():
+            self.worker.cancel()
+            self.cancel_btn.config(state="disabled")
+            self.main_gui.status_var.set("Cancelling simulation...")
+
+    def is_simulating(self):
+        """True while the background worker owns the league state, until its final event is handled"""
+        return self.running
+
+    def _set_running(self, running):
+        """Enable/disable controls while the worker owns the league state"""
+        self.running = running
+        self.sim_week_btn.config(state="disabled" if running else "normal")
+        self.sim_season_btn.config(state="disabled" if running else "normal")
+        self.cancel_btn.config(state="normal" if running else "disabled")
+        # File menu actions read or replace the teams, schedule and standings too
+        menu_manager = getattr(self.main_gui, 'menu_manager', None)
+        if menu_manager is not None:
+            menu_manager.set_league_actions_enabled(not running)
+
+    def _poll_worker(self):
+        """Drain worker events on the Tk main thread"""
+        last_week_result = None
+        done_event = None
+
+        try:
+            while True:
+                event = self.worker.events.get_nowait()
+                kind = event[0]
+
+                if kind == "week":
+                    _, week, last_week_result = event
+                    self.week_label.config(text=f"Current Week: {week}")
+                    self.season_progress['value'] = week
+                    self._update_progress_label()
+                elif kind == "status":
+                    self.main_gui.status_var.set(event[1])
+                elif kind == "show_playoff_tabs":
+                    if hasattr(self.main_gui, 'tab_manager'):
+                        self.main_gui.tab_manager.show_playoff_tabs()
+                else:
+                    done_event = event
+                    break
+        except queue.Empty:
+            pass
+
+        if last_week_result:
+            self.recent_games_text.delete(1.0, tk.END)
+            self.recent_games_text.insert(tk.END, self.main_gui.game_simulator.render_week(last_week_result))
+
+        if done_event is None:
+            self.main_gui.root.after(self.POLL_INTERVAL_MS, self._poll_worker)
+            return
+
+        self._finish_worker(done_event)
+
+    def _finish_worker(self, done_event):
+        """Apply final state to the widgets once the worker has stopped"""
+        self._set_running(False)
+        self.update_display()
+        if hasattr(self.main_gui, 'update_all_displays'):
+            self.main_gui.update_all_displays()
+        self._request_autosave()
+
+        kind = done_event[0]
+        if kind == "finished":
+            messagebox.showinfo("Season Complete", f"Season simulation completed in {done_event[1]} weeks!")
+        elif kind == "cancelled":
+            self.main_gui.status_var.set(f"Simulation cancelled after {done_event[1]} weeks")
+        elif kind == "error":
+            print(f"Error in simulate_entire_season: {done_event[1]}")
+            messagebox.showerror("Simulation Error", f"Error during season simulation: {done_event[1]}")
+
+    def _request_autosave(self):
+        """Queue a background autosave of the state just simulated"""
+        data_manager = getattr(self.main_gui, 'data_manager', None)
+        if data_manager is not None:
+            data_manager.auto_save()
+
     def _update_progress_label(self):
         """Update the progress label with detailed season info"""
         try:
@@ -77,6 +77,8 @@ class StandingsTab:
 
     def update_display(self, event=None):
         """Update the standings display with filtering and sorting"""
+        if self.main_gui.is_simulating():
+            return
         for item in self.standings_tree.get_children():
             self.standings_tree.delete(item)
 
@@ -84,38 +86,20 @@ class StandingsTab:
         selected_division = self.division_combobox.get()
         sort_by = self.sort_combobox.get()
 
-        # Collect team data
+        # Collect team data from the standings engine (derived columns are kept up to date there)
+        engine = self.main_gui.game_simulator.standings_engine
         team_data = []
-        for team in self.main_gui.teams:
-            team_conference = self.main_gui.get_team_conference(team.name)
-            team_division = self.main_gui.get_team_division(team.name)
+        for data in engine.get_rows():
+            team_division = self.main_gui.get_team_division(data['name'])
 
             # Apply filters
-            if selected_conference != "All Conferences" and team_conference != selected_conference:
+            if selected_conference != "All Conferences" and data['conference'] != selected_conference:
                 continue
             if selected_division != "All Divisions" and team_division != selected_division:
                 continue
 
-            # Calculate stats
-            games_played = team.wins + team.losses + getattr(team, 'overtime_losses', 0)
-            win_percentage = (team.wins / games_played * 100) if games_played > 0 else 0
-            goal_diff = team.goals_for - team.goals_against
-            points = team.wins * 2 + getattr(team, 'overtime_losses', 0)
-
-            team_data.append({
-                'name': team.name,
-                'conference': team_conference,
-                'division': team_division,
-                'games_played': games_played,
-                'wins': team.wins,
-                'losses': team.losses,
-                'overtime_losses': getattr(team, 'overtime_losses', 0),
-                'points': points,
-                'goals_for': team.goals_for,
-                'goals_against': team.goals_against,
-                'goal_diff': goal_diff,
-                'win_pct': win_percentage
-            })
+            data['division'] = team_division
+            team_data.append(data)
 
         # Sort the data
         if sort_by == "Points":
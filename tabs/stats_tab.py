@@ -190,6 +190,8 @@ class StatsTab:
 
     def update_display(self, event=None):
         """Update the player stats display with filtering and sorting"""
+        if self.main_gui.is_simulating():
+            return  # Redrawn when the worker finishes
         for item in self.stats_tree.get_children():
             self.stats_tree.delete(item)
 
@@ -206,6 +208,15 @@ class StatsTab:
         except ValueError:
             min_value = 0
 
+        # Filter and sort in SQL when the league store is available
+        league_store = getattr(self.main_gui, 'league_store', None)
+        if league_store is not None and league_store.season_id is not None:
+            player_data = self._query_player_data(league_store, selected_conference, selected_division,
+                                                  selected_team, selected_position, sort_by,
+                                                  sort_order, min_value)
+            self._insert_rows(player_data)
+            return
+
         # Collect all player data
         player_data = []
         for team in self.main_gui.teams:
@@ -313,7 +324,40 @@ class StatsTab:
         elif sort_by == "Games":
             player_data.sort(key=lambda x: x['games'], reverse=reverse_sort)
 
-        # Display sorted and filtered data
+        self._insert_rows(player_data)
+
+    def _query_player_data(self, league_store, conference, division, team, position,
+                           sort_by, sort_order, min_value):
+        """Get filtered and sorted rows from the league store"""
+        rows = league_store.query_player_stats(
+            conference=None if conference == "All Conferences" else conference,
+            division=None if division == "All Divisions" else division,
+            team=None if team == "All Teams" else team,
+            position=None if position == "All Positions" else position,
+            sort_by=sort_by,
+            descending=sort_order == "Highest First",
+            min_value=min_value
+        )
+
+        player_data = []
+        for row in rows:
+            is_goalie = row['position'] == "Goalie"
+            player_data.append({
+                'name': row['name'],
+                'team': row['team'],
+                'position': row['position'],
+                'games': row['games'],
+                'goals': row['goals'],
+                'assists': row['assists'],
+                'points': row['points'],
+                'saves': row['saves'] if is_goalie else "-",
+                'save_pct_display': f"{row['save_pct']:.1f}%" if is_goalie else "-",
+                'gaa_display': f"{row['gaa']:.2f}" if is_goalie else "-"
+            })
+        return player_data
+
+    def _insert_rows(self, player_data):
+        """Display sorted and filtered data"""
         for data in player_data:
             self.stats_tree.insert("", tk.END, values=(
                 data['name'],
@@ -0,0 +1,116 @@
+import gzip
+import os
+import queue
+import threading
+import time
+
+class BackgroundAutosaver:
+    """Writes autosaves on a worker thread so the Tk thread never waits on disk.
+
+    request_save() runs `capture` on the calling (main) thread - it should
+    only copy plain data - and hands the snapshot to the worker, which runs
+    `serialize`, gzip-compresses the bytes and writes them to a temp file
+    that is renamed over `path`. If saves are requested faster than they
+    can be written, only the newest waiting snapshot is written.
+
+    Outcomes are posted to `status` as tuples for the GUI to drain without
+    blocking or popping dialogs:
+
+        ("saved", path, seconds, coalesced_count)
+        ("error", message)
+    """
+
+    def __init__(self, path, capture, serialize, compresslevel=6):
+        self.path = path
+        self.capture = capture
+        self.serialize = serialize
+        self.compresslevel = compresslevel
+        self.status = queue.Queue()
+        self._pending = None
+        self._coalesced = 0
+        self._writing = False
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def request_save(self):
+        """Snapshot now and queue the write. Returns immediately"""
+        snapshot = self.capture()
+        with self._condition:
+            if self._pending is not None:
+                self._coalesced += 1
+            self._pending = snapshot
+            self._ensure_thread()
+            self._condition.notify()
+
+    def is_busy(self):
+        with self._condition:
+            return self._writing or self._pending is not None
+
+    def wait(self, timeout=None):
+        """Block until every requested save has been written (for shutdown)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._writing or self._pending is not None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self):
+        """Finish any waiting save, then let the worker exit"""
+        self.wait()
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def poll_status(self):
+        """Status events posted since the last poll"""
+        events = []
+        while True:
+            try:
+                events.append(self.status.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                snapshot, self._pending = self._pending, None
+                coalesced, self._coalesced = self._coalesced, 0
+                self._writing = True
+
+            try:
+                started = time.perf_counter()
+                self._write(snapshot)
+                self.status.put(("saved", self.path, time.perf_counter() - started, coalesced))
+            except Exception as e:
+                self.status.put(("error", str(e)))
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _write(self, snapshot):
+        data = gzip.compress(self.serialize(snapshot), compresslevel=self.compresslevel)
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
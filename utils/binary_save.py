@@ -0,0 +1,308 @@
+import json
+import struct
+import zlib
+from datetime import datetime
+from operator import attrgetter
+from models.player import Player
+from models.team import Team
+from models.stat_store import StatStore
+from utils.league_state import PLAYER_STAT_FIELDS, TEAM_RECORD_FIELDS, SCHEMA_VERSION, baseline_standings
+
+# File layout
+#
+#   header          magic, format version, section count
+#   section table   one (name, flags, offset, length) entry per section
+#   sections        META  - JSON league info (small)
+#                   STRS  - string table, every name/date/round stored once
+#                   STND  - fixed-width team records (standings)
+#                   TEAM  - fixed-width team -> player range records
+#                   PLYR  - fixed-width player records
+#                   SCHD  - fixed-width regular season game records
+#                   PLOF  - fixed-width playoff game records
+#
+# Readers only need the header and section table to find any section, so
+# metadata and standings can be shown without touching rosters or games.
+# Bulk sections are zlib-compressed (flagged per section in the table).
+#
+# Version 2 widened player stats from uint16 to uint32; version 1 files are
+# still read with PLAYER_RECORD_V1.
+
+MAGIC = b"LXSV"
+FORMAT_VERSION = 2
+EXTENSION = ".lxs"
+
+HEADER = struct.Struct("<4sHH")
+SECTION_ENTRY = struct.Struct("<4sHQQ")  # name, flags, offset, length
+SECTION_COMPRESSED = 0x1
+STRING_LENGTH = struct.Struct("<H")
+COUNT = struct.Struct("<I")
+
+STANDINGS_RECORD = struct.Struct("<I" + "i" * len(TEAM_RECORD_FIELDS))
+TEAM_RECORD = struct.Struct("<III")  # name, first player index, player count
+PLAYER_RECORD = struct.Struct("<II4B" + "I" * len(PLAYER_STAT_FIELDS))
+PLAYER_RECORD_V1 = struct.Struct("<II4B" + "H" * len(PLAYER_STAT_FIELDS))
+GAME_RECORD = struct.Struct("<HIIIhhBII")  # week, date, home, away, scores, completed, round, series_id
+
+NO_VALUE = -1          # Unplayed scores
+NO_STAT = 0xFFFFFFFF   # None stats (goalie-only fields on skaters)
+NO_STAT_V1 = 0xFFFF
+NO_STRING = 0xFFFFFFFF
+
+class _StringTable:
+    def __init__(self):
+        self.strings = []
+        self.index = {}
+
+    def add(self, value):
+        if value is None:
+            return NO_STRING
+        position = self.index.get(value)
+        if position is None:
+            position = len(self.strings)
+            self.strings.append(value)
+            self.index[value] = position
+        return position
+
+    def to_bytes(self):
+        parts = [COUNT.pack(len(self.strings))]
+        for value in self.strings:
+            encoded = value.encode('utf-8')
+            parts.append(STRING_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+
+def write_binary_save(filepath, main_gui):
+    """Write the league to a compact binary save file"""
+    strings = _StringTable()
+    add_string = strings.add
+    get_ratings = attrgetter('shooting', 'passing', 'defense', 'stamina')
+    get_stats = attrgetter(*PLAYER_STAT_FIELDS)
+
+    team_records = []
+    standings_records = []
+    player_records = []
+    for team in main_gui.teams:
+        name_index = add_string(team.name)
+        team_records.append(TEAM_RECORD.pack(name_index, len(player_records), len(team.players)))
+        standings_records.append(STANDINGS_RECORD.pack(
+            name_index, *[getattr(team, field, 0) for field in TEAM_RECORD_FIELDS]))
+
+        for player in team.players:
+            stats = get_stats(player)
+            if None in stats:
+                stats = [NO_STAT if value is None else value for value in stats]
+            player_records.append(PLAYER_RECORD.pack(
+                add_string(player.name), add_string(player.position),
+                *get_ratings(player), *stats
+            ))
+
+    schedule = getattr(main_gui, 'schedule', [])
+    playoff_schedule = getattr(main_gui, 'playoff_schedule', [])
+    metadata = {
+        'save_date': datetime.now().isoformat(),
+        'version': FORMAT_VERSION,
+        'teams_names': main_gui.teams_names,
+        'divisions': main_gui.divisions,
+        'league_id': getattr(main_gui, 'league_id', None),
+        'season_key': getattr(main_gui, 'season_key', None),
+        'current_week': getattr(main_gui, 'current_week', 0),
+        'season_complete': getattr(main_gui, 'season_complete', False),
+        'team_count': len(team_records),
+        'player_count': len(player_records),
+        'game_count': len(schedule),
+        'playoff_game_count': len(playoff_schedule)
+    }
+
+    sections = [
+        (b"META", 0, json.dumps(metadata, separators=(',', ':')).encode('utf-8')),
+        (b"STND", 0, b"".join(standings_records)),
+        (b"TEAM", 0, b"".join(team_records)),
+        (b"PLYR", SECTION_COMPRESSED, b"".join(player_records)),
+        (b"SCHD", SECTION_COMPRESSED, _pack_games(schedule, strings)),
+        (b"PLOF", SECTION_COMPRESSED, _pack_games(playoff_schedule, strings)),
+    ]
+    # The string table is built while packing the other sections, so add it last
+    sections.insert(1, (b"STRS", SECTION_COMPRESSED, strings.to_bytes()))
+    sections = [(name, flags, zlib.compress(data, 1) if flags & SECTION_COMPRESSED else data)
+                for name, flags, data in sections]
+
+    offset = HEADER.size + SECTION_ENTRY.size * len(sections)
+    table = []
+    for name, flags, data in sections:
+        table.append(SECTION_ENTRY.pack(name, flags, offset, len(data)))
+        offset += len(data)
+
+    with open(filepath, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(sections)))
+        f.write(b"".join(table))
+        for _, _, data in sections:
+            f.write(data)
+
+    return filepath
+
+def _pack_games(games, strings):
+    records = []
+    for game in games:
+        home_score = game.get('home_score')
+        away_score = game.get('away_score')
+        records.append(GAME_RECORD.pack(
+            game.get('week', 0),
+            strings.add(game.get('date')),
+            strings.add(game.get('home_team')),
+            strings.add(game.get('away_team')),
+            NO_VALUE if home_score is None else home_score,
+            NO_VALUE if away_score is None else away_score,
+            1 if game.get('completed', False) else 0,
+            strings.add(game.get('round')),
+            strings.add(game.get('series_id'))
+        ))
+    return b"".join(records)
+
+class BinarySaveReader:
+    """Reads sections of a binary save on demand.
+
+    Opening a reader only parses the header and section table; each read_*
+    method seeks to its own section.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.sections = {}
+        self._strings = None
+
+        with open(filepath, 'rb') as f:
+            magic, version, section_count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{filepath} is not a binary league save")
+            if version > FORMAT_VERSION:
+                raise ValueError(f"Save format version {version} is newer than supported ({FORMAT_VERSION})")
+            self.version = version
+
+            table = f.read(SECTION_ENTRY.size * section_count)
+            for name, flags, offset, length in SECTION_ENTRY.iter_unpack(table):
+                self.sections[name.decode('ascii')] = (flags, offset, length)
+
+    def _read_section(self, name):
+        if name not in self.sections:
+            return b""
+        flags, offset, length = self.sections[name]
+        with open(self.filepath, 'rb') as f:
+            f.seek(offset)
+            data = f.read(length)
+        if flags & SECTION_COMPRESSED:
+            data = zlib.decompress(data)
+        return data
+
+    @property
+    def strings(self):
+        if self._strings is None:
+            data = self._read_section("STRS")
+            (count,) = COUNT.unpack_from(data, 0)
+            position = COUNT.size
+            strings = []
+            for _ in range(count):
+                (length,) = STRING_LENGTH.unpack_from(data, position)
+                position += STRING_LENGTH.size
+                strings.append(data[position:position + length].decode('utf-8'))
+                position += length
+            self._strings = strings
+        return self._strings
+
+    def _string(self, index):
+        return None if index == NO_STRING else self.strings[index]
+
+    def read_metadata(self):
+        return json.loads(self._read_section("META").decode('utf-8'))
+
+    def read_standings(self):
+        """Team records keyed by team name, without loading any players"""
+        standings = {}
+        for record in STANDINGS_RECORD.iter_unpack(self._read_section("STND")):
+            standings[self._string(record[0])] = dict(zip(TEAM_RECORD_FIELDS, record[1:]))
+        return standings
+
+    def _player_rows(self):
+        """Player records as (name, position, ratings..., stats...) with None stats restored"""
+        player_record, no_stat = (PLAYER_RECORD, NO_STAT) if self.version >= 2 else (PLAYER_RECORD_V1, NO_STAT_V1)
+        return [[self._string(row[0]), self._string(row[1]), *row[2:6],
+                 *(None if value == no_stat else value for value in row[6:])]
+                for row in player_record.iter_unpack(self._read_section("PLYR"))]
+
+    def read_teams(self):
+        """Build Team and Player objects from the roster sections"""
+        standings = self.read_standings()
+        player_rows = self._player_rows()
+
+        teams = []
+        stat_store = StatStore()
+        for name_index, first, count in TEAM_RECORD.iter_unpack(self._read_section("TEAM")):
+            players = []
+            for row in player_rows[first:first + count]:
+                player = Player(*row[:6], stat_store)
+                for field, value in zip(PLAYER_STAT_FIELDS, row[6:]):
+                    setattr(player, field, value)
+                players.append(player)
+
+            team_name = self._string(name_index)
+            team = Team(team_name, players)
+            team.record.update(**standings.get(team_name, {}))
+            teams.append(team)
+        return teams
+
+    def read_state(self):
+        """The whole save as a capture_state() dict, for restore_state (no Team objects are built)"""
+        metadata = self.read_metadata()
+        standings = self.read_standings()
+        player_rows = self._player_rows()
+        teams = []
+        for name_index, first, count in TEAM_RECORD.iter_unpack(self._read_section("TEAM")):
+            name = self._string(name_index)
+            record = standings.get(name, {})
+            teams.append({
+                'name': name,
+                'record': [record.get(field, 0) for field in TEAM_RECORD_FIELDS],
+                'players': player_rows[first:first + count]
+            })
+
+        return {
+            'schema_version': SCHEMA_VERSION,
+            'league_info': {
+                'teams_names': metadata.get('teams_names', []),
+                'divisions': metadata.get('divisions', {}),
+                'league_id': metadata.get('league_id'),
+                'season_key': metadata.get('season_key')
+            },
+            'current_week': metadata.get('current_week', 0),
+            'season_complete': metadata.get('season_complete', False),
+            'teams': teams,
+            'schedule': self.read_schedule(),
+            'playoff_schedule': self.read_playoff_schedule(),
+            # Binary saves keep no standings events; the team records are the baseline
+            'standings': baseline_standings(teams),
+            'rng_state': None
+        }
+
+    def read_schedule(self):
+        return self._unpack_games(self._read_section("SCHD"))
+
+    def read_playoff_schedule(self):
+        return self._unpack_games(self._read_section("PLOF"))
+
+    def _unpack_games(self, data):
+        games = []
+        for week, date, home, away, home_score, away_score, completed, round_index, series_index in GAME_RECORD.iter_unpack(data):
+            game = {
+                'week': week,
+                'date': self._string(date),
+                'home_team': self._string(home),
+                'away_team': self._string(away),
+                'home_score': None if home_score == NO_VALUE else home_score,
+                'away_score': None if away_score == NO_VALUE else away_score,
+                'completed': bool(completed)
+            }
+            if round_index != NO_STRING:
+                game['round'] = self._string(round_index)
+            if series_index != NO_STRING:
+                game['series_id'] = self._string(series_index)
+            games.append(game)
+        return games
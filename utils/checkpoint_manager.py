@@ -0,0 +1,108 @@
+import os
+import pickle
+import struct
+import zlib
+from utils.league_state import capture_state, restore_state
+
+class CheckpointManager:
+    """Week-granular checkpoints of the full simulation state.
+
+    Each checkpoint is a small header (magic, format version, week, payload
+    length, CRC32) followed by a pickled capture_state() payload. Files are
+    written to a temp file and renamed into place, so a crash mid-write never
+    leaves a half-written checkpoint that looks valid.
+    """
+
+    MAGIC = b"LXCK"
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<4sHHII")  # magic, version, week, payload length, crc32
+    EXTENSION = ".ckpt"
+
+    def __init__(self, main_gui, directory="checkpoints", keep=3, fsync=False):
+        self.main_gui = main_gui
+        self.directory = directory
+        self.keep = keep
+        self.fsync = fsync
+        self.ensure_directory()
+
+    def ensure_directory(self):
+        """Create checkpoint directory if it doesn't exist"""
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+    def checkpoint_path(self, week):
+        return os.path.join(self.directory, f"week_{week:03d}{self.EXTENSION}")
+
+    def write_checkpoint(self):
+        """Write a checkpoint for the current week and prune old ones"""
+        week = self.main_gui.current_week
+        payload = pickle.dumps(capture_state(self.main_gui), protocol=pickle.HIGHEST_PROTOCOL)
+        header = self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, week,
+                                  len(payload), zlib.crc32(payload))
+
+        path = self.checkpoint_path(week)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+        self._prune()
+        return path
+
+    def read_checkpoint(self, path):
+        """Read and validate a checkpoint, returning its state or None if it is damaged"""
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(self.HEADER.size)
+                if len(header) != self.HEADER.size:
+                    return None
+                magic, version, week, length, crc = self.HEADER.unpack(header)
+                if magic != self.MAGIC or version != self.FORMAT_VERSION:
+                    return None
+                payload = f.read(length)
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                return None
+            return pickle.loads(payload)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            print(f"Error reading checkpoint {path}: {e}")
+            return None
+
+    def list_checkpoints(self):
+        """Checkpoint paths, newest week first"""
+        files = [name for name in os.listdir(self.directory) if name.endswith(self.EXTENSION)]
+        files.sort(reverse=True)
+        return [os.path.join(self.directory, name) for name in files]
+
+    def latest_valid_checkpoint(self):
+        """Return (path, state) for the newest checkpoint that validates, or (None, None)"""
+        for path in self.list_checkpoints():
+            state = self.read_checkpoint(path)
+            if state is not None:
+                return path, state
+        return None, None
+
+    def resume(self):
+        """Restore the newest valid checkpoint. Returns the week resumed from, or None"""
+        path, state = self.latest_valid_checkpoint()
+        if state is None:
+            return None
+        restore_state(self.main_gui, state)
+        return state['current_week']
+
+    def clear(self):
+        """Remove all checkpoints (e.g. when a new season starts)"""
+        for path in self.list_checkpoints():
+            os.remove(path)
+
+    def _prune(self):
+        if self.keep is None:
+            return
+        for path in self.list_checkpoints()[self.keep:]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Error removing old checkpoint {path}: {e}")
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import sys
+import zlib
+from datetime import datetime
+
+# A chunked save is a small manifest (saves/<slot>.lxm) that references
+# content-addressed chunks by SHA-256. Chunks are cut along the lines that
+# stay equal between slots of the same league:
+#
+#   rosters            names, positions and ratings of every team
+#   team_stats         one chunk per team: record and player stat rows
+#   schedule           the regular season without results
+#   week_results       one chunk per week: result fields of that week's games
+#   playoff_schedule   the playoff bracket with results
+#   standings          baseline, plus one chunk of standings events per week
+#   rng_state          random state (the league's own Random, or the random module's)
+#
+# Two slots a few weeks apart share rosters, schedule, every earlier week
+# block and the stat chunks of teams that haven't played since.
+
+MANIFEST_EXTENSION = ".lxm"
+MANIFEST_FORMAT = "lacrosse-chunked"
+MANIFEST_VERSION = 1
+SCHEDULE_KEYS = ('week', 'date', 'home_team', 'away_team')
+RATING_COLUMNS = 6  # name, position, shooting, passing, defense, stamina
+
+class ChunkStore:
+    """Content-addressed, zlib-compressed chunk files under one directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.written = 0  # Chunks actually written by put() (not already stored)
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+    def chunk_path(self, digest):
+        return os.path.join(self.directory, digest[:2], digest[2:])
+
+    def put(self, data):
+        """Store bytes once and return their SHA-256 hex digest"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.chunk_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(zlib.compress(data, 6))
+            os.replace(temp_path, path)
+            self.written += 1
+        return digest
+
+    def get(self, digest):
+        with open(self.chunk_path(digest), 'rb') as f:
+            data = zlib.decompress(f.read())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Chunk {digest} is corrupted")
+        return data
+
+    def put_object(self, value):
+        # Canonical JSON so equal data always hashes the same
+        return self.put(json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8'))
+
+    def get_object(self, digest):
+        return json.loads(self.get(digest).decode('utf-8'))
+
+    def iter_chunks(self):
+        """(digest, path, size) for every stored chunk"""
+        for prefix in os.listdir(self.directory):
+            prefix_path = os.path.join(self.directory, prefix)
+            if len(prefix) != 2 or not os.path.isdir(prefix_path):
+                continue
+            with os.scandir(prefix_path) as scan:
+                for entry in scan:
+                    if entry.is_file() and not entry.name.endswith(".tmp"):
+                        yield prefix + entry.name, entry.path, entry.stat().st_size
+
+def build_manifest(store, state, league_info, summary):
+    """Split a capture_state() dict into chunks and return the manifest"""
+    teams = state['teams']
+    rosters = [{'name': team['name'], 'players': [row[:RATING_COLUMNS] for row in team['players']]}
+               for team in teams]
+    team_stats = [{'record': team['record'], 'players': [row[RATING_COLUMNS:] for row in team['players']]}
+                  for team in teams]
+
+    base_schedule = []
+    week_results = {}
+    for index, game in enumerate(state['schedule']):
+        base_schedule.append({key: game[key] for key in SCHEDULE_KEYS if key in game})
+        result = {key: value for key, value in game.items() if key not in SCHEDULE_KEYS}
+        if result:
+            week_results.setdefault(str(game.get('week')), []).append([index, result])
+
+    week_events = {}
+    for event in state['standings']['events']:
+        week_events.setdefault(str(event.get('week')), []).append(event)
+
+    return {
+        'format': MANIFEST_FORMAT,
+        'version': MANIFEST_VERSION,
+        'save_date': datetime.now().isoformat(),
+        'summary': summary,
+        'league_info': league_info,
+        'current_week': state['current_week'],
+        'season_complete': state['season_complete'],
+        'chunks': {
+            'rosters': store.put_object(rosters),
+            'team_stats': [store.put_object(stats) for stats in team_stats],
+            'schedule': store.put_object(base_schedule),
+            'week_results': {week: store.put_object(block) for week, block in week_results.items()},
+            'playoff_schedule': store.put_object(state['playoff_schedule']),
+            'standings_baseline': store.put_object(state['standings']['baseline']),
+            'standings_events': {week: store.put_object(events) for week, events in week_events.items()},
+            'rng_state': store.put_object(state['rng_state'])
+        }
+    }
+
+def state_from_manifest(store, manifest):
+    """Rebuild the capture_state() dict a manifest was made from"""
+    chunks = manifest['chunks']
+    rosters = store.get_object(chunks['rosters'])
+    teams = []
+    for roster, stats_digest in zip(rosters, chunks['team_stats']):
+        stats = store.get_object(stats_digest)
+        teams.append({
+            'name': roster['name'],
+            'record': stats['record'],
+            'players': [ratings + stat_row for ratings, stat_row in zip(roster['players'], stats['players'])]
+        })
+
+    schedule = store.get_object(chunks['schedule'])
+    for digest in chunks['week_results'].values():
+        for index, result in store.get_object(digest):
+            schedule[index].update(result)
+
+    events = []
+    for week in sorted(chunks['standings_events'], key=_week_order):
+        events.extend(store.get_object(chunks['standings_events'][week]))
+
+    return {
+        'league_info': manifest.get('league_info'),
+        'current_week': manifest['current_week'],
+        'season_complete': manifest['season_complete'],
+        'teams': teams,
+        'schedule': schedule,
+        'playoff_schedule': store.get_object(chunks['playoff_schedule']),
+        'standings': {
+            'baseline': store.get_object(chunks['standings_baseline']),
+            'events': events
+        },
+        'rng_state': store.get_object(chunks['rng_state'])
+    }
+
+def manifest_digests(manifest):
+    chunks = manifest['chunks']
+    digests = {chunks['rosters'], chunks['schedule'], chunks['playoff_schedule'],
+               chunks['standings_baseline'], chunks['rng_state']}
+    digests.update(chunks['team_stats'])
+    digests.update(chunks['week_results'].values())
+    digests.update(chunks['standings_events'].values())
+    return digests
+
+def read_manifest(path):
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('format') != MANIFEST_FORMAT:
+        raise ValueError(f"{os.path.basename(path)} is not a chunked league save")
+    if manifest.get('version', 0) > MANIFEST_VERSION:
+        raise ValueError(f"Chunked save version {manifest['version']} is newer than supported")
+    return manifest
+
+def write_manifest(path, manifest):
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+    os.replace(temp_path, path)
+
+def collect_garbage(save_directory, chunk_directory=None, dry_run=False):
+    """Delete chunks no manifest in `save_directory` references.
+
+    Returns (chunks removed, bytes freed). A manifest that can't be read
+    aborts the collection rather than risk deleting chunks it still needs.
+    """
+    store = ChunkStore(chunk_directory or os.path.join(save_directory, "chunks"))
+    live = set()
+    for name in os.listdir(save_directory):
+        if name.endswith(MANIFEST_EXTENSION):
+            live.update(manifest_digests(read_manifest(os.path.join(save_directory, name))))
+
+    removed = 0
+    freed = 0
+    for digest, path, size in list(store.iter_chunks()):
+        if digest not in live:
+            if not dry_run:
+                os.remove(path)
+            removed += 1
+            freed += size
+    return removed, freed
+
+def _week_order(week):
+    return int(week) if week.isdigit() else -1
+
+if __name__ == "__main__":
+    # python -m utils.chunk_store [save_directory] [--dry-run]
+    args = [arg for arg in sys.argv[1:] if arg != "--dry-run"]
+    dry_run = "--dry-run" in sys.argv[1:]
+    directory = args[0] if args else "saves"
+    removed, freed = collect_garbage(directory, dry_run=dry_run)
+    action = "Would remove" if dry_run else "Removed"
+    print(f"{action} {removed} orphaned chunks ({freed / 1024:.1f} KB) from {directory}")
@@ -2,6 +2,9 @@ from utils.team_manager import TeamManager
 from utils.schedule_manager import ScheduleManager
 from utils.season_simulator import SeasonSimulator
 from utils.playoff_system import PlayoffSystem
+from utils.standings_engine import StandingsEngine
+from utils.result_renderer import ResultRenderer
+from utils.league_state import capture_state, restore_state, save_data_from_state, new_key
 
 class GameSimulator:
     def __init__(self, main_gui):
@@ -12,6 +15,8 @@ class GameSimulator:
         self.schedule_manager = ScheduleManager(main_gui)
         self.season_simulator = SeasonSimulator(main_gui)
         self.playoff_system = PlayoffSystem(main_gui)
+        self.standings_engine = StandingsEngine(main_gui)
+        self.result_renderer = ResultRenderer()
 
     def create_teams(self, team_names):
         """Delegate to team manager"""
@@ -22,9 +27,17 @@ class GameSimulator:
         return self.schedule_manager.generate_schedule()
 
     def simulate_next_week(self):
-        """Delegate to season simulator"""
+        """Delegate to season simulator (returns a WeekResult)"""
         return self.season_simulator.simulate_next_week()
 
+    def render_week(self, week_result):
+        """Render a WeekResult as display text"""
+        return self.result_renderer.render_week(week_result)
+
+    def get_week_result(self, week):
+        """Get the WeekResult for an already simulated week, if any"""
+        return self.season_simulator.week_results.get(week)
+
     def simulate_entire_season(self):
         """Delegate to season simulator"""
         return self.season_simulator.simulate_entire_season()
@@ -33,20 +46,44 @@ class GameSimulator:
         """Reset all components"""
         self.main_gui.current_week = 0
         self.main_gui.season_complete = False
+        self.season_simulator.week_results = {}
+        self.result_renderer.clear()
         self.main_gui.teams = self.team_manager.create_teams(self.main_gui.teams_names)
         self.main_gui.schedule = self.schedule_manager.generate_schedule()
         self.initialize_standings()
+        self.begin_store_season()
         self.main_gui.status_var.set("Season reset - Click 'Simulate Next Week' to begin")
 
     def initialize_standings(self):
         """Initialize standings for all teams"""
-        self.main_gui.standings = {}
-        for team_name in self.main_gui.teams_names:
-            self.main_gui.standings[team_name] = {
-                "wins": 0, "losses": 0, "points_for": 0, "points_against": 0,
-                "games_played": 0, "overtime_losses": 0,
-                "division": self.get_team_division(team_name)
-            }
+        self.standings_engine.reset()
+
+    def begin_store_season(self, label=None):
+        """Give a freshly created season its season_key and start it in the league store, if attached.
+
+        Only for new seasons; a loaded league continues its own season
+        through resume_store_season.
+        """
+        self.main_gui.season_key = new_key()
+        league_store = getattr(self.main_gui, 'league_store', None)
+        if league_store is None:
+            return None
+        try:
+            return league_store.begin_season(self.main_gui, label)
+        except Exception as e:
+            print(f"Error starting league store season: {e}")
+            return None
+
+    def resume_store_season(self, label=None):
+        """Continue a loaded league's season in the league store (a new one if it was never recorded)"""
+        league_store = getattr(self.main_gui, 'league_store', None)
+        if league_store is None:
+            return None
+        try:
+            return league_store.resume_season(self.main_gui, label)
+        except Exception as e:
+            print(f"Error resuming league store season: {e}")
+            return None
 
     def get_team_division(self, team_name):
         """Get the division for a team"""
@@ -56,19 +93,19 @@ class GameSimulator:
         return "Unknown"
 
     def get_save_data(self):
-        """Get data to save"""
-        return {
-            "current_week": self.main_gui.current_week,
-            "season_complete": self.main_gui.season_complete,
-            "standings": self.main_gui.standings,
-            "schedule": self.main_gui.schedule
-        }
+        """Get data to save: the full league state as a versioned JSON save document"""
+        return save_data_from_state(capture_state(self.main_gui), self.main_gui.standings)
 
     def load_save_data(self, save_data):
         """Load saved data"""
-        self.main_gui.current_week = save_data["current_week"]
-        self.main_gui.season_complete = save_data["season_complete"]
-        self.main_gui.standings = save_data["standings"]
+        if 'metadata' in save_data:
+            restore_state(self.main_gui, save_data)
+        else:
+            # Quick saves from before versioning held only the week, standings and schedule
+            self.main_gui.current_week = save_data["current_week"]
+            self.main_gui.season_complete = save_data["season_complete"]
+            self.main_gui.standings = save_data["standings"]
+            self.standings_engine.load_baseline_from_standings(self.main_gui.standings)
 
         if hasattr(self.main_gui, 'simulation_tab'):
             self.main_gui.simulation_tab.week_label.config(text=f"Current Week: {self.main_gui.current_week}")
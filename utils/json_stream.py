@@ -0,0 +1,44 @@
+import gzip
+import json
+
+try:
+    import zstandard
+except ImportError:  # zstd support is optional
+    zstandard = None
+
+# Newline-delimited JSON: one self-describing record per line, so files can
+# be written and read incrementally and seasons appended to an archive.
+FORMAT_NAME = "lacrosse-league-ndjson"
+FORMAT_VERSION = 1
+
+def open_stream(path, mode='rt'):
+    """Open a plain, .gz or .zst NDJSON file in text mode ('rt', 'wt' or 'at').
+
+    Appending to a compressed file adds a new gzip member / zstd frame,
+    which both formats read back as one continuous stream.
+    """
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, encoding='utf-8', compresslevel=6)
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError("zstd compression needs the 'zstandard' package (pip install zstandard)")
+        return zstandard.open(path, mode, encoding='utf-8')
+    return open(path, mode.replace('t', ''), encoding='utf-8')
+
+def write_record(stream, record):
+    stream.write(json.dumps(record, separators=(',', ':')))
+    stream.write('\n')
+
+def read_records(stream):
+    """Yield records one line at a time, skipping blank lines"""
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid record on line {line_number}: {e}") from e
+
+def header_record():
+    return {'type': 'header', 'format': FORMAT_NAME, 'version': FORMAT_VERSION}
@@ -0,0 +1,237 @@
+import random
+import uuid
+from datetime import datetime
+from models.player import Player
+from models.team import Team
+from models.stat_store import StatStore
+
+# Stat attributes carried by every Player, in the order they are captured
+# (the order of stat_store.PLAYER_ATTRIBUTES, so rows map straight onto a
+# player's StatStore slot). Goalie-only fields hold None for skaters.
+PLAYER_STAT_FIELDS = (
+    'goals', 'assists', 'saves', 'player_of_match', 'games_played',
+    'goals_against', 'minutes_played',
+    'playoff_goals', 'playoff_assists', 'playoff_saves', 'playoff_games_played',
+    'playoff_goals_against', 'playoff_minutes_played',
+    'goals_match', 'assists_match', 'saves_match', 'goals_against_match'
+)
+
+TEAM_RECORD_FIELDS = ('wins', 'losses', 'overtime_losses', 'goals_for', 'goals_against')
+GOALIE_FIELDS = ('goals_against', 'minutes_played', 'playoff_goals_against',
+                 'playoff_minutes_played', 'goals_against_match')
+RATING_FIELDS = ('name', 'position', 'shooting', 'passing', 'defense', 'stamina')
+
+# Version of the capture_state() layout. 1 had no league_info; JSON save
+# documents are versioned separately ('1.0' held regular season stats only).
+SCHEMA_VERSION = 2
+SAVE_DATA_VERSION = '2.0'
+
+def new_key():
+    """Random identity for a league (league_id) or one of its seasons (season_key).
+
+    Both travel in league_info through every save format, so the league
+    store and the stats archive recognise a season they have already seen
+    when its save is loaded again.
+    """
+    return uuid.uuid4().hex
+
+def capture_state(main_gui):
+    """Capture the full simulation state as plain Python data.
+
+    Players are stored as flat lists (ratings followed by PLAYER_STAT_FIELDS)
+    so capturing a 16-team league stays cheap enough to do every week.
+    """
+    teams = []
+    for team in main_gui.teams:
+        players = []
+        for player in team.players:
+            row = [player.name, player.position, player.shooting,
+                   player.passing, player.defense, player.stamina]
+            row.extend(player.stat_store.row(player.stat_slot))
+            players.append(row)
+        teams.append({
+            'name': team.name,
+            'record': [getattr(team, field, 0) for field in TEAM_RECORD_FIELDS],
+            'players': players
+        })
+
+    engine = main_gui.game_simulator.standings_engine
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'league_info': {
+            'teams_names': list(main_gui.teams_names),
+            'divisions': {name: list(members) for name, members in main_gui.divisions.items()},
+            'league_id': getattr(main_gui, 'league_id', None),
+            'season_key': getattr(main_gui, 'season_key', None)
+        },
+        'current_week': main_gui.current_week,
+        'season_complete': main_gui.season_complete,
+        'teams': teams,
+        'schedule': [dict(game) for game in main_gui.schedule],
+        'playoff_schedule': [dict(game) for game in getattr(main_gui, 'playoff_schedule', [])],
+        'standings': {
+            'baseline': engine.baseline,
+            'events': [dict(event) for event in engine.events]
+        },
+        'rng_state': getattr(main_gui, 'rng', random).getstate()
+    }
+
+def build_teams(teams_data):
+    """Rebuild Team/Player objects from captured team data"""
+    teams = []
+    stat_store = StatStore()
+    for team_data in teams_data:
+        players = []
+        for row in team_data['players']:
+            player = Player(row[0], row[1], row[2], row[3], row[4], row[5], stat_store)
+            stat_store.set_row(player.stat_slot, row[6:])
+            players.append(player)
+
+        team = Team(team_data['name'], players)
+        team.record.update(**dict(zip(TEAM_RECORD_FIELDS, team_data['record'])))
+        teams.append(team)
+    return teams
+
+def restore_state(main_gui, state, restore_rng=True):
+    """Apply a state captured by capture_state (or an older save) to a GUI or headless league"""
+    state = migrate_state(state)
+    teams = build_teams(state['teams'])  # Before anything live changes, in case a row is bad
+    league_info = state.get('league_info') or {}
+    if league_info:
+        main_gui.teams_names = league_info['teams_names']
+        main_gui.divisions = league_info['divisions']
+    # Saves from before league and season keys get fresh ones
+    main_gui.league_id = league_info.get('league_id') or new_key()
+    main_gui.season_key = league_info.get('season_key') or new_key()
+    main_gui.current_week = state['current_week']
+    main_gui.season_complete = state['season_complete']
+    main_gui.teams = teams
+    main_gui.schedule = [dict(game) for game in state['schedule']]
+    main_gui.playoff_schedule = [dict(game) for game in state['playoff_schedule']]
+
+    # Week results (and their rendered text) from the abandoned timeline no longer apply
+    main_gui.game_simulator.season_simulator.week_results = {}
+    main_gui.game_simulator.result_renderer.clear()
+
+    engine = main_gui.game_simulator.standings_engine
+    engine.reset(state['standings']['baseline'])
+    engine.replay(state['standings']['events'])
+
+    if restore_rng and state.get('rng_state') is not None:
+        getattr(main_gui, 'rng', random).setstate(_as_rng_state(state['rng_state']))
+
+def _as_rng_state(rng_state):
+    """random.setstate needs tuples; serializers may hand back lists"""
+    version, internal, gauss_next = rng_state
+    return (version, tuple(internal), gauss_next)
+
+def migrate_state(data):
+    """Bring any saved league state up to the current capture_state() schema.
+
+    Accepts capture_state() dicts of any schema version as well as JSON save
+    documents (DataManager '1.0' and later); fields an older format did not
+    keep get the same defaults a new Player or Team starts with.
+    """
+    if 'metadata' in data:
+        return state_from_save_data(data)
+
+    version = data.get('schema_version', 1)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"League state schema {version} is newer than supported")
+    if version == SCHEMA_VERSION:
+        return data
+    # 1 -> 2: same layout, league_info wasn't captured
+    return {**data, 'schema_version': SCHEMA_VERSION, 'league_info': data.get('league_info')}
+
+def player_dict(player):
+    """Ratings and every stat field of a player, for JSON saves and exports"""
+    data = {field: getattr(player, field) for field in RATING_FIELDS}
+    for field in PLAYER_STAT_FIELDS:
+        data[field] = getattr(player, field, None)
+    return data
+
+def player_row(data):
+    """capture_state() player row from a player dict; goalie fields missing from older saves start at 0"""
+    goalie = data['position'] == "Goalie"
+    row = [data[field] for field in RATING_FIELDS]
+    row.extend(data.get(field, 0 if goalie or field not in GOALIE_FIELDS else None)
+               for field in PLAYER_STAT_FIELDS)
+    return row
+
+def save_data_from_state(state, standings=None, save_date=None):
+    """JSON save document for a captured state (the format DataManager writes)"""
+    teams = []
+    for team_data in state['teams']:
+        players = []
+        for row in team_data['players']:
+            player = dict(zip(RATING_FIELDS, row))
+            player.update(zip(PLAYER_STAT_FIELDS, row[len(RATING_FIELDS):]))
+            players.append(player)
+        teams.append({'name': team_data['name'], **dict(zip(TEAM_RECORD_FIELDS, team_data['record'])),
+                      'players': players})
+
+    return {
+        'metadata': {
+            'save_date': save_date or datetime.now().isoformat(),
+            'version': SAVE_DATA_VERSION,
+            'schema_version': SCHEMA_VERSION
+        },
+        'league_info': {
+            **(state.get('league_info') or {}),
+            'current_week': state['current_week'],
+            'season_complete': state['season_complete']
+        },
+        'teams': teams,
+        'standings': standings or {},
+        'standings_state': state['standings'],
+        'schedule': state['schedule'],
+        'playoff_schedule': state['playoff_schedule'],
+        'rng_state': state.get('rng_state')
+    }
+
+def state_from_save_data(save_data):
+    """capture_state() dict from a JSON save document of any version"""
+    version = save_data.get('metadata', {}).get('version', '1.0')
+    if _version_tuple(version) > _version_tuple(SAVE_DATA_VERSION):
+        raise ValueError(f"Save format {version} is newer than supported")
+
+    league_info = save_data.get('league_info', {})
+    teams = []
+    for team_data in save_data.get('teams', []):
+        teams.append({
+            'name': team_data['name'],
+            'record': [team_data.get(field, 0) for field in TEAM_RECORD_FIELDS],
+            'players': [player_row(data) for data in team_data['players']]
+        })
+
+    standings = save_data.get('standings_state')
+    if standings is None:
+        # 1.0 kept no standings events
+        standings = baseline_standings(teams)
+
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'league_info': {
+            'teams_names': league_info.get('teams_names', []),
+            'divisions': league_info.get('divisions', {}),
+            'league_id': league_info.get('league_id'),
+            'season_key': league_info.get('season_key')
+        },
+        'current_week': league_info.get('current_week', 0),
+        'season_complete': league_info.get('season_complete', False),
+        'teams': teams,
+        'schedule': save_data.get('schedule', []),
+        'playoff_schedule': save_data.get('playoff_schedule', []),
+        'standings': standings,
+        'rng_state': save_data.get('rng_state')
+    }
+
+def baseline_standings(teams):
+    """Standings state with the captured team records as the baseline and no events"""
+    return {
+        'baseline': {team['name']: dict(zip(TEAM_RECORD_FIELDS, team['record'])) for team in teams},
+        'events': []
+    }
+
+def _version_tuple(version):
+    return tuple(int(part) for part in str(version).split('.'))
@@ -135,43 +135,16 @@ class PlayoffSystem:
             "Western": []
         }
 
-        if not hasattr(self.main_gui, 'standings') or not self.main_gui.standings:
+        engine = self.main_gui.game_simulator.standings_engine
+        if not engine.records:
             return playoff_teams
 
         try:
-            # Get all teams with their conference
-            eastern_teams = []
-            western_teams = []
-
-            for team_name, team_data in self.main_gui.standings.items():
-                team_info = {
-                    'name': team_name,
-                    'wins': team_data.get('wins', 0),
-                    'losses': team_data.get('losses', 0),
-                    'overtime_losses': team_data.get('overtime_losses', 0),
-                    'points': team_data.get('wins', 0) * 2 + team_data.get('overtime_losses', 0),
-                    'goals_for': team_data.get('points_for', 0),
-                    'goals_against': team_data.get('points_against', 0),
-                    'division': self.main_gui.get_team_full_division(team_name)
-                }
-
-                conference = self.main_gui.get_team_conference(team_name)
-                if conference == "Eastern":
-                    eastern_teams.append(team_info)
-                elif conference == "Western":
-                    western_teams.append(team_info)
-
-            # Sort each conference by points, then by goal differential
-            for teams in [eastern_teams, western_teams]:
-                teams.sort(key=lambda x: (
-                    x['points'],
-                    x['goals_for'] - x['goals_against'],
-                    x['wins']
-                ), reverse=True)
-
-            # Take top 4 from each conference
-            playoff_teams["Eastern"] = eastern_teams[:4]
-            playoff_teams["Western"] = western_teams[:4]
+            # Conference orderings are maintained by the standings engine
+            # (points, then goal differential, then wins)
+            for conference in playoff_teams:
+                ranking = engine.get_conference_ranking(conference)[:4]
+                playoff_teams[conference] = [engine.get_team_row(team_name) for team_name in ranking]
 
         except Exception as e:
             print(f"Error determining playoff teams: {e}")
@@ -0,0 +1,50 @@
+import weakref
+
+class ResultRenderer:
+    """Renders WeekResult/GameResult objects to text on demand.
+
+    Rendered weeks are cached per WeekResult object, so redisplaying a week
+    reuses the string. Entries disappear with the results they belong to.
+    """
+
+    def __init__(self):
+        self._week_cache = weakref.WeakKeyDictionary()
+
+    def render_week(self, week_result):
+        """Get the text for a week, building it only the first time"""
+        if not week_result:
+            return ""
+
+        text = self._week_cache.get(week_result)
+        if text is None:
+            text = self._build_week_text(week_result)
+            self._week_cache[week_result] = text
+        return text
+
+    def render_game(self, game):
+        """Get the text for a single game"""
+        if game.pending:
+            return f"{game.round_name or 'Game'}: Waiting for previous round to complete\n"
+
+        overtime_text = " (OT)" if game.overtime else ""
+
+        result_text = ""
+        if game.round_name:
+            result_text += f"{game.round_name}: "
+
+        result_text += f"{game.away_team} @ {game.home_team}: {game.away_score}-{game.home_score}{overtime_text} (Winner: {game.winner})\n"
+        result_text += f"  Shots: {game.home_team} {game.home_shots}, {game.away_team} {game.away_shots}\n"
+        return result_text
+
+    def clear(self):
+        self._week_cache.clear()
+
+    def _build_week_text(self, week_result):
+        if not week_result.games:
+            return week_result.message or ""
+
+        parts = [f"Week {week_result.week} {week_result.phase_name} Results:\n" + "=" * 50 + "\n"]
+        parts.extend(self.render_game(game) for game in week_result.games)
+        if week_result.message:
+            parts.append(week_result.message)
+        return "".join(parts)
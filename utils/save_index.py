@@ -0,0 +1,215 @@
+import gzip
+import json
+import os
+import threading
+from utils.binary_save import BinarySaveReader, EXTENSION as BINARY_EXTENSION
+from utils.chunk_store import MANIFEST_EXTENSION, read_manifest
+
+SAVE_EXTENSIONS = ('.json', '.json.gz', BINARY_EXTENSION, MANIFEST_EXTENSION)
+INDEX_VERSION = 1
+
+def _points_key(name, wins, overtime_losses, goals_for, goals_against):
+    # Same ordering as the standings: points, goal difference, wins, name
+    return (-(wins * 2 + overtime_losses), -(goals_for - goals_against), -wins, name)
+
+def league_leader(team_records):
+    """Best team from (name, wins, overtime_losses, goals_for, goals_against) tuples"""
+    best = min((_points_key(*record) for record in team_records), default=None)
+    return best[3] if best else None
+
+def playoff_champion(playoff_schedule):
+    """Winner of the final: the only game of the last playoff week, once it's played"""
+    games = [game for game in playoff_schedule or [] if game.get('week') is not None]
+    if not games:
+        return None
+    final_week = max(game['week'] for game in games)
+    finals = [game for game in games if game['week'] == final_week]
+    if len(finals) != 1 or not finals[0].get('completed'):
+        return None  # The last round generated so far isn't the final, or it's unplayed
+    final = finals[0]
+    return final['home_team'] if final['home_score'] > final['away_score'] else final['away_team']
+
+def summarize_league(main_gui, format_version):
+    """Index fields for the league currently in memory"""
+    return {
+        'week': getattr(main_gui, 'current_week', 0),
+        'season_complete': getattr(main_gui, 'season_complete', False),
+        'leader': league_leader((team.name, team.wins, team.overtime_losses, team.goals_for, team.goals_against)
+                                for team in main_gui.teams),
+        'champion': playoff_champion(getattr(main_gui, 'playoff_schedule', [])),
+        'format_version': format_version
+    }
+
+class SaveIndex:
+    """Metadata index of the save slots in a directory, kept in index.json.
+
+    Saves made by the app update their entry directly. Everything else is
+    picked up lazily: entries() rescans the directory when its mtime has
+    changed (files added, removed or renamed) and otherwise re-stats each
+    indexed save, since overwriting a file in place leaves the directory
+    mtime alone. Only files whose mtime or size differ from the index are
+    opened, so listing thousands of unchanged saves costs one stat per save.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.path = os.path.join(directory, self.INDEX_NAME)
+        self._entries = None
+        self._directory_mtime = None
+        self._lock = threading.Lock()
+
+    def record_save(self, filepath, summary):
+        """Add or replace the entry for a save the app just wrote"""
+        with self._lock:
+            entries = self._load()
+            entries[os.path.basename(filepath)] = self._entry(filepath, summary)
+            self._write(entries)
+
+    def refresh_file(self, filepath):
+        """Re-read one save's metadata from disk (e.g. after a background write)"""
+        with self._lock:
+            entries = self._load()
+            entry = self._read_entry(filepath)
+            if entry is not None:
+                entries[os.path.basename(filepath)] = entry
+                self._write(entries)
+
+    def entries(self):
+        """Index entries, newest first, validated against the directory"""
+        with self._lock:
+            entries = self._load()
+            if self._directory_changed():
+                if self._rescan(entries):
+                    self._write(entries)
+                # Taken after our own index write so that write doesn't count as a change
+                self._directory_mtime = self._current_directory_mtime()
+            elif self._restat(entries):
+                self._write(entries)
+                self._directory_mtime = self._current_directory_mtime()
+            return sorted(entries.values(), key=lambda entry: entry['mtime'], reverse=True)
+
+    def _rescan(self, entries):
+        """Bring entries in line with the files on disk; returns True if anything changed"""
+        changed = False
+        seen = set()
+        with os.scandir(self.directory) as scan:
+            for dir_entry in scan:
+                name = dir_entry.name
+                if not name.endswith(SAVE_EXTENSIONS) or name == self.INDEX_NAME or not dir_entry.is_file():
+                    continue
+                seen.add(name)
+                stat = dir_entry.stat()
+                entry = entries.get(name)
+                if entry is not None and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+                    continue
+                entry = self._read_entry(dir_entry.path, stat)
+                if entry is not None:
+                    entries[name] = entry
+                    changed = True
+
+        for name in list(entries):
+            if name not in seen:
+                del entries[name]
+                changed = True
+        return changed
+
+    def _restat(self, entries):
+        """Re-read indexed saves whose mtime or size changed; returns True if any did"""
+        changed = False
+        for name, entry in list(entries.items()):
+            filepath = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                del entries[name]
+                changed = True
+                continue
+            if entry['mtime'] != stat.st_mtime or entry['size'] != stat.st_size:
+                entries[name] = self._read_entry(filepath, stat)
+                changed = True
+        return changed
+
+    def _read_entry(self, filepath, stat=None):
+        """Build an entry by reading the save itself"""
+        try:
+            if filepath.endswith(BINARY_EXTENSION):
+                summary = self._summarize_binary(filepath)
+            elif filepath.endswith(MANIFEST_EXTENSION):
+                summary = read_manifest(filepath)['summary']
+            else:
+                summary = self._summarize_json(filepath)
+        except Exception as e:
+            print(f"Error indexing save {filepath}: {e}")
+            summary = {'week': None, 'season_complete': None, 'leader': None,
+                       'champion': None, 'format_version': None}
+        return self._entry(filepath, summary, stat)
+
+    def _summarize_binary(self, filepath):
+        # Only the header, metadata and standings sections are read
+        reader = BinarySaveReader(filepath)
+        metadata = reader.read_metadata()
+        standings = reader.read_standings()
+        return {
+            'week': metadata.get('current_week', 0),
+            'season_complete': metadata.get('season_complete', False),
+            'leader': league_leader((name, record['wins'], record['overtime_losses'],
+                                     record['goals_for'], record['goals_against'])
+                                    for name, record in standings.items()),
+            'champion': None,
+            'format_version': f"binary {reader.version}"
+        }
+
+    def _summarize_json(self, filepath):
+        opener = gzip.open if filepath.endswith('.gz') else open
+        with opener(filepath, 'rt') as f:
+            save_data = json.load(f)
+        league_info = save_data.get('league_info', {})
+        return {
+            'week': league_info.get('current_week', 0),
+            'season_complete': league_info.get('season_complete', False),
+            'leader': league_leader((team['name'], team.get('wins', 0), team.get('overtime_losses', 0),
+                                     team.get('goals_for', 0), team.get('goals_against', 0))
+                                    for team in save_data.get('teams', [])),
+            'champion': playoff_champion(save_data.get('playoff_schedule', [])),
+            'format_version': save_data.get('metadata', {}).get('version')
+        }
+
+    def _entry(self, filepath, summary, stat=None):
+        stat = stat or os.stat(filepath)
+        return {
+            'name': os.path.basename(filepath),
+            'mtime': stat.st_mtime,
+            'size': stat.st_size,
+            **summary
+        }
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    self._entries = {entry['name']: entry for entry in data.get('entries', [])}
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                print(f"Save index unreadable, rebuilding: {e}")
+        return self._entries
+
+    def _write(self, entries):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'entries': list(entries.values())}, f)
+        os.replace(temp_path, self.path)
+
+    def _current_directory_mtime(self):
+        try:
+            return os.stat(self.directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _directory_changed(self):
+        return self._directory_mtime is None or self._current_directory_mtime() != self._directory_mtime
@@ -0,0 +1,331 @@
+import array
+import os
+import pickle
+import struct
+import zlib
+from utils.league_state import capture_state, restore_state, PLAYER_STAT_FIELDS
+
+# Stat values start after name, position and the four ratings in a captured player row
+STATS_OFFSET = 6
+
+class SaveJournal:
+    """Append-only journal of a league, one compact record per simulated week.
+
+    The journal directory holds numbered snapshot/segment pairs:
+
+        snapshot_005.snap   full capture_state() at week 5 (zlib + pickle)
+        segment_005.log     week records appended after that snapshot
+
+    A week record holds only what changed: completed and rescheduled games,
+    stat and team record deltas (packed as int16 quadruples), and new
+    standings events, pickled and zlib-compressed (~2-3KB a week). Every
+    `snapshot_interval` weeks the journal compacts by writing a fresh
+    snapshot and starting a new segment, so replaying to any week reads one
+    snapshot and at most a few records. Older pairs are kept so earlier
+    weeks stay inspectable.
+
+    Records and snapshots carry a length and CRC32; a torn record at the end
+    of a segment (crash mid-append) is ignored and truncated away.
+    """
+
+    SNAPSHOT_MAGIC = b"LXJS"
+    FORMAT_VERSION = 1
+    SNAPSHOT_HEADER = struct.Struct("<4sHHII")  # magic, version, week, payload length, crc32
+    RECORD_HEADER = struct.Struct("<HII")       # week, payload length, crc32
+
+    def __init__(self, main_gui, directory, snapshot_interval=6):
+        self.main_gui = main_gui
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self._base_week = None
+        self._last = None
+        self._branch_week = None  # Week replayed to; later weeks go on the first append
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+
+    def snapshot_path(self, week):
+        return os.path.join(self.directory, f"snapshot_{week:03d}.snap")
+
+    def segment_path(self, week):
+        return os.path.join(self.directory, f"segment_{week:03d}.log")
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start a fresh journal from the current league state"""
+        self.clear()
+        return self.write_snapshot()
+
+    def append_week(self):
+        """Append the changes since the last record; returns the bytes written.
+
+        Falls back to a snapshot when the change cannot be expressed as a
+        delta (new season, roster changes, undone standings events).
+        """
+        if self._last is None:
+            return self._snapshot_size(self.write_snapshot())
+
+        state = capture_state(self.main_gui)
+        delta = self._diff(self._last, state)
+        if delta is None:
+            return self._snapshot_size(self.write_snapshot(state))
+        if self._branch_week is not None:
+            # First week of a new timeline after a replay
+            self._drop_after(self._branch_week)
+            self._branch_week = None
+
+        payload = zlib.compress(pickle.dumps(delta, protocol=pickle.HIGHEST_PROTOCOL))
+        header = self.RECORD_HEADER.pack(state['current_week'], len(payload), zlib.crc32(payload))
+        with open(self.segment_path(self._base_week), 'ab') as f:
+            f.write(header)
+            f.write(payload)
+        self._last = state
+
+        if state['current_week'] - self._base_week >= self.snapshot_interval:
+            self.write_snapshot(state)
+        return len(header) + len(payload)
+
+    def write_snapshot(self, state=None):
+        """Compact: write a full snapshot and start a new segment after it"""
+        state = state or capture_state(self.main_gui)
+        week = state['current_week']
+        if self._branch_week is not None:
+            self._drop_after(self._branch_week)
+        payload = zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL), 1)
+        header = self.SNAPSHOT_HEADER.pack(self.SNAPSHOT_MAGIC, self.FORMAT_VERSION, week,
+                                           len(payload), zlib.crc32(payload))
+
+        path = self.snapshot_path(week)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(payload)
+        os.replace(temp_path, path)
+
+        self._drop_after(week)
+        open(self.segment_path(week), 'wb').close()
+
+        self._base_week = week
+        self._last = state
+        self._branch_week = None
+        return path
+
+    def _drop_after(self, week):
+        """Remove everything journaled after `week`: it belongs to an older timeline"""
+        for snapshot_week in self.snapshot_weeks():
+            if snapshot_week > week:
+                self._remove(self.snapshot_path(snapshot_week))
+                self._remove(self.segment_path(snapshot_week))
+            else:
+                self._truncate_segment(snapshot_week, week)
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(".snap") or name.endswith(".log"):
+                self._remove(os.path.join(self.directory, name))
+        self._base_week = None
+        self._last = None
+        self._branch_week = None
+
+    def _diff(self, old, new):
+        """Delta record from old to new, or None if a snapshot is needed"""
+        if new['current_week'] <= old['current_week'] or new.get('league_info') != old.get('league_info'):
+            return None
+
+        old_teams, new_teams = old['teams'], new['teams']
+        if len(old_teams) != len(new_teams):
+            return None
+
+        stats = array.array('h')  # (team, player, field, change) quadruples
+        records = []
+        for team_index, (old_team, new_team) in enumerate(zip(old_teams, new_teams)):
+            if old_team['name'] != new_team['name'] or len(old_team['players']) != len(new_team['players']):
+                return None
+
+            for field_index, (before, after) in enumerate(zip(old_team['record'], new_team['record'])):
+                if before != after:
+                    records.append((team_index, field_index, after - before))
+
+            for player_index, (old_row, new_row) in enumerate(zip(old_team['players'], new_team['players'])):
+                if old_row[:STATS_OFFSET] != new_row[:STATS_OFFSET]:
+                    return None
+                for field_index in range(len(PLAYER_STAT_FIELDS)):
+                    before = old_row[STATS_OFFSET + field_index]
+                    after = new_row[STATS_OFFSET + field_index]
+                    if before != after:
+                        if before is None or after is None:
+                            return None
+                        stats.extend((team_index, player_index, field_index, after - before))
+
+        old_events = old['standings']['events']
+        new_events = new['standings']['events']
+        if old['standings']['baseline'] != new['standings']['baseline'] or len(new_events) < len(old_events):
+            return None
+
+        return {
+            'week': new['current_week'],
+            'season_complete': new['season_complete'],
+            'stats': stats.tobytes(),
+            'records': records,
+            'schedule': self._diff_games(old['schedule'], new['schedule']),
+            'schedule_length': len(new['schedule']),
+            'playoff_schedule': self._diff_games(old['playoff_schedule'], new['playoff_schedule']),
+            'playoff_schedule_length': len(new['playoff_schedule']),
+            'events': new_events[len(old_events):]
+        }
+
+    def _diff_games(self, old_games, new_games):
+        changed = []
+        for index, game in enumerate(new_games):
+            if index >= len(old_games) or old_games[index] != game:
+                changed.append((index, game))
+        return changed
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def snapshot_weeks(self):
+        weeks = []
+        for name in os.listdir(self.directory):
+            if name.startswith("snapshot_") and name.endswith(".snap"):
+                weeks.append(int(name[len("snapshot_"):-len(".snap")]))
+        return sorted(weeks)
+
+    def available_weeks(self):
+        """Every week the journal can replay to"""
+        weeks = []
+        for snapshot_week in self.snapshot_weeks():
+            weeks.append(snapshot_week)
+            weeks.extend(week for week, _ in self._read_records(snapshot_week))
+        return sorted(set(weeks))
+
+    def state_at(self, week=None):
+        """Rebuild the captured state at `week` (latest if None), or None if not journaled"""
+        snapshot_weeks = self.snapshot_weeks()
+        if week is not None:
+            snapshot_weeks = [snapshot_week for snapshot_week in snapshot_weeks if snapshot_week <= week]
+
+        for snapshot_week in reversed(snapshot_weeks):
+            state = self._read_snapshot(snapshot_week)
+            if state is None:
+                continue
+            for record_week, delta in self._read_records(snapshot_week):
+                if week is not None and record_week > week:
+                    break
+                self._apply(state, delta)
+            if week is None or state['current_week'] == week:
+                return state
+        return None
+
+    def replay(self, week=None):
+        """Restore the league to `week` (latest if None). Returns the week restored or None.
+
+        Nothing on disk changes, so any journaled week can be inspected.
+        Journaling continues from the restored week; later weeks are only
+        dropped when the first week of the new timeline is appended.
+        """
+        state = self.state_at(week)
+        if state is None:
+            return None
+        restore_state(self.main_gui, state, restore_rng=False)
+        restored_week = state['current_week']
+        self._base_week = max(snapshot_week for snapshot_week in self.snapshot_weeks()
+                              if snapshot_week <= restored_week)
+        self._last = state
+        self._branch_week = restored_week
+        return restored_week
+
+    def _read_snapshot(self, week):
+        try:
+            with open(self.snapshot_path(week), 'rb') as f:
+                header = f.read(self.SNAPSHOT_HEADER.size)
+                if len(header) != self.SNAPSHOT_HEADER.size:
+                    return None
+                magic, version, _, length, crc = self.SNAPSHOT_HEADER.unpack(header)
+                if magic != self.SNAPSHOT_MAGIC or version != self.FORMAT_VERSION:
+                    return None
+                payload = f.read(length)
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                return None
+            return pickle.loads(zlib.decompress(payload))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError) as e:
+            print(f"Error reading journal snapshot for week {week}: {e}")
+            return None
+
+    def _read_records(self, snapshot_week):
+        """(week, delta) pairs of a segment"""
+        return [(week, pickle.loads(zlib.decompress(payload)))
+                for week, payload, _ in self._scan_segment(snapshot_week)]
+
+    def _scan_segment(self, snapshot_week):
+        """(week, payload, end offset) for each valid record, stopping at the first damaged one"""
+        path = self.segment_path(snapshot_week)
+        if not os.path.exists(path):
+            return []
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        records = []
+        position = 0
+        while position + self.RECORD_HEADER.size <= len(data):
+            week, length, crc = self.RECORD_HEADER.unpack_from(data, position)
+            start = position + self.RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            position = start + length
+            records.append((week, payload, position))
+
+        if position < len(data):
+            # Drop the torn tail so the next append starts on a record boundary
+            with open(path, 'r+b') as f:
+                f.truncate(position)
+        return records
+
+    def _truncate_segment(self, snapshot_week, week):
+        """Drop records after `week` from a segment"""
+        keep = 0
+        for record_week, _, end in self._scan_segment(snapshot_week):
+            if record_week > week:
+                break
+            keep = end
+        path = self.segment_path(snapshot_week)
+        if os.path.exists(path) and os.path.getsize(path) > keep:
+            with open(path, 'r+b') as f:
+                f.truncate(keep)
+
+    def _apply(self, state, delta):
+        teams = state['teams']
+        stats = array.array('h')
+        stats.frombytes(delta['stats'])
+        for i in range(0, len(stats), 4):
+            team_index, player_index, field_index, change = stats[i:i + 4]
+            teams[team_index]['players'][player_index][STATS_OFFSET + field_index] += change
+        for team_index, field_index, change in delta['records']:
+            teams[team_index]['record'][field_index] += change
+
+        for key in ('schedule', 'playoff_schedule'):
+            games = state[key]
+            del games[delta[key + '_length']:]
+            for index, game in delta[key]:
+                if index < len(games):
+                    games[index] = dict(game)
+                else:
+                    games.append(dict(game))
+
+        state['standings']['events'].extend(dict(event) for event in delta['events'])
+        state['current_week'] = delta['week']
+        state['season_complete'] = delta['season_complete']
+
+    def _snapshot_size(self, path):
+        return os.path.getsize(path)
+
+    def _remove(self, path):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            print(f"Error removing journal file {path}: {e}")
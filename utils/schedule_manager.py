@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta
 
 class ScheduleManager:
@@ -8,8 +9,15 @@ class ScheduleManager:
         """Generate schedule using the advanced scheduling system"""
         try:
             from models.schedule import build_season_schedule
-            temp_teams = self._create_temp_teams()
-            schedule_data = build_season_schedule(temp_teams)
+            from models.schedule_optimizer import optimize_schedule
+            rng = getattr(self.main_gui, 'rng', random)
+            if self._is_standard_league():
+                schedule_data = build_season_schedule(self._create_temp_teams(), rng=rng)
+            else:
+                schedule_data = self._config_schedule(rng)
+            # Even out home/away streaks, byes, repeat matchups and travel, and fill empty weeks
+            schedule_data = optimize_schedule(schedule_data, self.main_gui.config.conferences, rng=rng,
+                                              weeks_count=self.main_gui.config.regular_season_weeks)
             self._add_missing_fields(schedule_data)
             # print(f"Generated schedule with {len(schedule_data)} games")
             return schedule_data
@@ -18,6 +26,21 @@ class ScheduleManager:
             print("Advanced scheduler not found, falling back to basic scheduler")
             return self._fallback_schedule()
 
+    def _is_standard_league(self):
+        """True for the default 16-team layout build_season_schedule is written for"""
+        from config.league_config import LeagueConfig
+        config = self.main_gui.config
+        return config.conferences == LeagueConfig().conferences and config.games_per_team == 12
+
+    def _config_schedule(self, rng=random):
+        """Schedule derived from the configured conferences and divisions"""
+        from models.schedule import build_config_schedule
+        try:
+            return build_config_schedule(self.main_gui.config, rng=rng)
+        except ValueError as e:
+            print(f"Config scheduler failed ({e}), falling back to basic scheduler")
+            return self._fallback_schedule()
+
     def _create_temp_teams(self):
         """Create team objects for scheduler"""
         temp_teams = []
@@ -49,7 +72,8 @@ class ScheduleManager:
     def _fallback_schedule(self):
         """Fallback schedule generation"""
         from game_schedule import generate_schedule
-        raw_schedule = generate_schedule(self.main_gui.teams_names, self.main_gui.divisions)
+        raw_schedule = generate_schedule(self.main_gui.teams_names, self.main_gui.divisions,
+                                         getattr(self.main_gui, 'rng', random))
         return self._convert_basic_schedule_format(raw_schedule)
 
     def _convert_basic_schedule_format(self, raw_schedule):
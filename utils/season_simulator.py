@@ -1,8 +1,18 @@
+import random
 from models.match import simulate_match
+from models.results import GameResult, WeekResult
 
 class SeasonSimulator:
     def __init__(self, main_gui):
         self.main_gui = main_gui
+        self.week_results = {}
+        # When set (by a background worker), GUI side effects are posted here
+        # instead of being applied directly, since Tk must only be touched
+        # from the main thread
+        self.event_sink = None
+        # Keep per-player box scores in week_results even without a league
+        # store (the GUI's per-game export reads them); off for bulk runs
+        self.capture_box_scores = False
 
     def simulate_next_week(self):
         """Simulate the next week of games including playoffs"""
@@ -12,13 +22,21 @@ class SeasonSimulator:
         self.main_gui.current_week += 1
 
         if self.main_gui.current_week <= 14:
-            return self._simulate_regular_season_week()
+            result = self._simulate_regular_season_week()
         elif self.main_gui.current_week == 15:
-            return self._simulate_playoff_prep_week()
+            result = self._simulate_playoff_prep_week()
         elif self.main_gui.current_week <= 18:
-            return self._simulate_playoff_week()
+            result = self._simulate_playoff_week()
         else:
-            return self._simulate_offseason_week()
+            result = self._simulate_offseason_week()
+
+        self.week_results[self.main_gui.current_week] = result
+        self._record_week(result)
+        self._write_checkpoint()
+        self._append_journal()
+        if self.main_gui.season_complete:
+            self._archive_season()
+        return result
 
     def simulate_entire_season(self):
         """Simulate the entire remaining season"""
@@ -35,6 +53,47 @@ class SeasonSimulator:
 
         return week_count
 
+    def _write_checkpoint(self):
+        """Checkpoint the end of the week if a checkpoint manager is attached"""
+        checkpoint_manager = getattr(self.main_gui, 'checkpoint_manager', None)
+        if checkpoint_manager is None:
+            return
+        try:
+            checkpoint_manager.write_checkpoint()
+        except Exception as e:
+            print(f"Error writing checkpoint for week {self.main_gui.current_week}: {e}")
+
+    def _append_journal(self):
+        """Journal the week's changes if journal saving is enabled"""
+        save_journal = getattr(self.main_gui, 'save_journal', None)
+        if save_journal is None:
+            return
+        try:
+            save_journal.append_week()
+        except Exception as e:
+            print(f"Error journaling week {self.main_gui.current_week}: {e}")
+
+    def _record_week(self, week_result):
+        """Write the week to the league store if one is attached"""
+        league_store = getattr(self.main_gui, 'league_store', None)
+        if league_store is None:
+            return
+        try:
+            league_store.record_week(self.main_gui, week_result)
+        except Exception as e:
+            print(f"Error recording week {self.main_gui.current_week} to league store: {e}")
+
+    def _archive_season(self):
+        """Add the finished season's stat lines to the stats archive if one is attached"""
+        stats_archive = getattr(self.main_gui, 'stats_archive', None)
+        if stats_archive is None:
+            return
+        try:
+            stats_archive.append_season(self.main_gui.teams,
+                                        season_key=getattr(self.main_gui, 'season_key', None))
+        except Exception as e:
+            print(f"Error archiving season stats: {e}")
+
     def _simulate_regular_season_week(self):
         """Simulate a regular season week"""
         week_games = [game for game in self.main_gui.schedule if game.get('week') == self.main_gui.current_week]
@@ -43,7 +102,8 @@ class SeasonSimulator:
             if self.main_gui.current_week == 14:
                 return self._end_regular_season()
             else:
-                return f"Week {self.main_gui.current_week}: Some teams have bye weeks this week."
+                return WeekResult(self.main_gui.current_week, "Regular Season",
+                                  message=f"Week {self.main_gui.current_week}: Some teams have bye weeks this week.")
 
         return self._simulate_games(week_games, "Regular Season")
 
@@ -58,11 +118,12 @@ class SeasonSimulator:
         # Show playoff tabs
         self._show_playoff_tabs()
 
-        return f"Week 15: Playoff Preparation Week\n" + \
-               "Regular season complete! Playoff seeding finalized.\n" + \
-               "Top 4 teams from each conference qualified.\n" + \
-               "Conference Semifinals begin next week!\n\n" + \
-               self.main_gui.game_simulator.playoff_system.get_playoff_bracket_text()
+        return WeekResult(15, "Playoff Preparation",
+                          message=f"Week 15: Playoff Preparation Week\n" +
+                                  "Regular season complete! Playoff seeding finalized.\n" +
+                                  "Top 4 teams from each conference qualified.\n" +
+                                  "Conference Semifinals begin next week!\n\n" +
+                                  self.main_gui.game_simulator.playoff_system.get_playoff_bracket_text())
 
     def _initialize_playoff_stats(self):
         """Initialize separate playoff stats for all players"""
@@ -89,49 +150,58 @@ class SeasonSimulator:
         if not week_games:
             if self.main_gui.current_week == 18:
                 self.main_gui.season_complete = True
-                return "Championship complete! Season finished."
-            return f"Week {self.main_gui.current_week}: No playoff games scheduled."
+                return WeekResult(18, "Playoffs", message="Championship complete! Season finished.")
+            return WeekResult(self.main_gui.current_week, "Playoffs",
+                              message=f"Week {self.main_gui.current_week}: No playoff games scheduled.")
 
         return self._simulate_games(week_games, "Playoffs")
 
     def _simulate_offseason_week(self):
         """Handle offseason weeks"""
-        if self.main_gui.current_week == 19:
-            return "Week 19: Offseason begins. Draft preparation in progress..."
-        elif self.main_gui.current_week == 20:
-            return "Week 20: Draft week. New players entering the league..."
+        week = self.main_gui.current_week
+        if week == 19:
+            return WeekResult(week, "Offseason", message="Week 19: Offseason begins. Draft preparation in progress...")
+        elif week == 20:
+            return WeekResult(week, "Offseason", message="Week 20: Draft week. New players entering the league...")
         else:
             self.main_gui.season_complete = True
-            return "Season cycle complete."
+            return WeekResult(week, "Offseason", message="Season cycle complete.")
 
     def _end_regular_season(self):
         """Handle end of regular season"""
-        return f"Regular season complete! Playoff preparation begins next week."
+        return WeekResult(self.main_gui.current_week, "Regular Season",
+                          message="Regular season complete! Playoff preparation begins next week.")
 
     def _show_playoff_tabs(self):
         """Show playoff tabs when playoffs begin"""
-        if hasattr(self.main_gui, 'tab_manager'):
+        if self.event_sink is not None:
+            self.event_sink(("show_playoff_tabs",))
+        elif hasattr(self.main_gui, 'tab_manager'):
             self.main_gui.tab_manager.show_playoff_tabs()
 
     def _simulate_games(self, week_games, phase_name):
         """Simulate a list of games"""
-        results_text = f"Week {self.main_gui.current_week} {phase_name} Results:\n" + "="*50 + "\n"
+        week_result = WeekResult(self.main_gui.current_week, phase_name)
+        is_playoff = self.main_gui.current_week > 15
 
         for game in week_games:
             home_team_name = game['home_team']
             away_team_name = game['away_team']
 
             if "TBD" in home_team_name or "TBD" in away_team_name:
-                results_text += f"{game.get('round', 'Game')}: Waiting for previous round to complete\n"
+                week_result.games.append(GameResult(
+                    self.main_gui.current_week, home_team_name, away_team_name,
+                    round_name=game.get('round'), is_playoff=is_playoff, pending=True
+                ))
                 continue
 
             home_team, away_team = self._find_teams(home_team_name, away_team_name)
 
             if home_team and away_team:
-                results_text += self._simulate_single_game(game, home_team, away_team, phase_name)
+                week_result.games.append(self._simulate_single_game(game, home_team, away_team, phase_name))
 
         self._update_status(phase_name)
-        return results_text
+        return week_result
 
     def _find_teams(self, home_name, away_name):
         """Find team objects by name"""
@@ -149,7 +219,8 @@ class SeasonSimulator:
         is_playoff = self.main_gui.current_week > 15
 
         # Pass is_playoff flag to simulate_match
-        match_result = simulate_match(home_team, away_team, is_playoff=is_playoff)
+        match_result = simulate_match(home_team, away_team, is_playoff=is_playoff,
+                                      rng=getattr(self.main_gui, 'rng', random))
 
         game["home_score"] = match_result.home_score
         game["away_score"] = match_result.away_score
@@ -159,38 +230,41 @@ class SeasonSimulator:
         if self.main_gui.current_week <= 14:
             self._update_standings_from_match(home_team, away_team, match_result)
 
-        overtime_text = " (OT)" if match_result.overtime else ""
-        winner = home_team.name if match_result.home_score > match_result.away_score else away_team.name
-
-        result_text = ""
-        round_text = game.get('round', '')
-        if round_text:
-            result_text += f"{round_text}: "
-
-        result_text += f"{away_team.name} @ {home_team.name}: {match_result.away_score}-{match_result.home_score}{overtime_text} (Winner: {winner})\n"
-        result_text += f"  Shots: {home_team.name} {match_result.home_shots}, {away_team.name} {match_result.away_shots}\n"
-
-        return result_text
+        return GameResult(
+            self.main_gui.current_week, home_team.name, away_team.name,
+            match_result.home_score, match_result.away_score,
+            match_result.home_shots, match_result.away_shots,
+            overtime=match_result.overtime, round_name=game.get('round'),
+            is_playoff=is_playoff, box_score=self._capture_box_score(home_team, away_team)
+        )
+
+    def _capture_box_score(self, home_team, away_team):
+        """Per-player lines for the game just played (per-match stats are reset each game),
+        if a league store or the per-game export will read them"""
+        if not self.capture_box_scores and getattr(self.main_gui, 'league_store', None) is None:
+            return None
+        return [(team.name, player.name, player.goals_match, player.assists_match,
+                 player.saves_match if player.position == "Goalie" else None,
+                 player.goals_against_match)
+                for team in (home_team, away_team) for player in team.players]
 
     def _update_standings_from_match(self, home_team, away_team, match_result):
-        """Update standings after a match"""
-        for team_name, team in [(home_team.name, home_team), (away_team.name, away_team)]:
-            if team_name in self.main_gui.standings:
-                self.main_gui.standings[team_name].update({
-                    "wins": team.wins,
-                    "losses": team.losses + team.overtime_losses,
-                    "points_for": team.goals_for,
-                    "points_against": team.goals_against,
-                    "games_played": team.wins + team.losses + team.overtime_losses,
-                    "overtime_losses": team.overtime_losses
-                })
+        """Apply a regular season result to the standings engine"""
+        self.main_gui.game_simulator.standings_engine.apply_result(
+            home_team.name, away_team.name,
+            match_result.home_score, match_result.away_score,
+            match_result.overtime, self.main_gui.current_week
+        )
 
     def _update_status(self, phase_name):
         """Update GUI status"""
         status_text = f"Week {self.main_gui.current_week} {phase_name.lower()} simulated successfully"
         if self.main_gui.current_week > 15:
             status_text += f" - {phase_name}"
-        self.main_gui.status_var.set(status_text)
+        if self.event_sink is not None:
+            self.event_sink(("status", status_text))
+        else:
+            self.main_gui.status_var.set(status_text)
 
     def _get_current_playoff_matchups(self):
         """Get current playoff matchups as text"""
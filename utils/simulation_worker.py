@@ -0,0 +1,70 @@
+import queue
+import threading
+
+class SimulationWorker:
+    """Runs season simulation on a background thread.
+
+    The worker never touches Tk widgets. Everything the GUI needs to know is
+    posted to `events` as tuples and applied by the main thread, which drains
+    the queue with root.after:
+
+        ("week", week_number, week_result)
+        ("status", text)
+        ("show_playoff_tabs",)
+        ("finished", weeks_simulated)
+        ("cancelled", weeks_simulated)
+        ("error", message)
+    """
+
+    def __init__(self, main_gui, max_weeks=50):
+        self.main_gui = main_gui
+        self.max_weeks = max_weeks
+        self.events = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start_season(self):
+        """Simulate the rest of the season in the background"""
+        if self.is_running():
+            return False
+        self._cancel.clear()
+        self._thread = threading.Thread(target=self._run_season, name="season-simulation", daemon=True)
+        self._thread.start()
+        return True
+
+    def cancel(self):
+        """Ask the worker to stop after the week it is currently simulating"""
+        self._cancel.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _post(self, event):
+        self.events.put(event)
+
+    def _run_season(self):
+        season_simulator = self.main_gui.game_simulator.season_simulator
+        season_simulator.event_sink = self._post
+        week_count = 0
+
+        try:
+            while not self.main_gui.season_complete and week_count < self.max_weeks:
+                if self._cancel.is_set():
+                    self._post(("cancelled", week_count))
+                    return
+
+                old_week = self.main_gui.current_week
+                week_result = season_simulator.simulate_next_week()
+                week_count += 1
+                self._post(("week", self.main_gui.current_week, week_result))
+
+                if self.main_gui.current_week == old_week:
+                    break
+
+            self._post(("finished", week_count))
+
+        except Exception as e:
+            self._post(("error", str(e)))
+
+        finally:
+            season_simulator.event_sink = None
@@ -0,0 +1,449 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+# Tables hold every season ever recorded; in-memory league objects only ever
+# describe the current one. Stat lines are the cumulative per-phase totals
+# the stats views read, box scores are the per-game rows they are built from.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seasons (
+    season_id INTEGER PRIMARY KEY,
+    label TEXT,
+    created TEXT,
+    league_id TEXT,
+    season_key TEXT
+);
+CREATE TABLE IF NOT EXISTS teams (
+    season_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    conference TEXT,
+    division TEXT,
+    PRIMARY KEY (season_id, team_id)
+);
+CREATE TABLE IF NOT EXISTS players (
+    season_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    position TEXT NOT NULL,
+    shooting INTEGER, passing INTEGER, defense INTEGER, stamina INTEGER,
+    PRIMARY KEY (season_id, player_id)
+);
+CREATE TABLE IF NOT EXISTS games (
+    season_id INTEGER NOT NULL,
+    game_id INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_score INTEGER,
+    away_score INTEGER,
+    home_shots INTEGER,
+    away_shots INTEGER,
+    overtime INTEGER NOT NULL DEFAULT 0,
+    is_playoff INTEGER NOT NULL DEFAULT 0,
+    round TEXT,
+    PRIMARY KEY (season_id, game_id)
+);
+CREATE TABLE IF NOT EXISTS box_scores (
+    season_id INTEGER NOT NULL,
+    game_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    goals INTEGER NOT NULL,
+    assists INTEGER NOT NULL,
+    saves INTEGER,
+    goals_against INTEGER,
+    PRIMARY KEY (season_id, game_id, player_id)
+);
+CREATE TABLE IF NOT EXISTS stat_lines (
+    season_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    phase TEXT NOT NULL,
+    games_played INTEGER NOT NULL,
+    goals INTEGER NOT NULL,
+    assists INTEGER NOT NULL,
+    points INTEGER NOT NULL,
+    saves INTEGER,
+    goals_against INTEGER,
+    minutes_played INTEGER,
+    save_pct REAL,
+    gaa REAL,
+    PRIMARY KEY (season_id, phase, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_teams_name ON teams (season_id, name);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players (season_id, team_id);
+CREATE INDEX IF NOT EXISTS idx_players_position ON players (season_id, position);
+CREATE INDEX IF NOT EXISTS idx_players_name ON players (name);
+CREATE INDEX IF NOT EXISTS idx_games_week ON games (season_id, week);
+CREATE INDEX IF NOT EXISTS idx_box_scores_player ON box_scores (season_id, player_id);
+CREATE INDEX IF NOT EXISTS idx_stat_lines_points ON stat_lines (season_id, phase, points);
+CREATE INDEX IF NOT EXISTS idx_stat_lines_goals ON stat_lines (season_id, phase, goals);
+CREATE INDEX IF NOT EXISTS idx_stat_lines_assists ON stat_lines (season_id, phase, assists);
+CREATE INDEX IF NOT EXISTS idx_stat_lines_saves ON stat_lines (season_id, phase, saves);
+CREATE INDEX IF NOT EXISTS idx_stat_lines_save_pct ON stat_lines (season_id, phase, save_pct);
+CREATE INDEX IF NOT EXISTS idx_stat_lines_gaa ON stat_lines (season_id, phase, gaa);
+"""
+
+# Stats tab sort names -> stat_lines columns
+SORT_COLUMNS = {
+    "Goals": "s.goals",
+    "Assists": "s.assists",
+    "Points": "s.points",
+    "Saves": "s.saves",
+    "Save %": "s.save_pct",
+    "GAA": "s.gaa",
+    "Games": "s.games_played"
+}
+GOALIE_STATS = ("Saves", "Save %", "GAA")
+
+REGULAR = "regular"
+PLAYOFF = "playoff"
+
+class LeagueStore:
+    """SQLite history of every season simulated.
+
+    begin_season() starts a new season for the current teams and players;
+    its row is written with the first recorded week, and each simulated
+    week is then written in a single transaction by record_week(). Loading
+    a save calls resume_season(), which continues the row recorded for the
+    save's season_key instead of adding another. Seasons carry the league_id
+    of the league they belong to, so history queries don't mix leagues. The
+    connection is shared between the GUI thread and the simulation worker,
+    so every access goes through one lock.
+    """
+
+    def __init__(self, path="league_history.db"):
+        self.path = path
+        self.season_id = None
+        self.league_id = None
+        self._pending = None  # (label, season_key) of a season not written yet
+        self._player_ids = {}
+        self._next_game_id = 0
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        # WAL with NORMAL sync: a weekly commit no longer waits on fsync, and
+        # the stats views can read while the worker writes
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self.connection:
+            self.connection.executescript(SCHEMA)
+            self._migrate()
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    def _migrate(self):
+        """Add the columns databases created before league and season keys lack"""
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(seasons)")}
+        for column in ('league_id', 'season_key'):
+            if column not in columns:
+                self.connection.execute(f"ALTER TABLE seasons ADD COLUMN {column} TEXT")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_seasons_key ON seasons (season_key)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_seasons_league ON seasons (league_id)")
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def begin_season(self, main_gui, label=None):
+        """Start a new season for the league's current teams.
+
+        Nothing is written until its first week is recorded, so a league
+        that is created and never simulated leaves no season behind.
+        """
+        with self._lock:
+            self.season_id = None
+            self.league_id = getattr(main_gui, 'league_id', None)
+            self._pending = (label, getattr(main_gui, 'season_key', None))
+            self._player_ids = {}
+            self._next_game_id = 0
+
+    def resume_season(self, main_gui, label=None):
+        """Continue the season recorded for a loaded league, or begin one if it was never recorded.
+
+        The row is found by the league's season_key. Games recorded after
+        the loaded week belong to an abandoned timeline and are deleted,
+        and the stat lines are rewritten from the loaded totals.
+        """
+        season_key = getattr(main_gui, 'season_key', None)
+        with self._lock:
+            row = None
+            if season_key is not None:
+                row = self.connection.execute(
+                    "SELECT season_id FROM seasons WHERE season_key = ? ORDER BY season_id DESC LIMIT 1",
+                    (season_key,)).fetchone()
+        if row is None:
+            self.begin_season(main_gui, label)
+            return None
+
+        season_id = row[0]
+        week = main_gui.current_week
+        with self._lock, self.connection:
+            player_ids = {(team_name, player_name): player_id for player_id, team_name, player_name in
+                          self.connection.execute("""
+                              SELECT p.player_id, t.name, p.name FROM players p
+                              JOIN teams t ON t.season_id = p.season_id AND t.team_id = p.team_id
+                              WHERE p.season_id = ?""", (season_id,))}
+            self.connection.execute("""
+                DELETE FROM box_scores WHERE season_id = ? AND game_id IN
+                    (SELECT game_id FROM games WHERE season_id = ? AND week > ?)""", (season_id, season_id, week))
+            self.connection.execute("DELETE FROM games WHERE season_id = ? AND week > ?", (season_id, week))
+            (next_game_id,) = self.connection.execute(
+                "SELECT COALESCE(MAX(game_id) + 1, 0) FROM games WHERE season_id = ?", (season_id,)).fetchone()
+
+            self.season_id = season_id
+            self.league_id = getattr(main_gui, 'league_id', None)
+            self._pending = None
+            self._player_ids = player_ids
+            self._next_game_id = next_game_id
+            self._write_stat_lines(main_gui.teams)
+        return season_id
+
+    def _start_season(self, main_gui):
+        """Write the row of a season begun by begin_season(), with its teams, players and stat lines"""
+        label, season_key = self._pending
+        with self._lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO seasons (label, created, league_id, season_key) VALUES (?, ?, ?, ?)",
+                (label, datetime.now().isoformat(), self.league_id, season_key))
+            season_id = cursor.lastrowid
+
+            team_rows = []
+            player_rows = []
+            player_ids = {}
+            for team_id, team in enumerate(main_gui.teams):
+                team_rows.append((season_id, team_id, team.name,
+                                  main_gui.get_team_conference(team.name),
+                                  main_gui.get_team_division(team.name)))
+                for player in team.players:
+                    player_id = len(player_rows)
+                    player_ids[(team.name, player.name)] = player_id
+                    player_rows.append((season_id, player_id, team_id, player.name, player.position,
+                                        player.shooting, player.passing, player.defense, player.stamina))
+
+            self.connection.executemany("INSERT INTO teams VALUES (?, ?, ?, ?, ?)", team_rows)
+            self.connection.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", player_rows)
+
+            self.season_id = season_id
+            self._pending = None
+            self._player_ids = player_ids
+            self._next_game_id = 0
+            self._write_stat_lines(main_gui.teams)
+
+        return season_id
+
+    def record_week(self, main_gui, week_result):
+        """Write a week's games, box scores and updated stat lines in one transaction"""
+        if not week_result or not week_result.completed_games:
+            return
+        if self.season_id is None:
+            if self._pending is None:
+                return
+            self._start_season(main_gui)
+
+        game_rows = []
+        box_rows = []
+        played = set()
+        for game in week_result.completed_games:
+            game_id = self._next_game_id
+            self._next_game_id += 1
+            game_rows.append((self.season_id, game_id, game.week, game.home_team, game.away_team,
+                              game.home_score, game.away_score, game.home_shots, game.away_shots,
+                              int(game.overtime), int(game.is_playoff), game.round_name))
+            played.add(game.home_team)
+            played.add(game.away_team)
+
+            for team_name, player_name, goals, assists, saves, goals_against in game.box_score or ():
+                player_id = self._player_ids.get((team_name, player_name))
+                if player_id is not None:
+                    box_rows.append((self.season_id, game_id, player_id, goals, assists, saves, goals_against))
+
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", game_rows)
+            self.connection.executemany(
+                "INSERT INTO box_scores VALUES (?, ?, ?, ?, ?, ?, ?)", box_rows)
+            # A week only ever changes the stat lines of the phase it was played in
+            phase = PLAYOFF if week_result.completed_games[0].is_playoff else REGULAR
+            self._write_stat_lines([team for team in main_gui.teams if team.name in played], (phase,))
+
+    def _write_stat_lines(self, teams, phases=(REGULAR, PLAYOFF)):
+        rows = []
+        for team in teams:
+            for player in team.players:
+                player_id = self._player_ids.get((team.name, player.name))
+                if player_id is None:
+                    continue
+                if REGULAR in phases:
+                    rows.append(self._stat_line(player_id, REGULAR, player.games_played, player.goals,
+                                                player.assists, player.saves, player.goals_against,
+                                                player.minutes_played, player.position))
+                if PLAYOFF in phases:
+                    rows.append(self._stat_line(player_id, PLAYOFF, player.playoff_games_played,
+                                                player.playoff_goals, player.playoff_assists,
+                                                player.playoff_saves, player.playoff_goals_against,
+                                                player.playoff_minutes_played, player.position))
+
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO stat_lines VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _stat_line(self, player_id, phase, games_played, goals, assists, saves,
+                   goals_against, minutes_played, position):
+        save_pct = gaa = None
+        if position == "Goalie":
+            goals_against = goals_against or 0
+            minutes_played = minutes_played or 0
+            shots_faced = saves + goals_against
+            save_pct = (saves / shots_faced) * 100 if shots_faced else 0.0
+            gaa = (goals_against * 60) / minutes_played if minutes_played else 0.0
+        else:
+            saves = goals_against = minutes_played = None
+        return (self.season_id, player_id, phase, games_played, goals, assists, goals + assists,
+                saves, goals_against, minutes_played, save_pct, gaa)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query_player_stats(self, season_id=None, phase=REGULAR, conference=None, division=None,
+                           team=None, position=None, sort_by="Points", descending=True,
+                           min_value=0, min_games=None):
+        """Filtered, sorted player stat lines as dicts.
+
+        Sorting matches the stats tab: goalie-only stats list goalies first
+        and leave skaters after them in roster order, and GAA is always
+        listed lowest (best) first.
+        """
+        season_id = self.season_id if season_id is None else season_id
+        if season_id is None:
+            return []
+
+        clauses = ["s.season_id = ?", "s.phase = ?"]
+        params = [season_id, phase]
+        for column, value in (("t.conference", conference), ("t.division", division),
+                              ("t.name", team), ("p.position", position)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if min_games is not None:
+            clauses.append("s.games_played >= ?")
+            params.append(min_games)
+
+        # The minimum applies to the sort stat; name sorts compare against 0
+        sort_column = SORT_COLUMNS.get(sort_by)
+        if min_value:
+            clauses.append(f"COALESCE({sort_column or '0'}, 0) >= ?")
+            params.append(min_value)
+
+        direction = "DESC" if descending else "ASC"
+        if sort_by == "Player Name":
+            order = f"p.name {direction}"
+        elif sort_by in GOALIE_STATS:
+            if sort_by == "GAA":
+                # Lower is better, so GAA always lists the best goalies first
+                direction = "ASC"
+            order = f"p.position != 'Goalie', {sort_column} {direction}"
+        else:
+            order = f"{sort_column or 's.points'} {direction}"
+
+        query = f"""
+            SELECT p.name AS name, t.name AS team, p.position AS position,
+                   s.games_played AS games, s.goals AS goals, s.assists AS assists,
+                   s.points AS points, s.saves AS saves, s.save_pct AS save_pct, s.gaa AS gaa
+            FROM stat_lines s
+            JOIN players p ON p.season_id = s.season_id AND p.player_id = s.player_id
+            JOIN teams t ON t.season_id = p.season_id AND t.team_id = p.team_id
+            WHERE {' AND '.join(clauses)}
+            ORDER BY {order}, s.player_id
+        """
+        return self._fetch_dicts(query, params)
+
+    def query_box_scores(self, player_name, season_id=None):
+        """Game-by-game lines for a player in one season"""
+        season_id = self.season_id if season_id is None else season_id
+        query = """
+            SELECT g.week, g.home_team, g.away_team, g.is_playoff,
+                   b.goals, b.assists, b.saves, b.goals_against
+            FROM box_scores b
+            JOIN players p ON p.season_id = b.season_id AND p.player_id = b.player_id
+            JOIN games g ON g.season_id = b.season_id AND g.game_id = b.game_id
+            WHERE b.season_id = ? AND p.name = ?
+            ORDER BY g.week, g.game_id
+        """
+        return self._fetch_dicts(query, (season_id, player_name))
+
+    def career_stats(self, player_name, phase=REGULAR, league_id=None):
+        """Season-by-season stat lines for a player across the recorded seasons
+        of one league (the current league if None)"""
+        league_id = self.league_id if league_id is None else league_id
+        query = """
+            SELECT s.season_id, se.label, t.name AS team, s.games_played AS games,
+                   s.goals, s.assists, s.points, s.saves, s.save_pct, s.gaa
+            FROM players p
+            JOIN stat_lines s ON s.season_id = p.season_id AND s.player_id = p.player_id
+            JOIN teams t ON t.season_id = p.season_id AND t.team_id = p.team_id
+            JOIN seasons se ON se.season_id = p.season_id
+            WHERE p.name = ? AND s.phase = ? AND se.league_id IS ?
+            ORDER BY s.season_id
+        """
+        return self._fetch_dicts(query, (player_name, phase, league_id))
+
+    def league_season_ids(self, league_id=None):
+        """Recorded season ids of one league (the current league if None), oldest first"""
+        league_id = self.league_id if league_id is None else league_id
+        with self._lock:
+            return [row[0] for row in self.connection.execute(
+                "SELECT season_id FROM seasons WHERE league_id IS ? ORDER BY season_id", (league_id,))]
+
+    def iter_season_rows(self, season_id=None, batch_size=10000):
+        """Stat lines of one season (or every season) as stats_exporter.SEASON_COLUMNS rows"""
+        query = """
+            SELECT s.season_id, s.phase, p.name, t.name, p.position,
+                   s.games_played, s.goals, s.assists, s.points, s.saves,
+                   s.goals_against, s.minutes_played, NULL
+            FROM stat_lines s
+            JOIN players p ON p.season_id = s.season_id AND p.player_id = s.player_id
+            JOIN teams t ON t.season_id = p.season_id AND t.team_id = p.team_id
+        """
+        return self._iter_rows(query, "s.season_id", "s.season_id, s.phase, s.player_id", season_id, batch_size)
+
+    def iter_game_rows(self, season_id=None, batch_size=10000):
+        """Box scores of one season (or every season) as stats_exporter.GAME_COLUMNS rows"""
+        query = """
+            SELECT b.season_id, g.week, CASE WHEN g.is_playoff THEN 'playoff' ELSE 'regular' END,
+                   g.home_team, g.away_team, t.name, p.name,
+                   b.goals, b.assists, b.saves, b.goals_against
+            FROM box_scores b
+            JOIN games g ON g.season_id = b.season_id AND g.game_id = b.game_id
+            JOIN players p ON p.season_id = b.season_id AND p.player_id = b.player_id
+            JOIN teams t ON t.season_id = p.season_id AND t.team_id = p.team_id
+        """
+        return self._iter_rows(query, "b.season_id", "b.season_id, b.game_id, b.player_id", season_id, batch_size)
+
+    def _iter_rows(self, query, season_column, order, season_id, batch_size):
+        # The lock is only held while a batch is fetched, so a long export
+        # doesn't stall the simulation worker's weekly writes
+        params = ()
+        if season_id is not None:
+            query += f" WHERE {season_column} = ?"
+            params = (season_id,)
+        query += f" ORDER BY {order}"
+        with self._lock:
+            cursor = self.connection.execute(query, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
+
+    def list_seasons(self):
+        return self._fetch_dicts(
+            "SELECT season_id, label, created, league_id, season_key FROM seasons ORDER BY season_id")
+
+    def _fetch_dicts(self, query, params=()):
+        with self._lock:
+            cursor = self.connection.execute(query, params)
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor.fetchall()]
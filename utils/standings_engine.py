@@ -0,0 +1,205 @@
+from bisect import bisect_left, insort
+from models.team_record import TeamRecord, RECORD_FIELDS, game_result
+
+class StandingsEngine:
+    """Event-sourced regular season standings.
+
+    Every completed regular season game is applied as an event. Team records,
+    the derived columns (points, games played, win %, goal diff) and the
+    conference/division orderings are updated incrementally, so consumers can
+    read standings without rebuilding or re-sorting them.
+    """
+
+    def __init__(self, main_gui):
+        self.main_gui = main_gui
+        self.events = []
+        self.records = {}
+        self.baseline = {}
+        self.conference_order = {}
+        self.division_order = {}
+        self._team_groups = {}
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    def reset(self, baseline=None):
+        """Clear all events and rebuild records from an optional baseline"""
+        self.events = []
+        self.baseline = {name: dict(record) for name, record in (baseline or {}).items()}
+        self.records = {}
+        self.conference_order = {}
+        self.division_order = {}
+        self._team_groups = {}
+
+        for team_name in self.main_gui.teams_names:
+            conference = self.main_gui.get_team_conference(team_name)
+            division = self.main_gui.get_team_full_division(team_name)
+            self._team_groups[team_name] = (conference, division)
+
+            record = self._new_record(self.baseline.get(team_name))
+            self.records[team_name] = record
+            insort(self.conference_order.setdefault(conference, []), self._sort_key(team_name))
+            insort(self.division_order.setdefault(division, []), self._sort_key(team_name))
+
+        self._sync_legacy_standings()
+
+    def load_baseline_from_teams(self, teams):
+        """Reset using the records stored on Team objects (e.g. after loading a save)"""
+        self.reset({team.name: team.record.counts() for team in teams})
+
+    def load_baseline_from_standings(self, standings):
+        """Reset using a legacy standings dict (losses there include OT losses)"""
+        baseline = {}
+        for team_name, data in standings.items():
+            overtime_losses = data.get('overtime_losses', 0)
+            baseline[team_name] = {
+                'wins': data.get('wins', 0),
+                'losses': data.get('losses', 0) - overtime_losses,
+                'overtime_losses': overtime_losses,
+                'goals_for': data.get('points_for', 0),
+                'goals_against': data.get('points_against', 0)
+            }
+        self.reset(baseline)
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def apply_result(self, home_team, away_team, home_score, away_score, overtime=False, week=None):
+        """Apply one completed game as an event"""
+        event = {
+            'week': week,
+            'home_team': home_team,
+            'away_team': away_team,
+            'home_score': home_score,
+            'away_score': away_score,
+            'overtime': overtime
+        }
+        self._apply_event(event, 1)
+        self.events.append(event)
+        return event
+
+    def undo(self, count=1):
+        """Revert the most recent events, returning them newest first"""
+        undone = []
+        for _ in range(min(count, len(self.events))):
+            event = self.events.pop()
+            self._apply_event(event, -1)
+            undone.append(event)
+        return undone
+
+    def undo_week(self, week):
+        """Revert all trailing events that belong to the given week"""
+        undone = []
+        while self.events and self.events[-1].get('week') == week:
+            undone.extend(self.undo())
+        return undone
+
+    def replay(self, events=None, upto_week=None):
+        """Rebuild standings from the baseline by re-applying events.
+
+        Events after upto_week are not re-applied; they are returned so the
+        caller can replay them again later.
+        """
+        events = list(self.events if events is None else events)
+        skipped = []
+        self.reset(self.baseline)
+        for event in events:
+            if upto_week is not None and event.get('week') is not None and event['week'] > upto_week:
+                skipped.append(event)
+                continue
+            self.apply_result(event['home_team'], event['away_team'], event['home_score'],
+                              event['away_score'], event.get('overtime', False), event.get('week'))
+        return skipped
+
+    def _apply_event(self, event, sign):
+        """Add (sign=1) or remove (sign=-1) an event's effect on both teams"""
+        home = event['home_team']
+        away = event['away_team']
+        if home not in self.records or away not in self.records:
+            return
+
+        home_score = event['home_score']
+        away_score = event['away_score']
+        overtime = event.get('overtime', False)
+        for team_name, scored, allowed in ((home, home_score, away_score), (away, away_score, home_score)):
+            self._detach(team_name)
+            self.records[team_name].apply(scored, allowed, game_result(scored, allowed, overtime), sign)
+            self._attach(team_name)
+            self._sync_legacy_team(team_name)
+
+    # ------------------------------------------------------------------
+    # Records and orderings
+    # ------------------------------------------------------------------
+
+    def _new_record(self, base=None):
+        base = base or {}
+        return TeamRecord(**{field: base.get(field, 0) for field in RECORD_FIELDS})
+
+    def _sort_key(self, team_name):
+        """Playoff seeding tiebreaks: points, goal differential, wins"""
+        return self.records[team_name].sort_key() + (team_name,)
+
+    def _detach(self, team_name):
+        key = self._sort_key(team_name)
+        conference, division = self._team_groups[team_name]
+        for order in (self.conference_order[conference], self.division_order[division]):
+            index = bisect_left(order, key)
+            if index < len(order) and order[index] == key:
+                del order[index]
+
+    def _attach(self, team_name):
+        key = self._sort_key(team_name)
+        conference, division = self._team_groups[team_name]
+        insort(self.conference_order[conference], key)
+        insort(self.division_order[division], key)
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    def get_record(self, team_name):
+        """Get the current TeamRecord (with derived columns) for a team"""
+        return self.records.get(team_name)
+
+    def get_conference_ranking(self, conference):
+        """Team names in a conference, best first"""
+        return [key[-1] for key in self.conference_order.get(conference, [])]
+
+    def get_division_ranking(self, division):
+        """Team names in a division (full name, e.g. 'Eastern North'), best first"""
+        return [key[-1] for key in self.division_order.get(division, [])]
+
+    def get_team_row(self, team_name):
+        """Get a display row for a team, shared by the standings and playoff views"""
+        conference, division = self._team_groups[team_name]
+        row = self.records[team_name].as_dict()
+        row['name'] = team_name
+        row['conference'] = conference
+        row['division'] = division
+        return row
+
+    def get_rows(self):
+        """Display rows for every team, in league order"""
+        return [self.get_team_row(team_name) for team_name in self.records]
+
+    def _sync_legacy_standings(self):
+        """Rebuild main_gui.standings in the legacy dict format"""
+        self.main_gui.standings = {}
+        for team_name in self.records:
+            self._sync_legacy_team(team_name)
+
+    def _sync_legacy_team(self, team_name):
+        record = self.records[team_name]
+        entry = self.main_gui.standings.setdefault(team_name, {
+            "division": self._team_groups[team_name][1]
+        })
+        entry.update({
+            "wins": record.wins,
+            "losses": record.losses + record.overtime_losses,
+            "points_for": record.goals_for,
+            "points_against": record.goals_against,
+            "games_played": record.games_played,
+            "overtime_losses": record.overtime_losses
+        })
@@ -0,0 +1,362 @@
+import json
+import mmap
+import os
+import struct
+
+try:
+    import numpy
+except ImportError:  # NumPy views are optional; lookups work without it
+    numpy = None
+
+# Finished seasons for dynasty leagues, kept on disk instead of in Player
+# objects. Stat lines are fixed-width little-endian records appended to two
+# files and read back through mmap, so "all seasons of player X" touches only
+# that player's records and a season is one contiguous slice:
+#
+#   players.dat   64 bytes: season, team id, player id, position code,
+#                 then PLAYER_COLUMNS as int32 (NULL_STAT for None)
+#   teams.dat     24 bytes: season, team id, then TEAM_COLUMNS as int32
+#   index.json    names, per-season record ranges and per-player record numbers
+#
+# A player id is a career, not a display name: [name, team, first season].
+# Each season a roster entry continues the career with the same team and
+# name; same-named teammates are told apart by roster order, so two players
+# called "J. Smith" never share a history.
+#
+# A season archived with a season_key (kept in the league's saves) is only
+# archived once: finishing it again after reloading a save is a no-op.
+#
+# Records are fsynced before index.json is replaced, so a crash mid-append
+# leaves extra records past the indexed counts, which are cut off on open.
+
+ARCHIVE_VERSION = 2
+NULL_STAT = -1
+POSITIONS = ('Attack', 'Midfield', 'Defense', 'Goalie')
+
+PLAYER_COLUMNS = (
+    'games_played', 'goals', 'assists', 'saves', 'goals_against', 'minutes_played', 'player_of_match',
+    'playoff_games_played', 'playoff_goals', 'playoff_assists', 'playoff_saves',
+    'playoff_goals_against', 'playoff_minutes_played'
+)
+TEAM_COLUMNS = ('wins', 'losses', 'overtime_losses', 'goals_for', 'goals_against')
+
+PLAYER_RECORD = struct.Struct("<HHIB3x" + "i" * len(PLAYER_COLUMNS))
+TEAM_RECORD = struct.Struct("<HH" + "i" * len(TEAM_COLUMNS))
+
+if numpy is not None:
+    PLAYER_DTYPE = numpy.dtype([('season', '<u2'), ('team_id', '<u2'), ('player_id', '<u4'),
+                                ('position', 'u1'), ('pad', 'V3')] +
+                               [(column, '<i4') for column in PLAYER_COLUMNS])
+    TEAM_DTYPE = numpy.dtype([('season', '<u2'), ('team_id', '<u2')] +
+                             [(column, '<i4') for column in TEAM_COLUMNS])
+
+class StatsArchive:
+    """Append-only, memory-mapped archive of finished seasons' stat lines"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory)
+        self.players_path = os.path.join(directory, "players.dat")
+        self.teams_path = os.path.join(directory, "teams.dat")
+        self.index_path = os.path.join(directory, "index.json")
+        self._player_map = None
+        self._team_map = None
+        self._load_index()
+        self._trim_unindexed()
+        self._remap()
+
+    # --- Writing ---
+
+    def append_season(self, teams, label=None, season_key=None):
+        """Archive the current stat lines of `teams` as the next season; returns its number.
+
+        If `season_key` is already archived nothing is written and that
+        season's number is returned.
+        """
+        if season_key is not None:
+            season = self.find_season(season_key)
+            if season is not None:
+                return season
+
+        season = self.next_season()
+        player_start = self._player_count
+        team_start = self._team_count
+
+        team_rows = []
+        player_rows = []
+        new_records = {}
+        for team in teams:
+            team_id = self._intern(self._team_ids, self.index['teams'], team.name)
+            team_rows.append(TEAM_RECORD.pack(season, team_id,
+                                              *(_stat(getattr(team, column, 0)) for column in TEAM_COLUMNS)))
+            occurrences = {}
+            for player in team.players:
+                occurrence = occurrences[player.name] = occurrences.get(player.name, -1) + 1
+                player_id = self._career(team.name, player.name, occurrence, season)
+                position = POSITIONS.index(player.position) if player.position in POSITIONS else 255
+                player_rows.append(PLAYER_RECORD.pack(
+                    season, team_id, player_id, position,
+                    *(_stat(getattr(player, column, None)) for column in PLAYER_COLUMNS)))
+                new_records.setdefault(str(player_id), []).append(player_start + len(player_rows) - 1)
+
+        self._append(self.players_path, player_rows)
+        self._append(self.teams_path, team_rows)
+
+        for player_id, records in new_records.items():
+            self.index['player_records'].setdefault(player_id, []).extend(records)
+        self.index['seasons'][str(season)] = {
+            'label': label,
+            'key': season_key,
+            'players': [player_start, len(player_rows)],
+            'teams': [team_start, len(team_rows)]
+        }
+        self._player_count += len(player_rows)
+        self._team_count += len(team_rows)
+        self._write_index()
+        self._remap()
+        return season
+
+    def next_season(self):
+        return max(map(int, self.index['seasons']), default=0) + 1
+
+    def find_season(self, season_key):
+        """Number of the season archived with `season_key`, or None"""
+        for season, info in self.index['seasons'].items():
+            if info.get('key') == season_key:
+                return int(season)
+        return None
+
+    # --- Lookups ---
+
+    def seasons(self):
+        """(season, label) for every archived season, oldest first"""
+        return sorted((int(season), info['label']) for season, info in self.index['seasons'].items())
+
+    def find_players(self, name, team=None):
+        """Ids of the archived careers of players called `name`, optionally only with `team`"""
+        return [player_id for player_id, (player_name, player_team, _) in enumerate(self.index['players'])
+                if player_name == name and (team is None or player_team == team)]
+
+    def player_history(self, player_id):
+        """Every archived season of the career `player_id` (see find_players), oldest first"""
+        return [self._player_dict(PLAYER_RECORD.unpack_from(self._player_map, record * PLAYER_RECORD.size))
+                for record in self.index['player_records'].get(str(player_id), [])]
+
+    def season_players(self, season):
+        start, count = self._season_range(season, 'players')
+        return [self._player_dict(values) for values in
+                PLAYER_RECORD.iter_unpack(self._slice(self._player_map, PLAYER_RECORD, start, count))]
+
+    def season_teams(self, season):
+        start, count = self._season_range(season, 'teams')
+        teams = self.index['teams']
+        return [{'season': values[0], 'team': teams[values[1]],
+                 **{column: _value(value) for column, value in zip(TEAM_COLUMNS, values[2:])}}
+                for values in TEAM_RECORD.iter_unpack(self._slice(self._team_map, TEAM_RECORD, start, count))]
+
+    def league_averages(self, season, phase='regular'):
+        """Per-player averages of one season's stat columns, over players who played in `phase`"""
+        prefix = 'playoff_' if phase == 'playoff' else ''
+        columns = [column for column in PLAYER_COLUMNS
+                   if column.startswith('playoff_') == bool(prefix) and column != 'player_of_match']
+        if numpy is not None:
+            view = self.player_view(season)
+            played = view[view[prefix + 'games_played'] > 0]
+            averages = {}
+            for column in columns:
+                values = played[column][played[column] != NULL_STAT]
+                averages[column[len(prefix):]] = float(values.mean()) if len(values) else None
+            return averages
+
+        totals = {column: [0, 0] for column in columns}
+        start, count = self._season_range(season, 'players')
+        offsets = [4 + PLAYER_COLUMNS.index(column) for column in columns]
+        games_offset = 4 + PLAYER_COLUMNS.index(prefix + 'games_played')
+        for values in PLAYER_RECORD.iter_unpack(self._slice(self._player_map, PLAYER_RECORD, start, count)):
+            if values[games_offset] <= 0:
+                continue
+            for column, offset in zip(columns, offsets):
+                if values[offset] != NULL_STAT:
+                    totals[column][0] += values[offset]
+                    totals[column][1] += 1
+        return {column[len(prefix):]: (total / count if count else None)
+                for column, (total, count) in totals.items()}
+
+    def player_view(self, season=None):
+        """Zero-copy NumPy structured array over one season's (or all) player records"""
+        return self._view(self._player_map, PLAYER_RECORD, 'players', season)
+
+    def team_view(self, season=None):
+        """Zero-copy NumPy structured array over one season's (or all) team records"""
+        return self._view(self._team_map, TEAM_RECORD, 'teams', season)
+
+    def player_name(self, player_id):
+        return self.index['players'][player_id][0]
+
+    def player_career(self, player_id):
+        """(name, team, first season) of the career `player_id`"""
+        return tuple(self.index['players'][player_id])
+
+    def team_name(self, team_id):
+        return self.index['teams'][team_id]
+
+    def close(self):
+        for mapping in (self._player_map, self._team_map):
+            _close_map(mapping)
+        self._player_map = self._team_map = None
+
+    # --- Internals ---
+
+    def _view(self, mapping, record, kind, season):
+        if numpy is None:
+            raise RuntimeError("Archive array views need the 'numpy' package (pip install numpy)")
+        dtype = PLAYER_DTYPE if record is PLAYER_RECORD else TEAM_DTYPE
+        if season is None:
+            start, count = 0, self._player_count if kind == 'players' else self._team_count
+        else:
+            start, count = self._season_range(season, kind)
+        if count == 0:
+            return numpy.empty(0, dtype=dtype)
+        return numpy.frombuffer(mapping, dtype=dtype, count=count, offset=start * record.size)
+
+    def _player_dict(self, values):
+        season, team_id, player_id, position = values[:4]
+        return {
+            'season': season,
+            'player_id': player_id,
+            'player': self.index['players'][player_id][0],
+            'team': self.index['teams'][team_id],
+            'position': POSITIONS[position] if position < len(POSITIONS) else None,
+            **{column: _value(value) for column, value in zip(PLAYER_COLUMNS, values[4:])}
+        }
+
+    def _season_range(self, season, kind):
+        info = self.index['seasons'].get(str(season))
+        if info is None:
+            raise KeyError(f"Season {season} is not in the archive")
+        return info[kind]
+
+    def _slice(self, mapping, record, start, count):
+        if count == 0:
+            return b""
+        return memoryview(mapping)[start * record.size:(start + count) * record.size]
+
+    def _career(self, team, name, occurrence, season):
+        """Id of the `occurrence`-th career of `name` on `team`, started in `season` if new"""
+        careers = self._player_ids.setdefault((team, name), [])
+        if occurrence < len(careers):
+            return careers[occurrence]
+        player_id = len(self.index['players'])
+        self.index['players'].append([name, team, season])
+        careers.append(player_id)
+        return player_id
+
+    def _intern(self, ids, names, name):
+        name_id = ids.get(name)
+        if name_id is None:
+            name_id = ids[name] = len(names)
+            names.append(name)
+        return name_id
+
+    def _append(self, path, rows):
+        with open(path, 'ab') as f:
+            f.write(b"".join(rows))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load_index(self):
+        self.index = {'version': ARCHIVE_VERSION, 'players': [], 'teams': [], 'seasons': {}, 'player_records': {}}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('version', 0) > ARCHIVE_VERSION:
+                raise ValueError(f"Stats archive version {index['version']} is newer than supported")
+            self.index = index
+        if self.index.get('version', 0) < 2:
+            self._upgrade_player_ids()
+        self._player_ids = {}
+        for player_id, (name, team, _) in enumerate(self.index['players']):
+            self._player_ids.setdefault((team, name), []).append(player_id)
+        self._team_ids = {name: i for i, name in enumerate(self.index['teams'])}
+        self._player_count = sum(info['players'][1] for info in self.index['seasons'].values())
+        self._team_count = sum(info['teams'][1] for info in self.index['seasons'].values())
+
+    def _upgrade_player_ids(self):
+        """Split version 1 name ids into careers, keyed by each record's team.
+
+        The rewritten records and index go to .upgrade files first and are
+        swapped in players first, index last, so an interrupted upgrade is
+        redone or finished on the next open.
+        """
+        index_upgrade = self.index_path + ".upgrade"
+        players_upgrade = self.players_path + ".upgrade"
+        if not os.path.exists(index_upgrade):
+            names = self.index['players']
+            self.index = dict(self.index, version=ARCHIVE_VERSION, players=[], player_records={})
+            self._player_ids = {}
+            rows = []
+            with open(self.players_path, 'a+b') as f:
+                for season, (start, count) in sorted((int(season), info['players'])
+                                                     for season, info in self.index['seasons'].items()):
+                    f.seek(start * PLAYER_RECORD.size)
+                    occurrences = {}
+                    for values in PLAYER_RECORD.iter_unpack(f.read(count * PLAYER_RECORD.size)):
+                        key = (self.index['teams'][values[1]], names[values[2]])
+                        occurrence = occurrences[key] = occurrences.get(key, -1) + 1
+                        player_id = self._career(key[0], key[1], occurrence, season)
+                        self.index['player_records'].setdefault(str(player_id), []).append(len(rows))
+                        rows.append(PLAYER_RECORD.pack(values[0], values[1], player_id, *values[3:]))
+            with open(players_upgrade, 'wb') as f:
+                f.write(b"".join(rows))
+                f.flush()
+                os.fsync(f.fileno())
+            self._write_index(index_upgrade)
+        if os.path.exists(players_upgrade):
+            os.replace(players_upgrade, self.players_path)
+        os.replace(index_upgrade, self.index_path)
+        with open(self.index_path, 'r') as f:
+            self.index = json.load(f)
+
+    def _write_index(self, path=None):
+        temp_path = self.index_path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.index, f, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path or self.index_path)
+
+    def _trim_unindexed(self):
+        for path, record, count in ((self.players_path, PLAYER_RECORD, self._player_count),
+                                    (self.teams_path, TEAM_RECORD, self._team_count)):
+            size = count * record.size
+            if not os.path.exists(path):
+                open(path, 'wb').close()
+            elif os.path.getsize(path) > size:
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def _remap(self):
+        # Views handed out earlier keep the old mapping alive until released
+        self.close()
+        self._player_map = _map_file(self.players_path)
+        self._team_map = _map_file(self.teams_path)
+
+def _map_file(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def _close_map(mapping):
+    if isinstance(mapping, mmap.mmap):
+        try:
+            mapping.close()
+        except BufferError:
+            pass  # Still exported to a NumPy view; closed when that is released
+
+def _stat(value):
+    return NULL_STAT if value is None else value
+
+def _value(value):
+    return None if value == NULL_STAT else value
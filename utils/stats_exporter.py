@@ -0,0 +1,175 @@
+import csv
+import struct
+from array import array
+from itertools import islice
+
+# Player stats exports. Rows are plain tuples streamed from a generator and
+# written a chunk at a time, so an export is never held in memory whole -
+# a multi-season history straight out of the league store writes at the
+# speed of the disk, not of Python object churn.
+#
+# Two output formats share one writer interface:
+#
+#   .csv   one header line, then csv.writer.writerows() per chunk
+#   .lxc   columnar binary: a header naming the columns, then chunks of
+#          "<I" row count followed by each column as one packed array.
+#          Integer columns are array('i') with NULL_INT for None. Text
+#          columns are dictionary-encoded per chunk, since names repeat on
+#          every row: "<I" entry count, array('I') byte lengths, the UTF-8
+#          bytes, then one array('I') entry index per row.
+
+COLUMNAR_EXTENSION = ".lxc"
+COLUMNAR_MAGIC = b"LXCS"
+COLUMNAR_VERSION = 1
+NULL_INT = -2 ** 31
+CHUNK_ROWS = 65536
+
+# (name, kind) - kind is 'text' or 'int'
+SEASON_COLUMNS = (
+    ('season', 'int'), ('phase', 'text'), ('player', 'text'), ('team', 'text'), ('position', 'text'),
+    ('games_played', 'int'), ('goals', 'int'), ('assists', 'int'), ('points', 'int'),
+    ('saves', 'int'), ('goals_against', 'int'), ('minutes_played', 'int'), ('player_of_match', 'int')
+)
+GAME_COLUMNS = (
+    ('season', 'int'), ('week', 'int'), ('phase', 'text'), ('home_team', 'text'), ('away_team', 'text'),
+    ('team', 'text'), ('player', 'text'), ('goals', 'int'), ('assists', 'int'),
+    ('saves', 'int'), ('goals_against', 'int')
+)
+
+_HEADER = struct.Struct("<4sHH")
+_COUNT = struct.Struct("<I")
+
+def player_team_index(teams):
+    """id(player) -> team name, built in one pass over the rosters"""
+    return {id(player): team.name for team in teams for player in team.players}
+
+def season_rows(teams, season=1, phases=('regular', 'playoff'), players=None):
+    """SEASON_COLUMNS rows for every player (or just `players`, in that order), one per phase"""
+    team_of = player_team_index(teams)
+    if players is None:
+        players = [player for team in teams for player in team.players]
+    for player in players:
+        team_name = team_of.get(id(player), "Unknown")
+        if 'regular' in phases:
+            yield (season, 'regular', player.name, team_name, player.position,
+                   player.games_played, player.goals, player.assists, player.goals + player.assists,
+                   player.saves, player.goals_against, player.minutes_played, player.player_of_match)
+        if 'playoff' in phases:
+            yield (season, 'playoff', player.name, team_name, player.position,
+                   player.playoff_games_played, player.playoff_goals, player.playoff_assists,
+                   player.playoff_goals + player.playoff_assists, player.playoff_saves,
+                   player.playoff_goals_against, player.playoff_minutes_played, None)
+
+def game_rows(game_results, season=1):
+    """GAME_COLUMNS rows from the box scores of GameResults (e.g. the season simulator's week_results)"""
+    for game in game_results:
+        phase = 'playoff' if game.is_playoff else 'regular'
+        for team_name, player_name, goals, assists, saves, goals_against in game.box_score or ():
+            yield (season, game.week, phase, game.home_team, game.away_team,
+                   team_name, player_name, goals, assists, saves, goals_against)
+
+class CsvStatsWriter:
+    def __init__(self, path, columns, append=False):
+        self.columns = columns
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow([name for name, kind in columns])
+
+    def write_chunk(self, rows):
+        self._writer.writerows(rows)
+
+    def close(self):
+        self._file.close()
+
+class ColumnarStatsWriter:
+    def __init__(self, path, columns, append=False):
+        self.columns = columns
+        self._file = open(path, 'ab' if append else 'wb')
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(COLUMNAR_MAGIC, COLUMNAR_VERSION, len(columns)))
+            for name, kind in columns:
+                encoded = name.encode('utf-8')
+                self._file.write(struct.pack("<B?", len(encoded), kind == 'text') + encoded)
+
+    def write_chunk(self, rows):
+        if not rows:
+            return
+        parts = [_COUNT.pack(len(rows))]
+        for (name, kind), values in zip(self.columns, zip(*rows)):
+            if kind == 'text':
+                entries = {}
+                indexes = array('I', [entries.setdefault(value, len(entries)) for value in values])
+                encoded = [value.encode('utf-8') if value is not None else b"" for value in entries]
+                parts.append(_COUNT.pack(len(encoded)))
+                parts.append(array('I', map(len, encoded)).tobytes())
+                parts.append(b"".join(encoded))
+                parts.append(indexes.tobytes())
+            else:
+                parts.append(array('i', [NULL_INT if value is None else value for value in values]).tobytes())
+        self._file.write(b"".join(parts))
+
+    def close(self):
+        self._file.close()
+
+def open_writer(path, columns, append=False):
+    """Pick the writer from the file extension (.lxc columnar, anything else CSV)"""
+    if path.endswith(COLUMNAR_EXTENSION):
+        return ColumnarStatsWriter(path, columns, append)
+    return CsvStatsWriter(path, columns, append)
+
+def export_rows(path, columns, rows, append=False, chunk_rows=CHUNK_ROWS):
+    """Stream `rows` into `path` a chunk at a time; returns the number of rows written"""
+    writer = open_writer(path, columns, append)
+    total = 0
+    try:
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                break
+            writer.write_chunk(chunk)
+            total += len(chunk)
+    finally:
+        writer.close()
+    return total
+
+def read_columnar(path):
+    """Yield each chunk of a .lxc file as {column name: list of values}"""
+    with open(path, 'rb') as f:
+        magic, version, column_count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != COLUMNAR_MAGIC:
+            raise ValueError(f"{path} is not a columnar stats export")
+        if version > COLUMNAR_VERSION:
+            raise ValueError(f"Columnar stats version {version} is newer than supported")
+        columns = []
+        for _ in range(column_count):
+            length, is_text = struct.unpack("<B?", f.read(2))
+            columns.append((f.read(length).decode('utf-8'), is_text))
+
+        while True:
+            count_bytes = f.read(_COUNT.size)
+            if len(count_bytes) < _COUNT.size:
+                return
+            (count,) = _COUNT.unpack(count_bytes)
+            chunk = {}
+            for name, is_text in columns:
+                if is_text:
+                    (entry_count,) = _COUNT.unpack(f.read(_COUNT.size))
+                    lengths = array('I')
+                    lengths.frombytes(f.read(entry_count * lengths.itemsize))
+                    blob = f.read(sum(lengths))
+                    entries = []
+                    offset = 0
+                    for length in lengths:
+                        entries.append(blob[offset:offset + length].decode('utf-8'))
+                        offset += length
+                    indexes = array('I')
+                    indexes.frombytes(f.read(count * indexes.itemsize))
+                    values = [entries[index] for index in indexes]
+                else:
+                    numbers = array('i')
+                    numbers.frombytes(f.read(count * numbers.itemsize))
+                    values = [None if value == NULL_INT else value for value in numbers]
+                chunk[name] = values
+            yield chunk
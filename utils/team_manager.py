@@ -1,6 +1,7 @@
 import random
 from models.player import Player
 from models.team import Team
+from models.stat_store import StatStore
 from lacrosse_names import roster_manager
 
 class TeamManager:
@@ -10,29 +11,30 @@ class TeamManager:
     def create_teams(self, team_names):
         """Create teams with players"""
         teams = []
+        stat_store = StatStore()  # One store for the whole league's player stats
         for name in team_names:
-            team = Team(name=name, players=self.create_players(name))
+            team = Team(name=name, players=self.create_players(name, stat_store))
             self._initialize_team_stats(team)
             teams.append(team)
         return teams
 
-    def create_players(self, team_name):
+    def create_players(self, team_name, stat_store=None):
         """Create players using realistic names from the roster manager"""
         players = []
         roster_data = roster_manager.get_team_roster(team_name)
 
         if not roster_data:
             print(f"Warning: No roster found for {team_name}, creating fallback roster")
-            return self._create_fallback_roster(team_name)
+            return self._create_fallback_roster(team_name, stat_store)
 
         for player_data in roster_data:
-            player = self._create_player_from_data(player_data)
+            player = self._create_player_from_data(player_data, stat_store)
             self._initialize_player_stats(player)
             players.append(player)
 
         return players
 
-    def _create_fallback_roster(self, team_name):
+    def _create_fallback_roster(self, team_name, stat_store=None):
         """Create fallback roster if no roster data found"""
         positions = ['Attack'] * 4 + ['Midfield'] * 4 + ['Defense'] * 4 + ['Goalie'] * 2
         players = []
@@ -45,20 +47,22 @@ class TeamManager:
                 passing=65 + (i * 3) % 25,
                 defense=50 + (i * 4) % 40,
                 stamina=60 + (i * 5) % 40,
+                stat_store=stat_store,
             )
             self._initialize_player_stats(player)
             players.append(player)
         return players
 
-    def _create_player_from_data(self, player_data):
+    def _create_player_from_data(self, player_data, stat_store=None):
         """Create player from roster data"""
         position = player_data['position']
         stat_ranges = self._get_position_stat_ranges(position)
 
-        shooting = random.randint(*stat_ranges["shooting"])
-        passing = random.randint(*stat_ranges["passing"])
-        defense = random.randint(*stat_ranges["defense"])
-        stamina = random.randint(*stat_ranges["stamina"])
+        rng = getattr(self.main_gui, 'rng', random)
+        shooting = rng.randint(*stat_ranges["shooting"])
+        passing = rng.randint(*stat_ranges["passing"])
+        defense = rng.randint(*stat_ranges["defense"])
+        stamina = rng.randint(*stat_ranges["stamina"])
 
         return Player(
             name=player_data['name'],
@@ -67,6 +71,7 @@ class TeamManager:
             passing=passing,
             defense=defense,
             stamina=stamina,
+            stat_store=stat_store,
         )
 
     def _get_position_stat_ranges(self, position):
@@ -81,12 +86,7 @@ class TeamManager:
 
     def _initialize_team_stats(self, team):
         """Initialize team stats"""
-        team.goals_for = 0
-        team.goals_against = 0
-        team.wins = 0
-        team.losses = 0
-        team.overtime_losses = 0
-        team.points = 0
+        team.record.reset()
 
     def _initialize_player_stats(self, player):
         """Initialize player statistics"""